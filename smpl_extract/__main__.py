@@ -5,6 +5,11 @@ import sys
 
 from smpl_extract.actions import ls_action
 from smpl_extract.actions import export_samples_to_wav
+from smpl_extract.actions import export_sample_pool_to_wav
+from smpl_extract.structural import LINK_MODE_HARDLINK
+from smpl_extract.structural import LINK_MODE_MAPPING
+from smpl_extract.structural import LINK_MODE_SYMLINK
+from smpl_extract.util.cache import DEFAULT_MAX_BLOCKS
 
 
 PACKAGE_NAME = "smpl_extract"
@@ -35,6 +40,26 @@ def construct_common_parser(
                 "directory."
         )
     )
+    arg_parser.add_argument(
+        "--mmap",
+        action="store_true",
+        help=(
+                "Memory-map the disc image instead of issuing "
+                "a read for every sector. Recommended for large "
+                "hard disk images."
+        )
+    )
+    arg_parser.add_argument(
+        "--cache-blocks",
+        type=int,
+        default=0,
+        help=(
+                "The number of 8 KiB blocks of the disc image "
+                "kept in memory while parsing. Sample data is read "
+                "through the same cache. Disabled (0) by default; "
+                f"{DEFAULT_MAX_BLOCKS} is a good size for hard disk images."
+        )
+    )
     return arg_parser
 
 
@@ -59,10 +84,24 @@ def ls_parse_args(argv):
         )
     )
 
+    arg_parser.add_argument(
+        "--full",
+        action="store_true",
+        help=(
+                "Parse the header of every file when listing a "
+                "directory instead of listing the directory table "
+                "alone. Files whose headers cannot be read are "
+                "left out of the listing."
+        )
+    )
+
     args_namespace = arg_parser.parse_args(argv)
     result = ls_action(
         args_namespace.image_file, 
-        args_namespace.internal_path
+        args_namespace.internal_path,
+        header_only=not args_namespace.full,
+        use_mmap=args_namespace.mmap,
+        cache_blocks=args_namespace.cache_blocks
     )
     return result
 
@@ -98,8 +137,51 @@ def export_parse_args(argv):
             "working directory."
         )
     )
+    arg_parser.add_argument(
+        "--flat",
+        action="store_true",
+        help=(
+            "Export every physical sample of a Roland S-7xx "
+            "image exactly once into a single flat directory "
+            "instead of once per performance. Ignored for "
+            "other image types."
+        )
+    )
+    arg_parser.add_argument(
+        "--links",
+        choices=(LINK_MODE_MAPPING, LINK_MODE_SYMLINK),
+        default=None,
+        help=(
+            "Only used with --flat. Either write a CSV file "
+            "mapping the performance hierarchy to the flat "
+            "samples (mapping) or recreate the hierarchy as "
+            "symbolic links to the flat samples (symlink)."
+        )
+    )
+    arg_parser.add_argument(
+        "--dedup",
+        choices=(LINK_MODE_HARDLINK, LINK_MODE_SYMLINK, LINK_MODE_MAPPING),
+        default=None,
+        help=(
+            "Write samples that share their source data and "
+            "parameters with an already exported sample only "
+            "once. Repeats become hard links (hardlink), "
+            "symbolic links (symlink) or entries of a CSV "
+            "file (mapping) instead of being transcoded again."
+        )
+    )
     args_namespace = arg_parser.parse_args(argv)
     
+    if args_namespace.flat:
+        result = export_sample_pool_to_wav(
+            args_namespace.image_file,
+            args_namespace.destination,
+            link_mode=args_namespace.links,
+            use_mmap=args_namespace.mmap,
+            cache_blocks=args_namespace.cache_blocks
+        )
+        return result
+
     export_func = export_formats.get(
         args_namespace.format,
         export_samples_to_wav
@@ -107,7 +189,10 @@ def export_parse_args(argv):
     
     result = export_func(
         args_namespace.image_file,
-        args_namespace.destination
+        args_namespace.destination,
+        dedup_mode=args_namespace.dedup,
+        use_mmap=args_namespace.mmap,
+        cache_blocks=args_namespace.cache_blocks
     )
     return result
 
@@ -5,6 +5,7 @@ import os
 from typing import Callable
 from typing import Dict 
 from typing import List
+from typing import Optional
 from typing import Union
 
 from smpl_extract.akai.image import AkaiImageParser
@@ -15,6 +16,7 @@ from smpl_extract.alcohol.mdx import MdxStream
 from smpl_extract.cdda.image import CompactDiskAudioImageAdapter
 from smpl_extract.cuesheet import BadCueSheet
 from smpl_extract.cuesheet import parse_cue_sheet
+from smpl_extract.roland.s7xx.image import RolandS7xxImage
 from smpl_extract.roland.s7xx.image import RolandSxxImageParser
 from smpl_extract.roland.s7xx.image import is_roland_s7xx_image
 from smpl_extract.structural import ErrorInvalidPath
@@ -22,6 +24,10 @@ from smpl_extract.structural import ExportManager
 from smpl_extract.structural import Image
 from smpl_extract.structural import T_ROUTINE
 from smpl_extract.structural import T_SAMPLE_ROUTINE
+from smpl_extract.util.cache import BlockCache
+from smpl_extract.util.cache import CachedStream
+from smpl_extract.util.stream import MappedStream
+from smpl_extract.util.stream import StreamWrapper
 
 
 class BadTextFile(Exception): pass
@@ -36,7 +42,26 @@ def parse_text_file(filename: str):
         return text
 
 
-def determine_image_type(file: Union[str, BufferedReader]):
+def wrap_root_stream(
+        file_stream: BufferedReader,
+        use_mmap: bool = False,
+        cache_blocks: int = 0
+):
+    if use_mmap:
+        result = MappedStream(file_stream)
+    elif cache_blocks > 0:
+        cache = BlockCache(max_blocks=cache_blocks)
+        result = CachedStream(file_stream, cache)
+    else:
+        result = file_stream
+    return result
+
+
+def determine_image_type(
+        file: Union[str, BufferedReader],
+        use_mmap: bool = False,
+        cache_blocks: int = 0
+):
     if isinstance(file, str):
         is_textfile = True
         lines = []
@@ -48,7 +73,12 @@ def determine_image_type(file: Union[str, BufferedReader]):
         if is_textfile:
             parent_directory = os.path.dirname(file)
             try: 
-                result = attempt_parse_cue_sheet(lines, parent_directory)
+                result = attempt_parse_cue_sheet(
+                    lines, 
+                    parent_directory, 
+                    use_mmap=use_mmap,
+                    cache_blocks=cache_blocks
+                )
                 return result
             except BadCueSheet:
                 pass
@@ -57,6 +87,9 @@ def determine_image_type(file: Union[str, BufferedReader]):
     else:
         file_stream = file
 
+    if not isinstance(file_stream, StreamWrapper):
+        file_stream = wrap_root_stream(file_stream, use_mmap, cache_blocks)
+
     if is_mdf_image(file_stream):
         file_stream = MdfStream(file_stream)
     elif is_mdx_image(file_stream):
@@ -69,7 +102,12 @@ def determine_image_type(file: Union[str, BufferedReader]):
     return result
 
 
-def attempt_parse_cue_sheet(lines: List[str], directory = ""):
+def attempt_parse_cue_sheet(
+        lines: List[str], 
+        directory = "", 
+        use_mmap: bool = False,
+        cache_blocks: int = 0
+):
     cue_sheet_file = parse_cue_sheet(lines)
     binary_track = next(
         (x for x in cue_sheet_file.tracks if x.mode.lower() != "audio"),
@@ -78,12 +116,21 @@ def attempt_parse_cue_sheet(lines: List[str], directory = ""):
     if binary_track:
         bin_file_path = os.path.join(directory, cue_sheet_file.bin_file_name)
         bin_file_stream = open(bin_file_path, "rb")
-        bin_image = determine_image_type(bin_file_stream)
+        bin_image = determine_image_type(
+            bin_file_stream, 
+            use_mmap=use_mmap,
+            cache_blocks=cache_blocks
+        )
         return bin_image
     
     if all((x.mode.lower() == "audio" for x in cue_sheet_file.tracks)):
         bin_file_path = os.path.join(directory, cue_sheet_file.bin_file_name)
         bin_file_stream = open(bin_file_path, "rb")
+        bin_file_stream = wrap_root_stream(
+            bin_file_stream, 
+            use_mmap, 
+            cache_blocks
+        )
         image = CompactDiskAudioImageAdapter.from_bin_cue(
             bin_file_stream,
             cue_sheet_file
@@ -95,9 +142,19 @@ def attempt_parse_cue_sheet(lines: List[str], directory = ""):
 
 def _wrap_filestream(func: Callable):
     @wraps(func)
-    def inner(file: Union[str, Image], *args, **kwargs):
+    def inner(
+            file: Union[str, Image], 
+            *args, 
+            use_mmap: bool = False, 
+            cache_blocks: int = 0,
+            **kwargs
+    ):
         if isinstance(file, str):
-            result = determine_image_type(file)
+            result = determine_image_type(
+                file, 
+                use_mmap=use_mmap, 
+                cache_blocks=cache_blocks
+            )
         else:
             result = file
         func(result, *args, **kwargs)
@@ -105,7 +162,7 @@ def _wrap_filestream(func: Callable):
 
 
 @_wrap_filestream
-def ls_action(image: Image, path: str):
+def ls_action(image: Image, path: str, header_only: bool = True):
 
     routines: Dict[str, T_ROUTINE] = {
         "make_safe_names": image.make_safe_names_routine,
@@ -113,20 +170,25 @@ def ls_action(image: Image, path: str):
     }
 
     image.set_routines(routines)
+    image.set_header_only(header_only)
 
     try:
         item = image.parse_path(path)
+        info = item.get_info()
     except ErrorInvalidPath as e:
         print(e)
         return
 
-    info = item.get_info()
     result_str = info.to_string()
     print(result_str)
 
 
 @_wrap_filestream
-def export_samples_to_wav(image: Image, base_dir: str):
+def export_samples_to_wav(
+        image: Image, 
+        base_dir: str, 
+        dedup_mode: Optional[str] = None
+):
 
     routines: Dict[str, T_ROUTINE] = {
         "make_safe_names": image.make_safe_names_routine,
@@ -137,7 +199,28 @@ def export_samples_to_wav(image: Image, base_dir: str):
     }
 
     image.set_routines(routines)
-    export_manager = ExportManager(base_dir, sample_routines)
+    export_manager = ExportManager(base_dir, sample_routines, dedup_mode)
     image.export_samples(export_manager)
+    export_manager.finish_export()
     return
 
+
+@_wrap_filestream
+def export_sample_pool_to_wav(
+        image: Image, 
+        base_dir: str, 
+        link_mode: Optional[str] = None
+):
+    if not isinstance(image, RolandS7xxImage):
+        export_samples_to_wav(image, base_dir)
+        return
+
+    routines: Dict[str, T_ROUTINE] = {
+        "make_safe_names": image.make_safe_names_routine,
+        "make_export_names": image.make_export_names_routine
+    }
+
+    image.set_routines(routines)
+    export_manager = ExportManager(base_dir)
+    image.export_sample_pool(export_manager, link_mode)
+    return
@@ -4,7 +4,10 @@ from construct.core import FixedSized
 from construct.core import GreedyBytes
 from construct.core import NullStripped
 from construct.core import Padded
+import numpy as np
 from typing import List
+from typing import Optional
+from typing import Tuple
 from typing import Union
 
 from .data_types import CHAR_MAP_A
@@ -55,16 +58,45 @@ def _char_format_convert_byte(
     return resulting_symbol
 
 
-def _char_format_convert(
-        bytes_in: Union[bytes, List[int]], 
+def _build_translation_table(
         src_fmt: CharFormat,
         dst_fmt: CharFormat
-)->List[int]:
+)->Tuple[bytes, bytes]:
+    table = bytearray(0x100)
+    valid_chars = bytearray()
+    for byte_in in range(0x100):
+        try:
+            table[byte_in] = _char_format_convert_byte(byte_in, src_fmt, dst_fmt)
+        except InvalidCharacter:
+            continue
+        valid_chars.append(byte_in)
+    result = (bytes(table), bytes(valid_chars))
+    return result
+
 
-    result = list(map(
-        lambda x: _char_format_convert_byte(x, src_fmt, dst_fmt), 
-        bytes_in
-    ))
+AKAI_TO_ASCII_TABLE, AKAI_VALID_CHARS = _build_translation_table(
+    CharFormat.AKAI, 
+    CharFormat.ASCII
+)
+ASCII_TO_AKAI_TABLE, ASCII_VALID_CHARS = _build_translation_table(
+    CharFormat.ASCII, 
+    CharFormat.AKAI
+)
+AKAI_TO_ASCII_ARRAY = np.frombuffer(AKAI_TO_ASCII_TABLE, np.dtype("uint8"))
+AKAI_VALID_ARRAY = np.zeros(0x100, dtype=np.dtype("bool"))
+AKAI_VALID_ARRAY[list(AKAI_VALID_CHARS)] = True
+
+
+def _translate(
+        bytes_in: Union[bytes, List[int]], 
+        table: bytes, 
+        valid_chars: bytes
+)->bytes:
+    bytes_in = bytes(bytes_in)
+    # anything left after deleting every valid character is invalid
+    if len(bytes_in.translate(None, valid_chars)) > 0:
+        raise InvalidCharacter
+    result = bytes_in.translate(table)
     return result
 
 
@@ -73,45 +105,33 @@ def char_ascii_to_akai(str_in: Union[str, bytes])->bytes:
         bytes_in = str_in.upper().encode("ascii")
     else:
         bytes_in = str_in
-    result = _char_format_convert( 
-        bytes_in, 
-        CharFormat.ASCII, 
-        CharFormat.AKAI
-    )
-    return bytes(result)
-
-
-def _fast_akai_to_ascii_byte(byte_in: int):
-    if CHAR_MAP_ZERO[CharFormat.AKAI] <= byte_in <= CHAR_MAP_NINE[CharFormat.AKAI]:
-        return byte_in + CHAR_MAP_ZERO[CharFormat.ASCII] - CHAR_MAP_ZERO[CharFormat.AKAI]
-
-    if CHAR_MAP_A[CharFormat.AKAI] <= byte_in <= CHAR_MAP_Z[CharFormat.AKAI]:
-        return byte_in + CHAR_MAP_A[CharFormat.ASCII] - CHAR_MAP_A[CharFormat.AKAI]
+    result = _translate(bytes_in, ASCII_TO_AKAI_TABLE, ASCII_VALID_CHARS)
+    return result
 
-    symbol_map = {
-        CHAR_MAP_SPACE[CharFormat.AKAI]:   CHAR_MAP_SPACE[CharFormat.ASCII],
-        CHAR_MAP_POUND[CharFormat.AKAI]:   CHAR_MAP_POUND[CharFormat.ASCII],
-        CHAR_MAP_PLUS[CharFormat.AKAI]:    CHAR_MAP_PLUS[CharFormat.ASCII],
-        CHAR_MAP_MINUS[CharFormat.AKAI]:   CHAR_MAP_MINUS[CharFormat.ASCII],
-        CHAR_MAP_PERIOD[CharFormat.AKAI]:  CHAR_MAP_PERIOD[CharFormat.ASCII],
-    }
-    resulting_symbol = symbol_map.get(byte_in)
-    
-    if resulting_symbol is None:
-        raise InvalidCharacter
 
-    return resulting_symbol
+def char_akai_to_ascii(bytes_in: Union[bytes, List[int]])->str:
+    result = _translate(
+        bytes_in, 
+        AKAI_TO_ASCII_TABLE, 
+        AKAI_VALID_CHARS
+    ).decode("ascii")
+    return result
 
 
-def _fast_akai_to_ascii(bytes_in: Union[bytes, List[int]]):
-    out_str = list()
-    for byte in bytes_in:
-        out_str.append(chr(_fast_akai_to_ascii_byte(byte)))
-    return "".join(out_str)
+def akai_name_array_is_valid(names: np.ndarray)->np.ndarray:
+    result = AKAI_VALID_ARRAY[names].all(axis=-1)
+    return result
 
 
-def char_akai_to_ascii(bytes_in: Union[bytes, List[int]])->str:
-    return _fast_akai_to_ascii(bytes_in)
+def akai_name_array_to_ascii(names: np.ndarray)->List[Optional[str]]:
+    valid = akai_name_array_is_valid(names).tolist()
+    translated = AKAI_TO_ASCII_ARRAY[names]
+    space = bytes([CHAR_MAP_SPACE[CharFormat.ASCII]])
+    result = [
+        row.tobytes().rstrip(space).decode("ascii") if is_valid else None
+        for row, is_valid in zip(translated, valid)
+    ]
+    return result
 
 
 class AkaiString(Adapter):
@@ -3,6 +3,8 @@ from construct.core import Subconstruct
 from construct.core import Switch
 from construct.expr import this
 
+from smpl_extract.base import ElementTypes
+from smpl_extract.util.fat import InvalidFatDefinition
 from smpl_extract.util.fat import RequestedInvalidSector
 
 from .data_types import FileType
@@ -24,6 +26,14 @@ FileConstruct = Switch(
 )
 
 
+FILE_ELEMENT_TYPES = {
+    FileType.SAMPLE_S1000:  ElementTypes.SampleEntry,
+    FileType.SAMPLE_S3000:  ElementTypes.SampleEntry,
+    FileType.PROGRAM_S1000: ElementTypes.ProgramEntry,
+    FileType.PROGRAM_S3000: ElementTypes.ProgramEntry
+}
+
+
 class FileAdapter(Subconstruct):
 
 
@@ -40,7 +50,11 @@ class FileAdapter(Subconstruct):
                 stream, 
                 **context
             )
-        except (RequestedInvalidSector, InvalidCharacter) as e:
+        except (
+                InvalidFatDefinition, 
+                RequestedInvalidSector, 
+                InvalidCharacter
+        ) as e:
             raise ConstructError from e
 
         return file
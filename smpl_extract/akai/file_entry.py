@@ -1,29 +1,29 @@
 from construct.core import Computed
 from construct.core import ConstructError
-from construct.core import Lazy
 from construct.core import Struct
 from construct.core import Padding
 from construct.core import Int8ul
 from construct.core import Int16ul
 from construct.core import Int24ul
-from construct.core import StreamError
 from construct.core import Subconstruct
 from construct.lib.containers import Container
 from construct.expr import this
 from dataclasses import dataclass
-from io import SEEK_CUR
+from functools import partial
 from io import SEEK_END
 from io import SEEK_SET
+import numpy as np
 from typing import Callable
 from typing import Iterable
 from typing import List
-from typing import Union
 
+from smpl_extract.util.fat import InvalidFatDefinition
 from smpl_extract.util.fat import RequestedInvalidSector
 from smpl_extract.util.stream import StreamWrapper
 from smpl_extract.util.constructs import EnumWrapper
 from smpl_extract.util.constructs import pull_child_info
 
+from .akai_string import akai_name_array_to_ascii
 from .akai_string import AkaiPaddedString
 from .data_types import FILE_TABLE_END_FLAG
 from .data_types import FileType
@@ -49,13 +49,18 @@ class FileEntry:
         self._f_file_content = f_file_content
 
 
-    @property 
-    def file(self):
+    def get_file(self):
         if not self._file:
             self._file = self._f_file_content()
         return self._file
 
 
+    @property 
+    def file(self):
+        result = self.get_file()
+        return result
+
+
 FileEntryConstruct = Struct(
     "name"      / AkaiPaddedString(12),
     Padding(4),
@@ -67,6 +72,15 @@ FileEntryConstruct = Struct(
         StreamWrapper(this._.sat.get_segment(this.start), this.size)
     )
 )
+FILE_ENTRY_DTYPE = np.dtype({
+    "names":    ["name", "end_flag", "file_type", "size", "start"],
+    "formats":  [(np.uint8, 12), "<u2", np.uint8, (np.uint8, 3), "<u2"],
+    "offsets":  [0, 8, 16, 17, 20],
+    "itemsize": 24
+})
+FILE_TYPE_VALUES = [x.value for x in FileType]
+
+
 @dataclass
 class FileEntryContainer(Container):
     name:           str
@@ -85,74 +99,101 @@ class FileEntriesAdapter(Subconstruct):
 
 
     def _parse(self, stream, context, path)->Iterable[FileEntry]:
-
-
-        def is_table_end(stream_inner):
-            original_address = stream_inner.tell()
-
-            stream_inner.seek(8, SEEK_CUR)
-            try:
-                end_flag = Int16ul.parse_stream(stream_inner)
-            except (StreamError):
-                return True
-
-            stream_inner.seek(original_address, SEEK_SET)
-
-            result = (end_flag == FILE_TABLE_END_FLAG)
-            return result
-
+        del path  # Unused
         
         child_info = pull_child_info(context)
         parent = child_info.parent
         sat = self.sat(context) if callable(self.sat) else self.sat
 
-        # read file entries containers
+        # read the whole file entry table at once
         stream.seek(0, SEEK_END)
         file_table_size = stream.tell()
         stream.seek(0, SEEK_SET)
 
-        table_entry_size = self.subcon.sizeof()
-        max_table_entry_cnt = file_table_size // table_entry_size
+        max_table_entry_cnt = file_table_size // FILE_ENTRY_DTYPE.itemsize
+        table = stream.read(max_table_entry_cnt * FILE_ENTRY_DTYPE.itemsize)
+        entries = np.frombuffer(
+            table, 
+            FILE_ENTRY_DTYPE, 
+            count=len(table) // FILE_ENTRY_DTYPE.itemsize
+        )
+
+        end_flags = np.flatnonzero(entries["end_flag"] == FILE_TABLE_END_FLAG)
+        if len(end_flags) > 0:
+            entries = entries[:end_flags[0]]
+
+        active = (entries["start"] > 0) \
+            & np.isin(entries["file_type"], FILE_TYPE_VALUES)
+        
+        entries = entries[active]
+        names = akai_name_array_to_ascii(entries["name"])
         
         file_entries: List[FileEntry] = []
-        for _i in range(max_table_entry_cnt):
-            if is_table_end(stream):
-                break
-            file_entry_container: Union[FileEntryContainer, None] = None
+        for entry, name in zip(entries, names):
+            if name is None:
+                continue
+
+            file_type = FileType(int(entry["file_type"]))
+            size = int.from_bytes(entry["size"].tobytes(), "little")
+            start = int(entry["start"])
+
+            # skip entries without a readable segment chain, as a full
+            # parse would, so that listings show the same entries
             try:
-                file_entry_container = self.subcon.parse_stream(stream, _=context, sat=sat)
-            except (ConstructError, RequestedInvalidSector):
-                pass
-
-            if file_entry_container is not None and file_entry_container.start > 0:
-                name = file_entry_container.name
-                file_content = Lazy(FileAdapter(
-                        this._.sat,
-                        FileConstruct
-                    )).parse_stream(
-                        file_entry_container.file_stream,  # type: ignore
-                        _=context,
-                        file_type=file_entry_container.file_type,
-                        _elem_name=name,
-                        _elem_parent=parent,
-                        _elem_routines=child_info.routines
-                    )
-
-                if file_content is None:
-                    raise ConstructError
-
-                file_entry = FileEntry(
-                    file_entry_container.name,
-                    file_entry_container.file_type,
-                    file_content
+                sat.get_extents(start)
+            except (InvalidFatDefinition, RequestedInvalidSector):
+                continue
+
+            file_entry = FileEntry(
+                name,
+                file_type,
+                partial(
+                    self._parse_file, 
+                    sat, 
+                    start, 
+                    size, 
+                    file_type, 
+                    name, 
+                    parent, 
+                    child_info.routines, 
+                    context
                 )
-
-                file_entries.append(file_entry)
+            )
+            file_entries.append(file_entry)
 
         result = file_entries
         return result
 
 
+    def _parse_file(
+            self, 
+            sat, 
+            start: int, 
+            size: int, 
+            file_type: FileType, 
+            name: str, 
+            parent, 
+            routines, 
+            context
+    ):
+        file_stream = StreamWrapper(sat.get_segment(start), size)
+        result = FileAdapter(
+                this._.sat,
+                FileConstruct
+            ).parse_stream(
+                file_stream,  # type: ignore
+                _=context,
+                file_type=file_type,
+                _elem_name=name,
+                _elem_parent=parent,
+                _elem_routines=routines
+            )
+
+        if result is None:
+            raise ConstructError
+        return result
+
+
     def _build(self, obj, stream, context, path):
         raise NotImplementedError
 
@@ -43,7 +43,8 @@ class AkaiImageParser(Image):
                     self.file,  # type: ignore
                     _elem_name=name,
                     _elem_parent=self,
-                    _elem_routines=self._routines
+                    _elem_routines=self._routines,
+                    _elem_header_only=self.header_only
                 )  
             except (InvalidPartition, ConstructError) as e:
                 break
@@ -28,12 +28,12 @@ from smpl_extract.util.stream import SubStreamConstruct
 from .data_types import AKAI_PARTITION_MAGIC
 from .data_types import AKAI_SAT_ENTRY_CNT
 from .data_types import AKAI_SECTOR_SIZE
-from .data_types import AKAI_VOLUME_ENTRY_CNT
 from .data_types import InvalidCharacter
 from .sat import SegmentAllocationTable
+from .sat import SAT_ENTRY_DTYPE
 from .sat import SegmentAllocationTableAdapter
 from .volume import Volume
-from .volume import VolumeEntryConstruct
+from .volume import VolumeEntryTableConstruct
 from .volume import VolumesAdapter
 
 
@@ -157,10 +157,10 @@ PartitionHeaderConstruct = Struct(
 PartitionParser = PartitionAdapter(
     Struct(
         "header" / PartitionHeaderConstruct,
-        "volume_entries" / VolumeEntryConstruct[AKAI_VOLUME_ENTRY_CNT],
+        "volume_entries" / VolumeEntryTableConstruct,
         "sat" / SegmentAllocationTableAdapter(
             this.header.partition_stream,
-            Int16ul[AKAI_SAT_ENTRY_CNT]  # type: ignore
+            Bytes(AKAI_SAT_ENTRY_CNT * SAT_ENTRY_DTYPE.itemsize)  # type: ignore
         ),  
         "volumes" / Lazy(VolumesAdapter(  
             this.volume_entries,
@@ -168,7 +168,7 @@ PartitionParser = PartitionAdapter(
             Lazy(Bytes(  # type: ignore
             lambda this: this.header.total_size \
                 - PartitionHeaderConstruct.sizeof() \
-                - VolumeEntryConstruct[AKAI_VOLUME_ENTRY_CNT].sizeof() \
+                - VolumeEntryTableConstruct.sizeof() \
                 - Int16ul[AKAI_SAT_ENTRY_CNT].sizeof()
             )),
         ))  
@@ -33,6 +33,7 @@ from smpl_extract.structural import SampleElement
 from smpl_extract.util.constructs import ChildInfo
 from smpl_extract.util.constructs import ElementAdapter
 from smpl_extract.util.constructs import EnumWrapper
+from smpl_extract.util.extent import flatten_stream
 from smpl_extract.util.stream import StreamOffset
 from smpl_extract.util.stream import SubStreamConstruct
 
@@ -112,7 +113,10 @@ class AkaiSample(SampleElement):
             num_interleaved_channels=1
         )
         data_streams = [
-            DataStream(stream=self._data_stream, encoding=stream_encoding)
+            DataStream(
+                stream=flatten_stream(self._data_stream), 
+                encoding=stream_encoding
+            )
         ]
         result = Sample(
             name=self.name,
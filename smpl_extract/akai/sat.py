@@ -1,11 +1,14 @@
 from construct.core import Adapter
 from io import IOBase
+import numpy as np
 from typing import List
+from typing import Tuple
+from typing import Union
 
 from smpl_extract.util.fat import add_to_sector_links
 from smpl_extract.util.fat import FileAllocationTable
 from smpl_extract.util.fat import FileStream
-from smpl_extract.util.fat import SectorLink
+from smpl_extract.util.fat import make_sector_links
 
 from .data_types import AKAI_SAT_EOF_FLAG
 from .data_types import AKAI_SAT_FREE_FLAG
@@ -14,6 +17,97 @@ from .data_types import AKAI_SAT_RESERVED_FLAG_V2
 from .data_types import AKAI_SECTOR_SIZE
 
 
+SAT_ENTRY_DTYPE = np.dtype("<u2")
+
+
+def _add_runs(runs: List[Tuple[int, int]], sector_links: np.ndarray):
+    links = np.concatenate([np.arange(start, stop) for start, stop in runs])
+    add_to_sector_links(links, sector_links)
+
+
+def decode_sat_links(block: np.ndarray)->np.ndarray:
+    size = len(block)
+    values = block.astype(np.dtype("int64"))
+    is_directory = np.isin(
+        values, 
+        (AKAI_SAT_RESERVED_FLAG_STD, AKAI_SAT_RESERVED_FLAG_V2)
+    )
+    is_straight = ~is_directory \
+        & (values != AKAI_SAT_EOF_FLAG) \
+        & (values == np.arange(1, size + 1))
+
+    # byte masks so that runs can be found with bytes.find
+    directory_mask = is_directory.astype(np.dtype("uint8")).tobytes()
+    straight_mask = is_straight.astype(np.dtype("uint8")).tobytes()
+    value_list = values.tolist()
+
+    # a free sector only ever ends the chain that reaches it, so it can be
+    # treated as already visited; the extra entry guards chains running
+    # off the end of the table
+    dirty = bytearray(
+        (values == AKAI_SAT_FREE_FLAG).astype(np.dtype("uint8")).tobytes()
+    )
+    dirty.append(0)
+    dirty_flags = np.frombuffer(dirty, np.dtype("uint8"))
+
+    sector_links = make_sector_links(size)
+
+    i = dirty.find(0, 0, size)
+    while i >= 0:
+        runs: List[Tuple[int, int]] = []
+        subpath_index = i
+        previous_sector_was_directory = False
+        while subpath_index < size:
+            if directory_mask[subpath_index]:
+                run_end = directory_mask.find(0, subpath_index)
+                if run_end < 0:
+                    run_end = size
+                dirty_flags[subpath_index:run_end] = 1
+                runs.append((subpath_index, run_end))
+                subpath_index = run_end
+                previous_sector_was_directory = True
+                continue
+
+            if previous_sector_was_directory and len(runs) > 0:
+                _add_runs(runs, sector_links)
+                break
+
+            if straight_mask[subpath_index]:
+                run_end = straight_mask.find(0, subpath_index)
+                if run_end < 0:
+                    run_end = size
+                # each sector of the run points at the following one
+                hit = dirty.find(1, subpath_index + 1, run_end + 1)
+                if hit >= 0:
+                    dirty_flags[subpath_index:hit] = 1
+                    break
+                dirty_flags[subpath_index:run_end] = 1
+                runs.append((subpath_index, run_end))
+                subpath_index = run_end
+                previous_sector_was_directory = False
+                continue
+
+            value_current = value_list[subpath_index]
+            if value_current == AKAI_SAT_FREE_FLAG or \
+                    (value_current < size and dirty[value_current]):
+                dirty[subpath_index] = 1
+                break
+            elif value_current == AKAI_SAT_EOF_FLAG:
+                runs.append((subpath_index, subpath_index + 1))
+                _add_runs(runs, sector_links)
+                dirty[subpath_index] = 1
+                break
+
+            dirty[subpath_index] = 1
+            runs.append((subpath_index, subpath_index + 1))
+            subpath_index = value_current
+            previous_sector_was_directory = False
+
+        i = dirty.find(0, i + 1, size)
+
+    return sector_links
+
+
 class Segment(FileStream):
     
 
@@ -56,7 +150,7 @@ class SegmentAllocationTableAdapter(Adapter):
 
     def _decode(
             self, 
-            obj: List[int], 
+            obj: Union[bytes, List[int]], 
             context, 
             path
     ) -> SegmentAllocationTable:
@@ -68,59 +162,10 @@ class SegmentAllocationTableAdapter(Adapter):
         else:
             partition_stream = self.partition_stream
 
+        if isinstance(block, (bytes, bytearray, memoryview)):
+            block = np.frombuffer(block, SAT_ENTRY_DTYPE)
         size = len(block)
-        sector_links = [SectorLink()] * size
-        dirty_flags = [False] * size
-
-        previous_sector_was_directory = True
-        for i in range(size):
-            if not dirty_flags[i]:
-
-                links = []
-                subpath_index = i
-                
-                continue_flag = True 
-                while continue_flag:
-                    if subpath_index >= size:
-                        continue_flag = False
-                        break
-
-                    value_current = block[subpath_index]
-                    current_sector_is_directory = value_current in (
-                            AKAI_SAT_RESERVED_FLAG_STD, 
-                            AKAI_SAT_RESERVED_FLAG_V2
-                    )
-
-                    if not current_sector_is_directory and previous_sector_was_directory and len(links) > 0:
-                        add_to_sector_links(links, sector_links)
-                        previous_sector_was_directory = False
-                        continue_flag = False
-                        break
-                    elif value_current == AKAI_SAT_FREE_FLAG or \
-                            (value_current < size and dirty_flags[value_current]):
-
-                        continue_flag = False
-                        dirty_flags[subpath_index] = True
-                        previous_sector_was_directory = False
-                        break 
-                    elif value_current == AKAI_SAT_EOF_FLAG:
-                        links.append(subpath_index)
-                        add_to_sector_links(links, sector_links)
-                        dirty_flags[subpath_index] = True
-                        previous_sector_was_directory = current_sector_is_directory
-                        continue_flag = False
-                        break
-                    
-                    dirty_flags[subpath_index] = True
-                    links.append(subpath_index)
-                    if not current_sector_is_directory:
-                        subpath_index = value_current
-                    else:
-                        subpath_index += 1
-                    previous_sector_was_directory = current_sector_is_directory
-                    
-            else:
-                pass
+        sector_links = decode_sat_links(np.asarray(block))
 
         result = SegmentAllocationTable(partition_stream, size, sector_links)
         return result
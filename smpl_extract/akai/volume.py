@@ -1,9 +1,12 @@
 from dataclasses import dataclass
+import numpy as np
 from typing import Any
 from typing import Dict
 from typing import Iterable
 from typing import List
 from typing import Optional
+from construct.core import Adapter
+from construct.core import Bytes
 from construct.core import Computed
 from construct.core import ConstructError
 from construct.core import Int16ul
@@ -12,14 +15,19 @@ from construct.lib.containers import Container
 from construct.expr import this
 
 from smpl_extract.base import Element
+from smpl_extract.structural import FileListing
 from smpl_extract.structural import T_ROUTINE
 from smpl_extract.structural import Traversable
 from smpl_extract.util.constructs import ChildInfo
 from smpl_extract.util.constructs import ElementAdapter
 from smpl_extract.util.constructs import EnumWrapper
+from smpl_extract.util.constructs import pull_from_context
 
+from .akai_string import akai_name_array_to_ascii
 from .akai_string import AkaiPaddedString
+from .data_types import AKAI_VOLUME_ENTRY_CNT
 from .data_types import VolumeType
+from .file import FILE_ELEMENT_TYPES
 from .file_entry import FileEntriesAdapter
 from .file_entry import FileEntryConstruct
 from .file_entry import InvalidFileEntry
@@ -36,7 +44,8 @@ class Volume(Traversable):
             parent: Optional[Element] = None,
             path: Optional[List[str]] = None,
             routines: Optional[Dict[str, T_ROUTINE]] = None,
-            file_entries: Optional[List[FileEntry]] = None
+            file_entries: Optional[List[FileEntry]] = None,
+            header_only: bool = False
     ) -> None:
         super().__init__(
             f_realize_children=lambda x: [],
@@ -50,6 +59,8 @@ class Volume(Traversable):
         self.file_entries = file_entries or []
         self._is_files_realized = False
         self._files = []
+        self.header_only = header_only
+        self._listing = None
 
 
     def _realize_files(self):
@@ -75,11 +86,40 @@ class Volume(Traversable):
         return self._files  # type: ignore
 
 
+    @property
+    def listing(self) -> List[FileListing]:
+        if self._listing is None:
+            listing = [
+                FileListing(
+                    x.name,
+                    str(x.file_type),
+                    FILE_ELEMENT_TYPES[x.file_type],
+                    x.get_file,
+                    self.path + [x.name],
+                    self
+                )
+                for x in self.file_entries 
+                if x.file_type in FILE_ELEMENT_TYPES
+            ]
+            for routine in self._routines.values():
+                listing = routine(listing)
+            self._listing = listing
+        return self._listing  # type: ignore
+
+
     @property
     def children(self):
+        if self.header_only:
+            return self.listing
         return self.files
 
 
+    @property
+    def export_children(self):
+        result = self.files
+        return result
+
+
 VolumeBodyConstruct = result = Struct(
     "file_entries" / FileEntriesAdapter(this._.sat, FileEntryConstruct),
 )
@@ -101,6 +141,57 @@ class VolumeEntryContainer(Container):
     start:  int
 
 
+VOLUME_ENTRY_DTYPE = np.dtype([
+    ("name",        np.uint8, 12),
+    ("type_raw",    "<u2"),
+    ("start",       "<u2")
+])
+
+
+class VolumeEntryTableAdapter(Adapter):
+
+
+    def _decode(self, obj, context, path)->List[VolumeEntryContainer]:
+        del context, path  # Unused
+        entries = np.frombuffer(obj, VOLUME_ENTRY_DTYPE)
+        volume_types = entries["type_raw"] & 0x03
+        is_active = volume_types != VolumeType.INACTIVE
+        entries = entries[is_active]
+        names = akai_name_array_to_ascii(entries["name"])
+        if None in names:
+            raise ConstructError("Invalid character in volume name.")
+
+        volume_entries = []
+        for entry, name, volume_type in zip(
+                entries, 
+                names, 
+                volume_types[is_active].tolist()
+        ):
+            try:
+                volume_type = VolumeType(volume_type)
+            except ValueError as e:
+                raise ConstructError from e
+
+            volume_entry = Container(
+                name=name,
+                type=volume_type,
+                start=int(entry["start"])
+            )
+            volume_entries.append(volume_entry)
+
+        result = volume_entries
+        return result
+
+
+    def _encode(self, obj, context, path):
+        raise NotImplementedError
+
+
+VolumeEntryTableConstruct = VolumeEntryTableAdapter(
+    Bytes(VOLUME_ENTRY_DTYPE.itemsize * AKAI_VOLUME_ENTRY_CNT)
+)
+
+
 class VolumesAdapter(ElementAdapter):
 
 
@@ -130,6 +221,7 @@ class VolumesAdapter(ElementAdapter):
         else:
             volume_entries = self.volume_entries 
         sat = self.sat(context) if callable(self.sat) else self.sat
+        header_only = pull_from_context(context, "_elem_header_only", False)
 
         parent = child_info.parent
         parent_path = child_info.parent_path
@@ -149,7 +241,8 @@ class VolumesAdapter(ElementAdapter):
                     volume_type=volume_type,
                     parent=parent,
                     path=volume_path,
-                    routines=child_info.routines
+                    routines=child_info.routines,
+                    header_only=header_only
                 )
 
                 volume_body = VolumeBodyConstruct.parse_stream(
@@ -7,11 +7,19 @@ from construct.core import Struct
 from io import IOBase
 from io import SEEK_END
 from io import SEEK_SET
+import numpy as np
+from typing import ClassVar
+from typing import Optional
+from typing import Union
 
 from smpl_extract.util.sector import SectorStream
+from smpl_extract.util.stream import pread
+from smpl_extract.util.stream import SectorReadError
 
 
 MDF_SECTOR_SIZE = 2352
+MDF_SUBCHANNEL_SECTOR_SIZE = 2448
+MDF_SECTOR_SIZES = (MDF_SECTOR_SIZE, MDF_SUBCHANNEL_SECTOR_SIZE)
 MDF_SECTOR_HEADER_MAGIC = (
     b"\x00"
     b"\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF"
@@ -20,6 +28,7 @@ MDF_SECTOR_HEADER_MAGIC = (
 MDF_SECTOR_HEADER_SIZE  = 16
 MDF_SECTOR_BODY_SIZE    = 2048
 MDF_SECTOR_FOOTER_SIZE  = 288
+MDF_MAX_SECTORS_PER_READ = 0x200
 
 
 MdfSectorHeaderConstruct = Struct(
@@ -51,23 +60,38 @@ def is_mdf_image(stream: IOBase)->bool:
     return result
 
 
+def get_mdf_sector_size(stream: IOBase)->int:
+    magic_size = len(MDF_SECTOR_HEADER_MAGIC)
+    for sector_size in MDF_SECTOR_SIZES:
+        magic = pread(stream, sector_size, magic_size)
+        if bytes(magic) == MDF_SECTOR_HEADER_MAGIC:
+            return sector_size
+    return MDF_SECTOR_SIZE
+
+
 class MdfStream(SectorStream):
+    flattenable: ClassVar[bool] = False
 
 
     def __init__(
             self,
             parent_stream:  IOBase,
             position:       int = 0,
-            buffer_length:  int = 0x1000
+            buffer_length:  int = 0x1000,
+            sector_size:    Optional[int] = None
     ) -> None:
 
+        if sector_size is None:
+            sector_size = get_mdf_sector_size(parent_stream)
+        self.raw_sector_length = sector_size
+
         # get parent size
         offset = parent_stream.tell()
         parent_stream.seek(0, SEEK_END)
         parent_size = parent_stream.tell()
         parent_stream.seek(offset, SEEK_SET)
 
-        num_sectors = parent_size // MDF_SECTOR_SIZE
+        num_sectors = parent_size // sector_size
         size = num_sectors * MDF_SECTOR_BODY_SIZE
 
         super().__init__(
@@ -84,8 +108,85 @@ class MdfStream(SectorStream):
             sector_index: int, 
             offset: int
         ):
-        sector_address  = sector_index * MDF_SECTOR_SIZE
+        sector_address  = sector_index * self.raw_sector_length
         
         mdf_address = sector_address + MDF_SECTOR_HEADER_SIZE + offset
         return mdf_address
 
+
+    def _copy_bodies(
+            self, 
+            raw: Union[bytes, memoryview], 
+            sector_offset: int, 
+            dest: np.ndarray
+    ):
+        num_sectors = len(raw) // self.raw_sector_length
+        bodies = np.frombuffer(
+            raw, 
+            np.dtype("uint8"), 
+            count=num_sectors * self.raw_sector_length
+        ).reshape((num_sectors, self.raw_sector_length))[
+            :, 
+            MDF_SECTOR_HEADER_SIZE:MDF_SECTOR_HEADER_SIZE + MDF_SECTOR_BODY_SIZE
+        ]
+
+        if sector_offset > 0:
+            head_size = min(MDF_SECTOR_BODY_SIZE - sector_offset, len(dest))
+            dest[:head_size] = bodies[0, sector_offset:sector_offset + head_size]
+            bodies = bodies[1:]
+            dest = dest[head_size:]
+
+        num_full = len(dest) // MDF_SECTOR_BODY_SIZE
+        full_size = num_full * MDF_SECTOR_BODY_SIZE
+        np.copyto(
+            dest[:full_size].reshape((num_full, MDF_SECTOR_BODY_SIZE)), 
+            bodies[:num_full]
+        )
+
+        tail_size = len(dest) - full_size
+        if tail_size > 0:
+            dest[full_size:] = bodies[num_full, :tail_size]
+
+
+    def _readinto_at(self, address: int, buffer: memoryview)->int:
+        if len(buffer) < MDF_SECTOR_BODY_SIZE:
+            return super()._readinto_at(address, buffer)
+
+        dest = np.frombuffer(buffer, np.dtype("uint8"))
+        result = 0
+        while result < len(buffer):
+            content_address = address + result
+            sector_index    = content_address // MDF_SECTOR_BODY_SIZE
+            sector_offset   = content_address % MDF_SECTOR_BODY_SIZE
+            chunk_size = min(
+                len(buffer) - result, 
+                MDF_MAX_SECTORS_PER_READ * MDF_SECTOR_BODY_SIZE - sector_offset
+            )
+            num_sectors = -(-(sector_offset + chunk_size) // MDF_SECTOR_BODY_SIZE)
+
+            raw_size = num_sectors * self.raw_sector_length
+            raw = pread(
+                self.substream, 
+                sector_index * self.raw_sector_length, 
+                raw_size
+            )
+            if len(raw) != raw_size:
+                raise SectorReadError(f"Wanted {raw_size}, read {len(raw)}.")
+
+            self._copy_bodies(
+                raw, 
+                sector_offset, 
+                dest[result:result + chunk_size]
+            )
+            result += chunk_size
+
+        return result
+
+
+    def _pread(self, address: int, size: int)->Union[bytes, memoryview]:
+        if size < MDF_SECTOR_BODY_SIZE:
+            return super()._pread(address, size)
+
+        result = memoryview(bytearray(size))
+        self._readinto_at(address, result)
+        return result
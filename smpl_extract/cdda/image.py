@@ -16,6 +16,7 @@ from smpl_extract.generalized.sample import ChannelConfig
 from smpl_extract.generalized.sample import Sample
 from smpl_extract.structural import Image
 from smpl_extract.structural import SampleElement
+from smpl_extract.util.extent import flatten_stream
 from smpl_extract.util.stream import StreamOffset
 
 
@@ -52,7 +53,10 @@ class AudioTrack(SampleElement):
             num_interleaved_channels=2
         )
         data_streams = [
-            DataStream(stream=self._data_stream, encoding=stream_encoding)
+            DataStream(
+                stream=flatten_stream(self._data_stream), 
+                encoding=stream_encoding
+            )
         ]
         result = Sample(
             name=self.name,
@@ -6,6 +6,7 @@ from construct.core import GreedyBytes
 from construct.core import GreedyRange
 from construct.core import Int16ul
 from construct.core import Int32ul
+from construct.core import Int64ul
 from construct.core import Lazy
 from construct.core import Prefixed
 from construct.core import Rebuild
@@ -17,6 +18,7 @@ from construct.expr import this
 from dataclasses import dataclass
 from dataclasses import field
 from enum import IntEnum
+import struct
 from typing import List
 
 from smpl_extract.util import bytes2int
@@ -123,11 +125,41 @@ class WavFormatChunkContainer(Container):
 WavDataChunkStruct = Lazy(GreedyRange(GreedyBytes))
 
 
+WavDs64TableStruct = Struct(
+    "chunk_id"      / Int32ul,
+    "chunk_size"    / Int64ul
+)
+@dataclass
+class WavDs64TableContainer(Container):
+    chunk_id:   int = 0
+    chunk_size: int = 0
+
+
+WavDs64ChunkStruct = Struct(
+    "riff_size"     / Int64ul,
+    "data_size"     / Int64ul,
+    "sample_cnt"    / Int64ul,
+    "table_cnt"     / Rebuild(
+        Int32ul,
+        len_(this.table)
+    ),
+    "table"         / WavDs64TableStruct[this.table_cnt]
+)
+@dataclass
+class WavDs64ChunkContainer(Container):
+    riff_size:  int                         = 0
+    data_size:  int                         = 0
+    sample_cnt: int                         = 0
+    table:      List[WavDs64TableContainer] = field(default_factory=list)
+
+
 WavRiffChunkType = EnumConstruct(
     Int32ul,
     FMT=bytes2int(b"fmt "),
     SMPL=bytes2int(b"smpl"),
     DATA=bytes2int(b"data"),
+    DS64=bytes2int(b"ds64"),
+    JUNK=bytes2int(b"JUNK")
 )
 WavRiffChunkStruct = Struct(
     "riff_id"   / WavRiffChunkType,
@@ -135,8 +167,10 @@ WavRiffChunkStruct = Struct(
         Switch(this.riff_id, {
             WavRiffChunkType.FMT:  WavFormatChunkStruct,
             WavRiffChunkType.SMPL: WavSampleChunkStruct,
-            WavRiffChunkType.DATA: WavDataChunkStruct
-        })
+            WavRiffChunkType.DATA: WavDataChunkStruct,
+            WavRiffChunkType.DS64: WavDs64ChunkStruct
+        },
+        default=GreedyBytes)
     )
 )
 
@@ -152,3 +186,15 @@ RiffStruct = Struct(
     "data"      / Prefixed(Int32ul, WavRiffBodyStruct),
 )
 
+
+RIFF_SIZE_LIMIT = 0xFFFFFFFF
+
+
+
+# precompiled layouts matching the constructs above, for writing headers
+# without a construct build per file
+RiffHeaderLayout = struct.Struct("<4sI4s")
+WavChunkHeaderLayout = struct.Struct("<4sI")
+WavFormatChunkLayout = struct.Struct("<4sIHHIIHH")
+WavSampleChunkLayout = struct.Struct("<4sI9I")
+WavLoopLayout = struct.Struct("<6I")
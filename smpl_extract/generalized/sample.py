@@ -1,8 +1,12 @@
 import copy
+from dataclasses import astuple
 from dataclasses import dataclass
 from dataclasses import field
 from dataclasses import fields
 import enum
+import hashlib
+from io import SEEK_SET
+from typing import Any
 from typing import ClassVar
 from typing import Dict
 from typing import List
@@ -14,6 +18,7 @@ from smpl_extract.base import ElementTypes
 from smpl_extract.data_streams import DataStream
 from smpl_extract.elements import LeafElement
 from smpl_extract.midi import MidiNote
+from smpl_extract.util.extent import get_stream_source
 
 
 class ChannelConfig(enum.IntEnum):
@@ -101,3 +106,46 @@ def sort_by_directory(
 
     return result
 
+
+def get_header_key(sample: Sample) -> Tuple[Any, ...]:
+    result = (
+        sample.channel_config,
+        sample.sample_rate,
+        sample.num_channels,
+        tuple(astuple(x) for x in sample.loop_regions),
+        sample.midi_note,
+        sample.pitch_offset_semi,
+        sample.pitch_offset_cents,
+        tuple(x.encoding for x in sample.data_streams)
+    )
+    return result
+
+
+def get_source_key(sample: Sample) -> Optional[Tuple[Any, ...]]:
+    sources = []
+    for data_stream in sample.data_streams:
+        source = get_stream_source(data_stream.stream)
+        if source is None:
+            return None
+        sources.append(source)
+
+    result = (get_header_key(sample), tuple(sources))
+    return result
+
+
+_CONTENT_HASH_BLOCK_SIZE = 0x100000
+def get_content_key(sample: Sample) -> Tuple[Any, ...]:
+    content_hash = hashlib.sha256()
+    for data_stream in sample.data_streams:
+        stream = data_stream.stream
+        position = stream.tell()
+        while True:
+            block = stream.read(_CONTENT_HASH_BLOCK_SIZE)
+            if not block:
+                break
+            content_hash.update(block)
+        stream.seek(position, SEEK_SET)
+        content_hash.update(b"\x00")
+
+    result = (get_header_key(sample), content_hash.hexdigest())
+    return result
@@ -1,21 +1,38 @@
 from construct import Adapter
 from construct import Container
+from construct import Int32ul
+from io import IOBase
+from io import SEEK_CUR
+from io import SEEK_SET
+from typing import List
+from typing import Optional
 from typing import  Tuple
 
 from smpl_extract.data_streams import Endianess
 from smpl_extract.data_streams import NoDataStream
 from smpl_extract.data_streams import StreamEncoding
+from smpl_extract.formats.wav import RIFF_SIZE_LIMIT
+from smpl_extract.formats.wav import RiffHeaderLayout
 from smpl_extract.formats.wav import RiffStruct
 from smpl_extract.formats.wav import SmpteFormat
+from smpl_extract.formats.wav import WavDs64ChunkContainer
+from smpl_extract.formats.wav import WavChunkHeaderLayout
 from smpl_extract.formats.wav import WavFormatChunkContainer
+from smpl_extract.formats.wav import WavFormatChunkLayout
 from smpl_extract.formats.wav import WavLoopContainer
+from smpl_extract.formats.wav import WavLoopLayout
 from smpl_extract.formats.wav import WavLoopType
+from smpl_extract.formats.wav import WavRiffChunkStruct
 from smpl_extract.formats.wav import WavRiffChunkType
 from smpl_extract.formats.wav import WavSampleChunkContainer
+from smpl_extract.formats.wav import WavSampleChunkLayout
 from smpl_extract.generalized.sample import LoopType
 from smpl_extract.generalized.sample import Sample
 from smpl_extract.midi import MidiNote
 from smpl_extract.transcoder import make_transcoder
+from smpl_extract.transcoder import PassthroughTranscoder
+from smpl_extract.transcoder import PipelineTranscoder
+from smpl_extract.util.stream import get_remaining_size
 
 
 def get_fmt_chunk_data(sample: Sample, encoding: StreamEncoding) -> WavFormatChunkContainer:
@@ -105,41 +122,116 @@ def get_smpl_chunk_data(sample: Sample) -> WavSampleChunkContainer:
     return smpl_header
 
 
-class WavSampleAdapter(Adapter):
-    
-    def _encode(self, obj: Sample, context, path) -> Container:
-        del context, path  # Unused
-        sample = obj
+def get_dest_encoding(sample: Sample) -> StreamEncoding:
+    if len(sample.data_streams) < 1:
+        raise NoDataStream("Sample has no data stream")
 
-        if len(sample.data_streams) < 1:
-            raise NoDataStream("Sample has no data stream")
+    result = StreamEncoding(
+        endianess=Endianess.LITTLE,  # WAV Specification
+        sample_width=sample.data_streams[0].encoding.sample_width,
+        num_interleaved_channels=sample.num_channels
+    )
+    return result
 
-        dest_encoding = StreamEncoding(
-            endianess=Endianess.LITTLE,  # WAV Specification
-            sample_width=sample.data_streams[0].encoding.sample_width,
-            num_interleaved_channels=sample.num_channels
-        )
 
-        riff_chunks = []
+def requires_smpl_chunk(sample: Sample) -> bool:
+    result = any((x is not None for x in (
+            sample.midi_note, 
+            sample.pitch_offset_cents, 
+            sample.pitch_offset_semi
+        ))) or len(sample.loop_regions) > 0
+    return result
 
-        # fmt chunk
-        riff_chunks.append(Container({
-            "riff_id":  WavRiffChunkType.FMT,
-            "data":     get_fmt_chunk_data(sample, dest_encoding)
+
+def get_header_chunks(
+        sample: Sample, 
+        dest_encoding: StreamEncoding
+) -> List[Container]:
+    result = []
+
+    # fmt chunk
+    result.append(Container({
+        "riff_id":  WavRiffChunkType.FMT,
+        "data":     get_fmt_chunk_data(sample, dest_encoding)
+    }))
+
+    # smpl chunk
+    if requires_smpl_chunk(sample):
+        result.append(Container({
+            "riff_id":  WavRiffChunkType.SMPL,
+            "data":     get_smpl_chunk_data(sample)
         }))
 
-        # smpl chunk
-        requires_smpl_chunk = any((x is not None for x in (
-                sample.midi_note, 
-                sample.pitch_offset_cents, 
-                sample.pitch_offset_semi
-            ))) or len(sample.loop_regions) > 0
-        
-        if requires_smpl_chunk:
-            riff_chunks.append(Container({
-                "riff_id":  WavRiffChunkType.SMPL,
-                "data":     get_smpl_chunk_data(sample)
-            }))
+    return result
+
+
+# the containers are dataclasses shadowing their values with the class
+# defaults, so fields are read by key as construct does
+def pack_fmt_chunk(fmt: WavFormatChunkContainer) -> bytes:
+    block_align = fmt["channel_cnt"]*fmt["bits_per_sample"]//8
+    result = WavFormatChunkLayout.pack(
+        b"fmt ",
+        WavFormatChunkLayout.size - WavChunkHeaderLayout.size,
+        fmt["audio_format"],
+        fmt["channel_cnt"],
+        fmt["sample_rate"],
+        fmt["sample_rate"]*block_align,
+        block_align,
+        fmt["bits_per_sample"]
+    )
+    return result
+
+
+def pack_smpl_chunk(smpl: WavSampleChunkContainer) -> bytes:
+    loops = b"".join(
+        WavLoopLayout.pack(
+            x["cue_id"],
+            x["loop_type"],
+            x["start_byte"],
+            x["end_byte"],
+            x["fraction"],
+            x["play_cnt"]
+        )
+        for x in smpl["sample_loops"]
+    )
+    sampler_data = bytes(smpl["sampler_data"])
+    chunk_size = sum((
+        WavSampleChunkLayout.size - WavChunkHeaderLayout.size,
+        len(loops),
+        len(sampler_data)
+    ))
+    header = WavSampleChunkLayout.pack(
+        b"smpl",
+        chunk_size,
+        smpl["manufacturer"],
+        smpl["product"],
+        smpl["sample_period"],
+        smpl["midi_note"].to_midi_byte(),
+        smpl["pitch_fraction"],
+        smpl["smpte_format"],
+        smpl["smpte_offset"],
+        len(smpl["sample_loops"]),
+        len(sampler_data)
+    )
+    result = header + loops + sampler_data
+    return result
+
+
+def pack_header_chunks(sample: Sample, dest_encoding: StreamEncoding) -> bytes:
+    result = pack_fmt_chunk(get_fmt_chunk_data(sample, dest_encoding))
+    if requires_smpl_chunk(sample):
+        result += pack_smpl_chunk(get_smpl_chunk_data(sample))
+    return result
+
+
+class WavSampleAdapter(Adapter):
+    
+    def _encode(self, obj: Sample, context, path) -> Container:
+        del context, path  # Unused
+        sample = obj
+
+        dest_encoding = get_dest_encoding(sample)
+        riff_chunks = get_header_chunks(sample, dest_encoding)
 
         # data chunk
         data_generator = make_transcoder(sample.data_streams, dest_encoding)
@@ -163,8 +255,142 @@ class WavSampleAdapter(Adapter):
 WavSampleBuilder = WavSampleAdapter(RiffStruct)
 
 
+RIFF_SIZE_OFFSET = 4
+RF64_SIZE_PLACEHOLDER = 0xFFFFFFFF
+
+
+class WavSizeOverflow(Exception): ...
+
+
+def get_block_align(encoding: StreamEncoding) -> int:
+    result = encoding.sample_width*encoding.num_interleaved_channels
+    return result
+
+
+def get_expected_data_size(
+        sample: Sample, 
+        dest_encoding: StreamEncoding
+) -> Optional[int]:
+    block_align = get_block_align(dest_encoding)
+
+    stream_num_frames = []
+    for data_stream in sample.data_streams:
+        stream_size = get_remaining_size(data_stream.stream)
+        if stream_size is None:
+            break
+        encoding = data_stream.encoding
+        frame_size = \
+            encoding.sample_width*max(1, encoding.num_interleaved_channels)
+        stream_num_frames.append(-(-stream_size // frame_size))
+    else:
+        result = max(stream_num_frames)*block_align
+        return result
+
+    if sample.num_audio_samples is not None:
+        result = sample.num_audio_samples*block_align
+        return result
+
+    result = None
+    return result
+
+
+def build_ds64_chunk(riff_size: int, data_size: int, sample_cnt: int) -> bytes:
+    result = WavRiffChunkStruct.build(Container({
+        "riff_id":  WavRiffChunkType.DS64,
+        "data":     WavDs64ChunkContainer(
+            riff_size=riff_size,
+            data_size=data_size,
+            sample_cnt=sample_cnt
+        )
+    }))
+    return result
+
+
+def build_junk_chunk(chunk_size: int) -> bytes:
+    result = WavRiffChunkStruct.build(Container({
+        "riff_id":  WavRiffChunkType.JUNK,
+        "data":     bytes(chunk_size - 8)
+    }))
+    return result
+
+
+def write_wav(sample: Sample, export_stream: IOBase):
+    dest_encoding = get_dest_encoding(sample)
+    header_chunks = pack_header_chunks(sample, dest_encoding)
+
+    # switch to RF64 up front when the sizes will not fit in 32 bits,
+    # reserve room for a ds64 chunk when the size can not be known
+    expected_data_size = get_expected_data_size(sample, dest_encoding)
+    ds64_chunk = build_ds64_chunk(0, 0, 0)
+    size_chunk = b""
+    fourcc = b"RIFF"
+    if expected_data_size is None:
+        size_chunk = build_junk_chunk(len(ds64_chunk))
+    else:
+        expected_riff_size = sum((
+            len(b"WAVE"),
+            len(ds64_chunk),
+            len(header_chunks),
+            len(b"data"),
+            Int32ul.sizeof(),
+            expected_data_size
+        ))
+        if expected_riff_size > RIFF_SIZE_LIMIT:
+            size_chunk = ds64_chunk
+            fourcc = b"RF64"
+
+    # sizes are unknown until the transcoder is exhausted
+    riff_start = export_stream.tell()
+    export_stream.write(b"".join((
+        RiffHeaderLayout.pack(fourcc, 0, b"WAVE"),
+        size_chunk,
+        header_chunks,
+        WavChunkHeaderLayout.pack(b"data", 0)
+    )))
+    data_start = export_stream.tell()
+
+    transcoder = make_transcoder(sample.data_streams, dest_encoding)
+    data_size = None
+    if isinstance(transcoder, PassthroughTranscoder):
+        data_size = transcoder.copy_to(export_stream)
+    elif isinstance(transcoder, PipelineTranscoder):
+        data_size = transcoder.write_to(export_stream)
+    if data_size is None:
+        data_size = 0
+        for block in transcoder:
+            export_stream.write(block)
+            data_size += len(block)
+    riff_end = export_stream.tell()
+
+    riff_size = riff_end - riff_start - RIFF_SIZE_OFFSET - Int32ul.sizeof()
+    is_rf64 = riff_size > RIFF_SIZE_LIMIT or fourcc == b"RF64"
+    if is_rf64:
+        if not size_chunk:
+            raise WavSizeOverflow(
+                f"RIFF size {riff_size} exceeds the 32-bit limit"
+            )
+        block_align = get_block_align(dest_encoding)
+        export_stream.seek(riff_start, SEEK_SET)
+        export_stream.write(b"RF64")
+        export_stream.write(Int32ul.build(RF64_SIZE_PLACEHOLDER))
+        export_stream.seek(len(b"WAVE"), SEEK_CUR)
+        export_stream.write(build_ds64_chunk(
+            riff_size,
+            data_size,
+            data_size // block_align
+        ))
+        riff_size = RF64_SIZE_PLACEHOLDER
+        data_size = RF64_SIZE_PLACEHOLDER
+
+    export_stream.seek(riff_start + RIFF_SIZE_OFFSET, SEEK_SET)
+    export_stream.write(Int32ul.build(riff_size))
+    export_stream.seek(data_start - Int32ul.sizeof(), SEEK_SET)
+    export_stream.write(Int32ul.build(data_size))
+    export_stream.seek(riff_end, SEEK_SET)
+    return
+
+
 def export_wav(sample: Sample, file_path: str):
     with open(file_path, "wb") as export_stream:
-        WavSampleBuilder.build_stream(sample, export_stream)
+        write_wav(sample, export_stream)
     return
-
@@ -1,16 +1,25 @@
 from dataclasses import dataclass
+from typing import Any
 from typing import cast
 from typing import Dict
+from typing import Tuple
 from construct.core import Adapter
+from construct.core import Bytes
 from construct.core import Computed
 from construct.core import Construct
+from construct.core import ConstructError
+from construct.core import evaluate
 from construct.core import FixedSized
 from construct.core import PaddedString
 from construct.core import Int16ul
 from construct.core import Int32ul
 from construct.core import Int8ul
+from construct.core import Pointer
 from construct.core import Struct
+import numpy as np
 
+from smpl_extract.util.constructs import find_in_context
+from smpl_extract.util.constructs import find_or_parse_in_context
 from smpl_extract.util.constructs import MappingDefault
 from smpl_extract.util.constructs import SafeListConstruct
 from smpl_extract.util.constructs import UnsizedConstruct
@@ -25,6 +34,13 @@ from .data_types import MAX_NUM_SAMPLE
 from .data_types import SAMPLE_DIRECTORY_AREA_SIZE
 from .data_types import MAX_NUM_VOLUME
 from .data_types import VOLUME_DIRECTORY_AREA_SIZE
+from .data_types import PARTIAL_DIRECTORY_AREA_OFFSET
+from .data_types import PATCH_DIRECTORY_AREA_OFFSET
+from .data_types import PERFORMANCE_DIRECTORY_AREA_OFFSET
+from .data_types import SAMPLE_DIRECTORY_AREA_OFFSET
+from .data_types import TOTAL_DIRECTORY_AREA_OFFSET
+from .data_types import TOTAL_DIRECTORY_AREA_SIZE
+from .data_types import VOLUME_DIRECTORY_AREA_OFFSET
 from .data_types import RolandFileType
 
 
@@ -140,3 +156,157 @@ class DirectoryAreaContainer:
     partial_directories:        Dict[int, DirectoryEntryContainer]
     sample_directories:         Dict[int, DirectoryEntryContainer]
 
+
+
+DIRECTORY_ENTRY_SIZE = 0x20
+DIRECTORY_ENTRY_DTYPE = np.dtype({
+    "names": [
+        "name", 
+        "file_type", 
+        "file_attributes", 
+        "forward_link_ptr", 
+        "backward_link_ptr", 
+        "link_id", 
+        "reserved", 
+        "fat_entry", 
+        "num_clusters"
+    ],
+    "formats": [
+        (np.uint8, 16), 
+        np.uint8, 
+        np.uint8, 
+        "<u2", 
+        "<u2", 
+        "<u2", 
+        "<u4", 
+        "<u2", 
+        "<u2"
+    ],
+    "offsets":  [0, 16, 17, 18, 20, 22, 24, 28, 30],
+    "itemsize": DIRECTORY_ENTRY_SIZE
+})
+DIRECTORY_LAYOUT: Dict[RolandFileType, Tuple[int, int]] = {
+    RolandFileType.VOLUME:      (VOLUME_DIRECTORY_AREA_OFFSET, MAX_NUM_VOLUME),
+    RolandFileType.PERFORMANCE: (PERFORMANCE_DIRECTORY_AREA_OFFSET, MAX_NUM_PERFORMANCE),
+    RolandFileType.PATCH:       (PATCH_DIRECTORY_AREA_OFFSET, MAX_NUM_PATCH),
+    RolandFileType.PARTIAL:     (PARTIAL_DIRECTORY_AREA_OFFSET, MAX_NUM_PARTIAL),
+    RolandFileType.SAMPLE:      (SAMPLE_DIRECTORY_AREA_OFFSET, MAX_NUM_SAMPLE)
+}
+FILE_TYPE_TABLE = [RolandFileType.NONE] * 0x100
+for _file_type in RolandFileType:
+    FILE_TYPE_TABLE[_file_type.value] = _file_type
+
+
+class DirectoryArea:
+
+
+    def __init__(self, data: bytes, version: int = 1) -> None:
+        self.version = version
+        self.entries: Dict[RolandFileType, np.ndarray] = {}
+        self.valid: Dict[RolandFileType, np.ndarray] = {}
+        for file_type, (area_offset, num_entries) in DIRECTORY_LAYOUT.items():
+            entries = np.frombuffer(
+                data,
+                DIRECTORY_ENTRY_DTYPE,
+                num_entries,
+                area_offset - TOTAL_DIRECTORY_AREA_OFFSET
+            )
+            self.entries[file_type] = entries
+            self.valid[file_type] = np.all(entries["name"] < 0x80, axis=1)
+
+
+    def get_indices(self, file_type: RolandFileType) -> np.ndarray:
+        entries = self.entries[file_type]
+        mask = self.valid[file_type] & (entries["file_type"] == file_type)
+        result = np.flatnonzero(mask)
+        return result
+
+
+    def get_entry(
+            self, 
+            file_type: RolandFileType, 
+            index: int
+    ) -> DirectoryEntryContainer:
+        entries = self.entries[file_type]
+        if not 0 <= index < len(entries):
+            raise ConstructError(
+                f"{file_type} directory index {index} is out of range."
+            )
+        if not self.valid[file_type][index]:
+            raise ConstructError(
+                f"{file_type} directory entry {index} has an invalid name."
+            )
+
+        entry = entries[index]
+        forward_link_ptr = int(entry["forward_link_ptr"])
+        backward_link_ptr = int(entry["backward_link_ptr"])
+        if self.version == 2:
+            backward_link_ptr -= 0x8000
+            forward_link_ptr -= 0x8000
+
+        result = DirectoryEntryContainer(
+            name=entry["name"].tobytes().rstrip(b"\x00").decode("ascii"),
+            index=index,
+            file_type=FILE_TYPE_TABLE[entry["file_type"]],
+            file_attributes=int(entry["file_attributes"]),
+            forward_link_ptr=forward_link_ptr,
+            backward_link_ptr=backward_link_ptr,
+            link_id=int(entry["link_id"]),
+            reserved=int(entry["reserved"]),
+            fat_entry=int(entry["fat_entry"]),
+            num_clusters=int(entry["num_clusters"])
+        )
+        return result
+
+
+class DirectoryAreaAdapter(Adapter):
+
+
+    def _decode(self, obj, context, path) -> DirectoryArea:
+        del path  # unused
+        version = find_in_context(context, "_dir_version", 1)
+        result = DirectoryArea(obj, version)
+        return result
+
+
+    def _encode(self, obj, context, path):
+        raise NotImplementedError
+
+
+DirectoryAreaParser = DirectoryAreaAdapter(Bytes(TOTAL_DIRECTORY_AREA_SIZE))
+
+
+def get_directory_area(stream, context: Dict[str, Any], path) -> DirectoryArea:
+    result = find_or_parse_in_context(
+        "directory_area",
+        Pointer(TOTAL_DIRECTORY_AREA_OFFSET, DirectoryAreaParser),
+        stream,
+        context,
+        path
+    )
+    return result
+
+
+class DirectoryEntryLookup(Construct):
+
+
+    def __init__(self, file_type: RolandFileType, index_expr) -> None:
+        super().__init__()
+        self.file_type = file_type
+        self.index_expr = index_expr
+        self.flagbuildnone = True
+
+
+    def _parse(self, stream, context, path) -> DirectoryEntryContainer:
+        index = evaluate(self.index_expr, context)
+        directory_area = get_directory_area(stream, context, path)
+        result = directory_area.get_entry(self.file_type, index)
+        return result
+
+
+    def _build(self, obj, stream, context, path):
+        raise NotImplementedError
+
+
+    def _sizeof(self, context, path):
+        return 0
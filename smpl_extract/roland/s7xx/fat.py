@@ -1,17 +1,21 @@
 from dataclasses import dataclass
 from io import IOBase
+from typing import Dict
 from typing import List, cast
+from typing import Optional
+from typing import Tuple
 from construct.core import Adapter
+from construct.core import Bytes
 from construct.core import ConstructError
 from construct.core import Int16ul
 from construct.core import Padding
 from construct.core import Struct
 from construct.core import Union
+import numpy as np
 
 from smpl_extract.util.fat import FileAllocationTable
 from smpl_extract.util.fat import FileStream
-from smpl_extract.util.fat import SectorLink
-from smpl_extract.util.fat import add_to_sector_links
+from smpl_extract.util.fat import make_sector_links
 from smpl_extract.util.stream import StreamOffset
 from smpl_extract.util.stream import StreamSizeConstruct
 from smpl_extract.util.stream import StreamWrapper
@@ -19,9 +23,10 @@ from smpl_extract.util.stream import SubStreamConstruct
 
 from .data_types import FAT_AREA_ID
 from .data_types import DATA_FAT_OFFSET
+from .data_types import FAT_END
+from .data_types import FAT_ENTRY_SIZE
 from .data_types import FAT_ERROR_FLAG
 from .data_types import FAT_FREE_FLAG
-from .data_types import FAT_IS_END_F
 from .data_types import FAT_NUM_ENTRIES
 from .data_types import FAT_RESERVED_FLAG
 from .data_types import FAT_VERSION_1_FLAG
@@ -31,7 +36,7 @@ from .data_types import ROLAND_CLUSTER_SIZE
 
 FatAreaStruct = Union(
     0,
-    "fat_entries" / Int16ul[FAT_NUM_ENTRIES],
+    "fat_entries" / Bytes(FAT_ENTRY_SIZE * FAT_NUM_ENTRIES),
     "metadata" / Struct(
         "fat_id" / Int16ul,
         "num_unused_clusters" / Int16ul,
@@ -46,6 +51,12 @@ FatAreaStruct = Union(
         offset=DATA_FAT_OFFSET
     ),
 )
+FAT_ENTRY_DTYPE = np.dtype("<u2")
+
+# the last entries are only ever visited through a chain
+FAT_NUM_CHAIN_STARTS = FAT_NUM_ENTRIES - 9
+
+
 @dataclass
 class FatAreaMetadataContainer:
     fat_id: int
@@ -54,12 +65,51 @@ class FatAreaMetadataContainer:
     version_flag_2: int
 @dataclass
 class FatAreaContainer:
-    fat_entries: List[int]
+    fat_entries: bytes
     metadata: FatAreaMetadataContainer
     stream_size: int
     fat_data_stream: StreamWrapper
 
 
+def decode_fat_links(fat_entries: np.ndarray)->np.ndarray:
+    fat_entries = fat_entries.astype(np.dtype("int32"))
+    is_pointer = (fat_entries < FAT_END) & np.isin(
+        fat_entries, 
+        (FAT_FREE_FLAG, FAT_RESERVED_FLAG, FAT_ERROR_FLAG), 
+        invert=True
+    )
+
+    # every entry below FAT_NUM_CHAIN_STARTS starts or continues a chain,
+    # the remaining entries are visited only when a chain points at them
+    visited = np.zeros(len(fat_entries), dtype=np.dtype("bool"))
+    visited[2:FAT_NUM_CHAIN_STARTS] = True
+    while True:
+        targets = fat_entries[visited & is_pointer]
+        targets = targets[~visited[targets]]
+        if len(targets) < 1:
+            break
+        visited[targets] = True
+
+    if np.any(visited & (fat_entries == FAT_ERROR_FLAG)):
+        raise ConstructError("Encountered ERROR_FLAG in FAT.")
+
+    pointers = np.flatnonzero(visited & is_pointer)
+    target_values = fat_entries[fat_entries[pointers]]
+    unexpected = np.flatnonzero(
+        np.isin(target_values, (FAT_FREE_FLAG, FAT_RESERVED_FLAG))
+    )
+    if len(unexpected) > 0:
+        if target_values[unexpected[0]] == FAT_RESERVED_FLAG:
+            err_type = "RESERVE_FLAG"  
+        else:
+            err_type = "FREE_FLAG"
+        raise ConstructError(f"Unexpected {err_type} in FAT.")
+
+    result = make_sector_links(len(fat_entries))
+    result[pointers] = fat_entries[pointers]
+    return result
+
+
 class RolandFile(FileStream):
 
 
@@ -80,10 +130,26 @@ class RolandFile(FileStream):
 
 
 class RolandFileAllocationTable(FileAllocationTable):
+
+
+    def __init__(
+            self,
+            parent_stream: IOBase,
+            size: int = 0,
+            sector_links: Optional[np.ndarray] = None
+    ) -> None:
+        super().__init__(parent_stream, size, sector_links)
+        self.file_sector_lists: Dict[Tuple[int, int], List[int]] = {}
+
+
     def get_file(self, index: int, cluster_offset: int = 0) -> RolandFile:
-        sector_list = self.get_path(index)
-        if cluster_offset > 0:
-            sector_list = sector_list[cluster_offset:]
+        key = (index, cluster_offset)
+        if key not in self.file_sector_lists.keys():
+            sector_list = self.get_path(index)
+            if cluster_offset > 0:
+                sector_list = sector_list[cluster_offset:]
+            self.file_sector_lists[key] = sector_list
+        sector_list = self.file_sector_lists[key]
         result = RolandFile(
             self.parent_stream,
             sector_list
@@ -132,46 +198,8 @@ class FatAreaAdapter(Adapter):
                 version = version_map[version_flag]
                 break
 
-        fat_entries = container.fat_entries
-
-        sector_links = [SectorLink()] * FAT_NUM_ENTRIES
-        dirty_flags = [False] * FAT_NUM_ENTRIES
-        dirty_flags[0:2] = [True, True]
-        for i in range(2, FAT_NUM_ENTRIES - 9):
-
-            if dirty_flags[i]:
-                continue
-
-            subpath_links = []
-            subpath_index = i
-            while True:
-                if subpath_index >= FAT_NUM_ENTRIES:
-                    break
-                
-                value = fat_entries[subpath_index]
-                dirty_flags[subpath_index] = True
-
-                if value == FAT_ERROR_FLAG:
-                    raise ConstructError("Encountered ERROR_FLAG in FAT.")
-                    
-                if value in (FAT_RESERVED_FLAG, FAT_FREE_FLAG):
-                    if len(subpath_links) > 0:
-                        if value == FAT_RESERVED_FLAG:
-                            err_type = "RESERVE_FLAG"  
-                        else:
-                            err_type = "FREE_FLAG"
-                        raise ConstructError(f"Unexpected {err_type} in FAT.")
-                    else:
-                        break
-
-                subpath_links.append(subpath_index)
-
-                if FAT_IS_END_F(value):
-                    add_to_sector_links(subpath_links, sector_links)
-                    break
-
-                subpath_index = value
-                continue
+        fat_entries = np.frombuffer(container.fat_entries, FAT_ENTRY_DTYPE)
+        sector_links = decode_fat_links(fat_entries)
 
         fat = RolandFileAllocationTable(
             container.fat_data_stream, 
@@ -3,10 +3,12 @@ from construct.core import Adapter
 from construct.core import Computed
 from construct.core import ConstructError
 from construct.core import FixedSized
+from construct.core import Lazy
 from construct.core import Int16ul
 from construct.core import Int32ul
 from construct.core import PaddedString
 from construct.core import Padding
+from construct.core import Pointer
 from construct.core import Seek
 from construct.core import Struct
 from io import SEEK_SET
@@ -18,10 +20,14 @@ from typing import ClassVar
 from typing import Dict
 from typing import List
 from typing import Match
+from typing import Optional
+from typing import Tuple
 from typing import cast
 
 from smpl_extract.base import Element
 from smpl_extract.base import ElementTypes
+from smpl_extract.structural import ExportManager
+from smpl_extract.structural import FileListing
 from smpl_extract.structural import Image
 from smpl_extract.structural import T_ROUTINE
 from smpl_extract.util.constructs import ChildInfo
@@ -29,9 +35,17 @@ from smpl_extract.util.constructs import ElementAdapter
 
 from .data_types import FAT_AREA_OFFSET
 from .data_types import ID_AREA_SIZE
+from .data_types import RolandFileType
+from .data_types import TOTAL_DIRECTORY_AREA_OFFSET
+from .directory_area import DirectoryArea
+from .directory_area import DirectoryAreaParser
 from .fat import FatArea
 from .fat import FatAreaParser
 from .fat import RolandFileAllocationTable
+from .performance_entry import PerformanceEntry
+from .sample_pool import SAMPLE_POOL_NAME
+from .sample_pool import SamplePool
+from .sample_pool import SamplePoolConstruct
 from .volume_entry import VolumeEntry
 from .volume_entry import VolumeEntriesList
 
@@ -165,6 +179,14 @@ RolandS7xxImageStruct = Struct(
     "fat_area" / FatAreaParser,
     "fat" / Computed(lambda this: this.fat_area.fat),
     "_dir_version" / Computed(lambda this: this.fat_area.version),
+    "directory_area" / Pointer(
+        TOTAL_DIRECTORY_AREA_OFFSET, 
+        DirectoryAreaParser
+    ),
+    "sample_indices" / Computed(lambda this: 
+        this.directory_area.get_indices(RolandFileType.SAMPLE).tolist()
+    ),
+    "sample_pool" / Lazy(SamplePoolConstruct(lambda this: this.sample_indices)),
     "volumes" / VolumeEntriesList(
         lambda this: this.id_area.num_volumes,
         lambda this: this.id_area.num_performances
@@ -175,6 +197,9 @@ class RolandS7xxImageContainer:
     id_area: IdArea
     fat_area: FatArea
     fat: RolandFileAllocationTable
+    directory_area: DirectoryArea
+    sample_indices: List[int]
+    sample_pool: Callable
     volumes: List[VolumeEntry]
 
 
@@ -197,6 +222,7 @@ class RolandS7xxImage(Image):
     fat: RolandFileAllocationTable
 
     _f_realize_children: Callable[[Dict[str, Any]], Element]
+    _f_sample_pool: Callable
 
     name: ClassVar = "Roland S-7xx Image"
     type_name: ClassVar = "Roland S-7xx Image"
@@ -208,10 +234,66 @@ class RolandS7xxImage(Image):
         for volume in self.volumes:
             volume.set_routines(self._routines)
 
+
+    def set_header_only(self, header_only: bool):
+        super().set_header_only(header_only)
+        for volume in self.volumes:
+            volume.header_only = header_only
+
     
     def __post_init__(self):
         self._children = None
-    
+        self._sample_pool: Optional[SamplePool] = None
+
+
+    @property
+    def sample_pool(self) -> SamplePool:
+        if self._sample_pool is None:
+            self._sample_pool = SamplePool(
+                _f_sample_pool=self._f_sample_pool,
+                _parent=self,
+                _path=[SAMPLE_POOL_NAME],
+                _routines=self._routines
+            )
+        return self._sample_pool
+
+
+    def get_sample_links(self) -> List[Tuple[str, str]]:
+        self.sample_pool.children  # needed to ensure routines are run
+        pool_paths = {
+            index: "/".join(sample_file.export_path())
+            for index, sample_file in self.sample_pool.sample_files.items()
+        }
+
+        result = []
+        for volume in self.children:
+            for performance in cast(VolumeEntry, volume).children:
+                performance = cast(PerformanceEntry, performance)
+                for listing in performance.listing:
+                    listing = cast(FileListing, listing)
+                    if listing.type_id != ElementTypes.SampleEntry:
+                        continue
+                    if listing.key is None:
+                        continue
+                    sample_index = listing.key[1]
+                    if sample_index not in pool_paths.keys():
+                        continue
+                    link_path = "/".join(listing.export_path())
+                    result.append((link_path, pool_paths[sample_index]))
+        return result
+
+
+    def export_sample_pool(
+            self, 
+            export_manager: ExportManager, 
+            link_mode: Optional[str] = None
+    ):
+        self.sample_pool.export_samples(export_manager)
+        if link_mode is not None:
+            links = self.get_sample_links()
+            export_manager.write_links(links, link_mode)
+        return
+
 
 class RolandS7xxImageAdapter(ElementAdapter):
     
@@ -243,7 +325,8 @@ class RolandS7xxImageAdapter(ElementAdapter):
             _f_realize_children=self.wrap_child_realization(  # type: ignore
                 lambda: container.volumes,  # type: ignore
                 context
-            )
+            ),
+            _f_sample_pool=container.sample_pool
         )
         return result
 
@@ -0,0 +1,137 @@
+from abc import ABCMeta
+from abc import abstractmethod
+from construct.core import Adapter
+from construct.core import Bytes
+from construct.core import Construct
+from construct.core import ConstructError
+from construct.core import evaluate
+from construct.core import Pointer
+import numpy as np
+from typing import Any
+from typing import ClassVar
+from typing import Dict
+from typing import Type
+
+from smpl_extract.util.constructs import find_or_parse_in_context
+
+from .data_types import TOTAL_PARAMETER_AREA_OFFSET
+from .data_types import TOTAL_PARAMETER_AREA_SIZE
+
+
+def record_to_dict(record: np.void) -> Dict[str, Any]:
+    result = {
+        name: record[name].tolist()
+        for name in record.dtype.names  # type: ignore
+    }
+    return result
+
+
+def get_valid_names(names: np.ndarray) -> np.ndarray:
+    result = np.all(names < 0x80, axis=1)
+    return result
+
+
+def decode_name(name: np.ndarray) -> str:
+    result = name.tobytes().rstrip(b"\x00").decode("ascii")
+    return result
+
+
+class ParameterTable(metaclass=ABCMeta):
+    area_offset:    ClassVar[int]
+    entry_dtype:    ClassVar[np.dtype]
+    num_entries:    ClassVar[int]
+
+
+    def __init__(self, data) -> None:
+        self.entries = np.frombuffer(
+            data,
+            self.entry_dtype,
+            self.num_entries,
+            self.area_offset - TOTAL_PARAMETER_AREA_OFFSET
+        )
+        self.valid = get_valid_names(self.entries["name"])
+
+
+    @abstractmethod
+    def _decode_entry(self, index: int) -> Any: ...
+
+
+    def get_entry(self, index: int) -> Any:
+        if not 0 <= index < self.num_entries:
+            raise ConstructError(
+                f"Parameter index {index} is out of range."
+            )
+        if not self.valid[index]:
+            raise ConstructError(
+                f"Parameter entry {index} is invalid."
+            )
+        result = self._decode_entry(index)
+        return result
+
+
+class ParameterArea:
+
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self.tables: Dict[Type[ParameterTable], ParameterTable] = {}
+
+
+    def get_table(self, table_class: Type[ParameterTable]) -> ParameterTable:
+        if table_class not in self.tables.keys():
+            self.tables[table_class] = table_class(self.data)
+        result = self.tables[table_class]
+        return result
+
+
+class ParameterAreaAdapter(Adapter):
+
+
+    def _decode(self, obj, context, path) -> ParameterArea:
+        del context, path  # unused
+        result = ParameterArea(obj)
+        return result
+
+
+    def _encode(self, obj, context, path):
+        raise NotImplementedError
+
+
+ParameterAreaParser = ParameterAreaAdapter(Bytes(TOTAL_PARAMETER_AREA_SIZE))
+
+
+def get_parameter_area(stream, context: Dict[str, Any], path) -> ParameterArea:
+    result = find_or_parse_in_context(
+        "parameter_area",
+        Pointer(TOTAL_PARAMETER_AREA_OFFSET, ParameterAreaParser),
+        stream,
+        context,
+        path
+    )
+    return result
+
+
+class ParameterLookup(Construct):
+
+
+    def __init__(self, table_class: Type[ParameterTable], index_expr) -> None:
+        super().__init__()
+        self.table_class = table_class
+        self.index_expr = index_expr
+        self.flagbuildnone = True
+
+
+    def _parse(self, stream, context, path) -> Any:
+        index = evaluate(self.index_expr, context)
+        parameter_area = get_parameter_area(stream, context, path)
+        table = parameter_area.get_table(self.table_class)
+        result = table.get_entry(index)
+        return result
+
+
+    def _build(self, obj, stream, context, path):
+        raise NotImplementedError
+
+
+    def _sizeof(self, context, path):
+        return 0
@@ -11,10 +11,10 @@ from construct.core import Int8ul
 from construct.core import PaddedString
 from construct.core import Padding
 from construct.core import Pass
-from construct.core import Pointer
 from construct.core import Struct
 from construct.core import Subconstruct
 from construct.lib.containers import ListContainer
+import numpy as np
 from typing import Dict
 from typing import cast
 from typing import ClassVar
@@ -25,21 +25,28 @@ from smpl_extract.base import Element
 from smpl_extract.base import ElementTypes
 from smpl_extract.structural import T_ROUTINE
 from smpl_extract.structural import Traversable
+from smpl_extract.util.constructs import CachedConstruct
 from smpl_extract.util.constructs import pass_expression_deeper
 from smpl_extract.util.constructs import pull_child_info
+from smpl_extract.util.constructs import SafeListConstruct
 from smpl_extract.util.constructs import UnsizedConstruct
 from smpl_extract.util.dataclass import get_common_field_args
 
 from .data_types import MAX_NUM_PARTIAL
-from .data_types import PARTIAL_DIRECTORY_AREA_OFFSET
-from .data_types import PARTIAL_DIRECTORY_ENTRY_SIZE
 from .data_types import PARTIAL_PARAMETER_AREA_OFFSET
 from .data_types import PARTIAL_PARAMETER_ENTRY_SIZE
+from .data_types import RolandFileType
 from .directory_area import DirectoryEntryContainer
-from .directory_area import DirectoryEntryParser
+from .directory_area import DirectoryEntryLookup
+from .parameter_area import decode_name
+from .parameter_area import ParameterLookup
+from .parameter_area import ParameterTable
+from .parameter_area import record_to_dict
 from .sample_entry import SampleEntry
 from .sample_entry import SampleEntryAdapter
 from .sample_entry import SampleEntryConstruct
+from .sample_entry import SampleListingConstruct
+from .sample_entry import SampleListingContainer
 
 
 @dataclass
@@ -213,28 +220,203 @@ class PartialParamEntryContainer(PartialParamCommon):
         field(default_factory=PartialParamSampleSectionContainer)
 
 
+    @property
+    def sample_sections(self) -> List[PartialParamSampleSectionContainer]:
+        result = [self.sample_1, self.sample_2, self.sample_3, self.sample_4]
+        return result
+
+
+PARTIAL_SAMPLE_SECTION_OFFSET   = 0x10
+PARTIAL_SAMPLE_SECTION_SIZE     = 0x10
+NUM_PARTIAL_SAMPLE_SECTIONS     = 4
+
+
+PARTIAL_SAMPLE_SECTION_DTYPE = np.dtype([
+    ("sample_selection",    "<i2"),
+    ("pitch_kf",            np.uint8),
+    ("sample_level",        np.uint8),
+    ("pan",                 np.int8),
+    ("coarse_tune",         np.int8),
+    ("fine_tune",           np.int8),
+    ("smt_velocity_lower",  np.uint8),
+    ("smt_fade_with_lower", np.uint8),
+    ("smt_velocity_upper",  np.uint8),
+    ("smt_fade_with_upper", np.uint8)
+])
+PARTIAL_TVF_SECTION_DTYPE = np.dtype([
+    ("filter_mode",             np.uint8),
+    ("cutoff",                  np.uint8),
+    ("resonance",               np.uint8),
+    ("velocity_curve_type",     np.uint8),
+    ("velocity_curve_ratio",    np.uint8),
+    ("time_velocity_sens",      np.uint8),
+    ("cutoff_velocity_sens",    np.uint8),
+    ("levels",                  np.uint8, 4),
+    ("times",                   np.uint8, 4),
+    ("env_tvf_depth",           np.uint8),
+    ("env_pitch_depth",         np.uint8),
+    ("tvf_kf_point",            np.uint8),
+    ("env_time_kf",             np.uint8),
+    ("env_depth_kf",            np.uint8),
+    ("cutoff_kf",               np.uint8)
+])
+PARTIAL_TVA_SECTION_DTYPE = np.dtype({
+    "names": [
+        "velocity_curve_type",
+        "velocity_curve_ratio",
+        "time_velocity_sensitivity",
+        "levels",
+        "times",
+        "tva_kf_point",
+        "env_time_kf",
+        "level_kf"
+    ],
+    "formats": [
+        np.uint8,
+        np.uint8,
+        np.uint8,
+        (np.uint8, 4),
+        (np.uint8, 4),
+        np.uint8,
+        np.uint8,
+        np.uint8
+    ],
+    "offsets":  [0, 1, 2, 3, 7, 12, 13, 15],
+    "itemsize": 16
+})
+PARTIAL_LFO_SECTION_DTYPE = np.dtype([
+    ("wave_form",               np.uint8),
+    ("rate",                    np.uint8),
+    ("key_sync",                np.uint8),
+    ("delay",                   np.uint8),
+    ("delay_kf",                np.uint8),
+    ("detune",                  np.uint8),
+    ("pitch",                   np.uint8),
+    ("tvf_modulation_depth",    np.uint8),
+    ("tva_modulation_depth",    np.uint8)
+])
+PARTIAL_PARAM_DTYPE = np.dtype({
+    "names": [
+        "name",
+        "sample_1",
+        "output_assign_8",
+        "stereo_mix_level",
+        "partial_level",
+        "output_assign_6",
+        "sample_2",
+        "pan",
+        "course_tune",
+        "fine_tune",
+        "breath_cntrl",
+        "sample_3",
+        "sample_4",
+        "tvf",
+        "tva",
+        "lfo_generator"
+    ],
+    "formats": [
+        (np.uint8, 16),
+        PARTIAL_SAMPLE_SECTION_DTYPE,
+        np.uint8,
+        np.uint8,
+        np.uint8,
+        np.uint8,
+        PARTIAL_SAMPLE_SECTION_DTYPE,
+        np.uint8,
+        np.int8,
+        np.int8,
+        np.uint8,
+        PARTIAL_SAMPLE_SECTION_DTYPE,
+        PARTIAL_SAMPLE_SECTION_DTYPE,
+        PARTIAL_TVF_SECTION_DTYPE,
+        PARTIAL_TVA_SECTION_DTYPE,
+        PARTIAL_LFO_SECTION_DTYPE
+    ],
+    "offsets": [
+        0, 
+        PARTIAL_SAMPLE_SECTION_OFFSET, 
+        28, 
+        29, 
+        30, 
+        31, 
+        PARTIAL_SAMPLE_SECTION_OFFSET + PARTIAL_SAMPLE_SECTION_SIZE, 
+        44, 
+        45, 
+        46, 
+        47, 
+        PARTIAL_SAMPLE_SECTION_OFFSET + 2*PARTIAL_SAMPLE_SECTION_SIZE, 
+        PARTIAL_SAMPLE_SECTION_OFFSET + 3*PARTIAL_SAMPLE_SECTION_SIZE, 
+        75, 
+        96, 
+        112
+    ],
+    "itemsize": PARTIAL_PARAMETER_ENTRY_SIZE
+})
+PARTIAL_SAMPLE_SECTION_FIELDS = ("sample_1", "sample_2", "sample_3", "sample_4")
+PARTIAL_PARAM_SCALAR_FIELDS = (
+    "output_assign_8",
+    "stereo_mix_level",
+    "partial_level",
+    "output_assign_6",
+    "pan",
+    "course_tune",
+    "fine_tune",
+    "breath_cntrl"
+)
+
+
+class PartialParamTable(ParameterTable):
+    area_offset:    ClassVar[int]       = PARTIAL_PARAMETER_AREA_OFFSET
+    entry_dtype:    ClassVar[np.dtype]  = PARTIAL_PARAM_DTYPE
+    num_entries:    ClassVar[int]       = MAX_NUM_PARTIAL
+
+
+    def _decode_entry(self, index: int) -> PartialParamEntryContainer:
+        entry = self.entries[index]
+        sample_sections = {
+            key: PartialParamSampleSectionContainer(
+                **record_to_dict(entry[key])
+            )
+            for key in PARTIAL_SAMPLE_SECTION_FIELDS
+        }
+        scalars = {
+            key: int(entry[key]) 
+            for key in PARTIAL_PARAM_SCALAR_FIELDS
+        }
+        result = PartialParamEntryContainer(
+            **sample_sections,
+            **scalars,
+            name=decode_name(entry["name"]),
+            index=index,
+            tvf=PartialParamTvfSectionContainer(
+                **record_to_dict(entry["tvf"])
+            ),
+            tva=PartialParamTvaSectionContainer(
+                **record_to_dict(entry["tva"])
+            ),
+            lfo_generator=PartialParamLfoSectionContainer(
+                **record_to_dict(entry["lfo_generator"])
+            )
+        )
+        return result
+
+
 def PartialEntryConstruct(index_expr) -> Construct:
     new_index_expr = pass_expression_deeper(index_expr)
 
-    result = UnsizedConstruct(Struct(
+    entry_struct = UnsizedConstruct(Struct(
         ExprValidator(
             Computed(lambda this: new_index_expr(this)), 
             lambda obj, ctx: 0<= obj < MAX_NUM_PARTIAL
         ),
         "index"     / Computed(new_index_expr),
-        "directory" / Pointer(
-            lambda this: \
-                (PARTIAL_DIRECTORY_ENTRY_SIZE*new_index_expr(this)) \
-                    + PARTIAL_DIRECTORY_AREA_OFFSET,
-            DirectoryEntryParser
+        "directory" / DirectoryEntryLookup(
+            RolandFileType.PARTIAL,
+            new_index_expr
         ),
-        "parameter" / Pointer(
-            lambda this: \
-                (PARTIAL_PARAMETER_ENTRY_SIZE*new_index_expr(this)) \
-                + PARTIAL_PARAMETER_AREA_OFFSET,
-            PartialParamEntryStruct
-        )
+        "parameter" / ParameterLookup(PartialParamTable, new_index_expr)
     ))
+    result = CachedConstruct("_partial_entries", index_expr, entry_struct)
     return result
 @dataclass
 class PartialEntryContainer:
@@ -243,6 +425,35 @@ class PartialEntryContainer:
     parameter:  PartialParamEntryContainer
 
 
+def PartialListingConstruct(index_expr) -> Construct:
+    new_index_expr = pass_expression_deeper(index_expr)
+
+    result = UnsizedConstruct(Struct(
+        ExprValidator(
+            Computed(lambda this: new_index_expr(this)), 
+            lambda obj, ctx: 0<= obj < MAX_NUM_PARTIAL
+        ),
+        "index"     / Computed(new_index_expr),
+        "directory" / DirectoryEntryLookup(
+            RolandFileType.PARTIAL,
+            new_index_expr
+        ),
+        "parameter" / ParameterLookup(PartialParamTable, new_index_expr),
+        "sample_listings" / SafeListConstruct(
+            NUM_PARTIAL_SAMPLE_SECTIONS,
+            SampleListingConstruct(lambda this: 
+                this.parameter.sample_sections[this._index].sample_selection
+            )
+        )
+    ))
+    return result
+@dataclass
+class PartialListingContainer:
+    index:              int
+    directory:          DirectoryEntryContainer
+    sample_listings:    List[SampleListingContainer]
+
+
 @dataclass
 class SampleEntryReference(PartialParamSampleSectionCommon):
     sample_entry: SampleEntry = field(default_factory=SampleEntry)
@@ -258,11 +469,8 @@ class SampleEntryReferenceAdapter(Subconstruct):
         )
         if container.sample_selection < 0:
             raise ConstructError
-        sample_entry_sc = SampleEntryAdapter(
-            SampleEntryConstruct(container.sample_selection)
-        )
         new_path = path + " -> sample_entries"
-        sample_entry = sample_entry_sc._parse(  # type: ignore
+        sample_entry = SampleEntryReferenceParser._parse(  # type: ignore
             stream, 
             context, 
             new_path
@@ -286,6 +494,11 @@ class SampleEntryReferenceAdapter(Subconstruct):
         raise NotImplementedError
 
 
+SampleEntryReferenceParser = SampleEntryAdapter(SampleEntryConstruct(
+    lambda this: this.ref_container.sample_selection
+))
+
+
 @dataclass
 class PartialEntry(PartialParamCommon, Traversable[SampleEntry]):
     directory_name: str = ""
@@ -25,6 +25,7 @@ from smpl_extract.base import Element
 from smpl_extract.base import ElementTypes
 from smpl_extract.structural import T_ROUTINE
 from smpl_extract.structural import Traversable
+from smpl_extract.util.constructs import CachedConstruct
 from smpl_extract.util.constructs import ChildInfo
 from smpl_extract.util.constructs import ElementAdapter
 from smpl_extract.util.constructs import pass_expression_deeper
@@ -34,15 +35,16 @@ from smpl_extract.util.dataclass import get_common_field_args
 
 from .data_types import MAX_NUM_PATCH
 from .data_types import NUM_KEYS
-from .data_types import PATCH_DIRECTORY_AREA_OFFSET
-from .data_types import PATCH_DIRECTORY_ENTRY_SIZE
 from .data_types import PATCH_PARAMETER_AREA_OFFSET
 from .data_types import PATCH_PARAMETER_ENTRY_SIZE
+from .data_types import RolandFileType
 from .directory_area import DirectoryEntryContainer
-from .directory_area import DirectoryEntryParser
+from .directory_area import DirectoryEntryLookup
 from .partial_entry import PartialEntry
 from .partial_entry import PartialEntryAdapter
 from .partial_entry import PartialEntryConstruct
+from .partial_entry import PartialListingConstruct
+from .partial_entry import PartialListingContainer
 
 
 BenderParamStruct = Struct(
@@ -214,17 +216,19 @@ def PatchEntryConstruct(index_expr) -> Construct:
             lambda obj, ctx: 0 <= obj < MAX_NUM_PATCH
         ),
         "index"     / Computed(new_index_expr),
-        "directory" / Pointer(
-            lambda this: \
-                (PATCH_DIRECTORY_ENTRY_SIZE*new_index_expr(this)) \
-                    + PATCH_DIRECTORY_AREA_OFFSET,
-            DirectoryEntryParser
+        "directory" / DirectoryEntryLookup(
+            RolandFileType.PATCH,
+            new_index_expr
         ),
-        "parameter" / Pointer(
-            lambda this: \
-                (PATCH_PARAMETER_ENTRY_SIZE*new_index_expr(this)) \
-                + PATCH_PARAMETER_AREA_OFFSET,
-            PatchParamEntryParser
+        "parameter" / CachedConstruct(
+            "_patch_parameters",
+            new_index_expr,
+            Pointer(
+                lambda this: \
+                    (PATCH_PARAMETER_ENTRY_SIZE*new_index_expr(this)) \
+                    + PATCH_PARAMETER_AREA_OFFSET,
+                PatchParamEntryParser
+            )
         ),
         "partial_entries" / Lazy(SafeListConstruct(
             lambda this: len(this.parameter.partial_list),
@@ -242,10 +246,66 @@ class PatchEntryContainer:
     partial_entries:    Callable
 
 
+PATCH_PARTIAL_LIST_OFFSET = 0x100
+
+
+class PartialListAdapter(Adapter):
+
+
+    def _decode(self, obj, context, path) -> List[int]:
+        del context, path  # unused
+        ptrs_filtered = [x for x in obj if x >= 0]
+        result = np.unique(np.asarray(ptrs_filtered, dtype=int)).tolist()
+        return result
+
+
+    def _encode(self, obj, context, path):
+        raise NotImplementedError
+
+
+PartialListParser = PartialListAdapter(Array(NUM_KEYS, Int16sl))
+
+
+def PatchListingConstruct(index_expr) -> Construct:
+    new_index_expr = pass_expression_deeper(index_expr)
+
+    result = UnsizedConstruct(Struct(
+        ExprValidator(
+            Computed(lambda this: new_index_expr(this)), 
+            lambda obj, ctx: 0 <= obj < MAX_NUM_PATCH
+        ),
+        "index"     / Computed(new_index_expr),
+        "directory" / DirectoryEntryLookup(
+            RolandFileType.PATCH,
+            new_index_expr
+        ),
+        "partial_list" / Pointer(
+            lambda this: \
+                (PATCH_PARAMETER_ENTRY_SIZE*new_index_expr(this)) \
+                + PATCH_PARAMETER_AREA_OFFSET + PATCH_PARTIAL_LIST_OFFSET,
+            PartialListParser
+        ),
+        "partial_listings" / SafeListConstruct(
+            lambda this: len(this.partial_list),
+            PartialListingConstruct(lambda this: 
+                this.partial_list[this._index]
+            )
+        )
+    ))
+    return result
+@dataclass
+class PatchListingContainer:
+    index:              int
+    directory:          DirectoryEntryContainer
+    partial_list:       List[int]
+    partial_listings:   List[PartialListingContainer]
+
+
 @dataclass
 class PatchEntry(PatchParamEntryCommon, Traversable):
     directory_name:         str                     = ""
     parameter_name:         str                     = ""
+    index:                  int                     = 0
     _f_realize_children:    Callable                = lambda x: None
     _parent:                Optional[Element]       = None
     _path:                  List[str]               = field(default_factory=list)
@@ -304,6 +364,7 @@ class PatchEntryAdapter(ElementAdapter):
             **common_args,
             directory_name=container.directory.name,
             parameter_name=container.parameter.name,
+            index=container.index,
             _f_realize_children=self.wrap_child_realization(
                 container.partial_entries,
                 context
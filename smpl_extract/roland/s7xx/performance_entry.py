@@ -4,6 +4,7 @@ from construct.core import Adapter
 from construct.core import Array
 from construct.core import Computed
 from construct.core import Construct
+from construct.core import ConstructError
 from construct.core import ExprValidator
 from construct.core import Int8ul
 from construct.core import Int16sl
@@ -15,6 +16,7 @@ from construct.core import Pass
 from construct.core import Pointer
 from construct.core import Struct
 from construct.lib.containers import Container
+from functools import partial
 import numpy as np
 from typing import Any
 from typing import Callable
@@ -23,13 +25,18 @@ from typing import ClassVar
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
+from typing import Type
 from typing import Union
 
 from smpl_extract.base import Element
 from smpl_extract.base import ElementTypes
+from smpl_extract.structural import FileListing
 from smpl_extract.structural import T_ROUTINE
 from smpl_extract.structural import Traversable
+from smpl_extract.util.constructs import CachedConstruct
 from smpl_extract.util.constructs import ElementAdapter
+from smpl_extract.util.constructs import LookupConstruct
 from smpl_extract.util.constructs import pass_expression_deeper
 from smpl_extract.util.constructs import SafeListConstruct
 from smpl_extract.util.constructs import UnsizedConstruct
@@ -37,17 +44,21 @@ from smpl_extract.util.dataclass import get_common_field_args
 
 from .fat import RolandFileAllocationTable
 from .data_types import MAX_NUM_PERFORMANCE
-from .data_types import PERFORMANCE_DIRECTORY_AREA_OFFSET
-from .data_types import PERFORMANCE_DIRECTORY_ENTRY_SIZE
 from .data_types import PERFORMANCE_PARAMETER_AREA_OFFSET
 from .data_types import PERFORMANCE_PARAMETER_ENTRY_SIZE
+from .data_types import RolandFileType
 from .directory_area import DirectoryEntryContainer
-from .directory_area import DirectoryEntryParser
+from .directory_area import DirectoryEntryLookup
 from .patch_entry import PatchEntryAdapter
 from .patch_entry import PatchEntryConstruct
+from .patch_entry import PatchListingConstruct
+from .patch_entry import PatchListingContainer
 from .program_file import ProgramFile
 from .program_file import ProgramFileAdapter
+from .sample_entry import SampleEntryAdapter
+from .sample_entry import SampleEntryConstruct
 from .sample_file import SampleFile
+from .sample_file import SampleFileAdapter
 from .sample_file import SampleFileListAdapter
 
 
@@ -126,24 +137,44 @@ def PerformanceEntryConstruct(index_expr) -> Construct:
             lambda obj, ctx: 0 <= obj < MAX_NUM_PERFORMANCE
         ),
         "index"     / Computed(new_index_expr),
-        "directory" / Pointer(
-            lambda this: \
-                (PERFORMANCE_DIRECTORY_ENTRY_SIZE*new_index_expr(this)) \
-                    + PERFORMANCE_DIRECTORY_AREA_OFFSET,
-            DirectoryEntryParser
+        "directory" / DirectoryEntryLookup(
+            RolandFileType.PERFORMANCE,
+            new_index_expr
         ),
-        "parameter" / Pointer(
-            lambda this: \
-                (PERFORMANCE_PARAMETER_ENTRY_SIZE*new_index_expr(this)) \
-                + PERFORMANCE_PARAMETER_AREA_OFFSET,
-            PerformanceParamEntryParser
+        "parameter" / CachedConstruct(
+            "_performance_parameters",
+            new_index_expr,
+            Pointer(
+                lambda this: \
+                    (PERFORMANCE_PARAMETER_ENTRY_SIZE*new_index_expr(this)) \
+                    + PERFORMANCE_PARAMETER_AREA_OFFSET,
+                PerformanceParamEntryParser
+            )
         ),
         "patch_entries" / Lazy(SafeListConstruct(
             lambda this: len(this.parameter.patch_list),
             PatchEntryAdapter(PatchEntryConstruct(lambda this: 
                 this.parameter.patch_list[this._index]
             ))
-        ))
+        )),
+        "patch_listings" / Lazy(SafeListConstruct(
+            lambda this: len(this.parameter.patch_list),
+            PatchListingConstruct(lambda this: 
+                this.parameter.patch_list[this._index]
+            )
+        )),
+        "patch_lookup" / LookupConstruct(
+            "_patch_index",
+            PatchEntryAdapter(PatchEntryConstruct(lambda this: 
+                this._patch_index
+            ))
+        ),
+        "sample_lookup" / LookupConstruct(
+            "_sample_index",
+            SampleEntryAdapter(SampleEntryConstruct(lambda this: 
+                this._sample_index
+            ))
+        )
     ))
     return result
 @dataclass
@@ -152,6 +183,12 @@ class PerformanceEntryContainer:
     directory:      DirectoryEntryContainer
     parameter:      PerformanceParamEntryContainer
     patch_entries:  Callable
+    patch_listings: Callable
+    patch_lookup:   Callable
+    sample_lookup:  Callable
+
+
+FileKey = Tuple[int, Optional[int]]
 
 
 @dataclass
@@ -163,6 +200,9 @@ class PerformanceEntry(
     parameter_name:     str                     = ""
     _fat:               Optional[RolandFileAllocationTable] = None
     _f_patch_entries:   Callable                = lambda x: None
+    _f_patch_listings:  Callable                = lambda: []
+    _f_patch_lookup:    Callable                = lambda x, y: None
+    _f_sample_lookup:   Callable                = lambda x, y: None
     _parent:            Optional[Element]       = None
     _path:              List[str]               = field(default_factory=list)
     _routines:          Dict[str, T_ROUTINE]    = field(default_factory=dict)
@@ -174,6 +214,8 @@ class PerformanceEntry(
     def __post_init__(self):
         self._patch_entries = None
         self._files = None
+        self._files_by_key: Dict[FileKey, Element] = {}
+        self._listing = None
 
 
     @property
@@ -182,14 +224,25 @@ class PerformanceEntry(
         return result
     
 
+    @property
+    def header_only(self) -> bool:
+        result = getattr(self.parent, "header_only", False)
+        return result
+
+
+    def _get_added_context(self) -> Dict[str, Any]:
+        result = {
+            "_elem_parent": self,
+            "_elem_routines": self._routines,
+            "fat": self._fat
+        }
+        return result
+
+
     @property
     def patch_entries(self):
         if not self._patch_entries:
-            added_context = {
-                "_elem_parent": self,
-                "_elem_routines": self._routines,
-                "fat": self._fat
-            }
+            added_context = self._get_added_context()
             self._patch_entries = self._f_patch_entries(added_context)
         return self._patch_entries
 
@@ -215,14 +268,18 @@ class PerformanceEntry(
                     path
                 )
 
-                samples_result = sc_samples._decode(
+                samples_result = sc_samples.decode_by_index(
                     patch,
                     context,  # type: ignore
                     path
                 )
 
                 programs.append(program)
-                samples += samples_result
+                samples += samples_result.values()
+
+                self._files_by_key[(patch.index, None)] = program
+                for sample_index, sample in samples_result.items():
+                    self._files_by_key[(patch.index, sample_index)] = sample
             
             files = programs + samples
 
@@ -233,8 +290,103 @@ class PerformanceEntry(
         return self._files
 
 
+    def _decode_file(self, key: FileKey) -> Optional[Element]:
+        patch_index, sample_index = key
+        added_context = self._get_added_context()
+        context = Container(_=Container(
+            _elem_parent=self,
+            _elem_routines=self._routines
+        ))
+        path = ""
+
+        try:
+            if sample_index is None:
+                patch = self._f_patch_lookup(added_context, patch_index)
+                result = ProgramFileAdapter(Pass)._decode(
+                    patch,
+                    context,  # type: ignore
+                    path
+                )
+            else:
+                sample_entry = self._f_sample_lookup(added_context, sample_index)
+                result = SampleFileAdapter(Pass)._decode(
+                    sample_entry,
+                    context,  # type: ignore
+                    path
+                )
+        except (ConstructError, UnicodeDecodeError, KeyError, IndexError) as e:
+            result = None
+        return result
+
+
+    def get_file(self, key: FileKey) -> Optional[Element]:
+        if key not in self._files_by_key.keys():
+            self._files_by_key[key] = self._decode_file(key)
+        result = self._files_by_key[key]
+        return result
+
+
+    def _make_listing(
+            self, 
+            name: str, 
+            element_class: Union[Type[ProgramFile], Type[SampleFile]],
+            key: FileKey
+    ) -> FileListing:
+        result = FileListing(
+            name,
+            element_class.type_name,
+            element_class.type_id,
+            partial(self.get_file, key),
+            self.path + [name],
+            self,
+            key
+        )
+        return result
+
+
+    @property
+    def listing(self) -> List[FileListing]:
+        if self._listing is None:
+            programs = []
+            samples = []
+            for patch in self._f_patch_listings():
+                patch = cast(PatchListingContainer, patch)
+                programs.append(self._make_listing(
+                    patch.directory.name,
+                    ProgramFile,
+                    (patch.index, None)
+                ))
+
+                sample_indices = set()
+                for partial_listing in patch.partial_listings:
+                    for sample in partial_listing.sample_listings:
+                        if sample.index in sample_indices:
+                            continue
+                        sample_indices.add(sample.index)
+                        samples.append(self._make_listing(
+                            sample.directory.name,
+                            SampleFile,
+                            (patch.index, sample.index)
+                        ))
+
+            listing = programs + samples
+            for routine in self._routines.values():
+                listing = routine(listing)  # type: ignore
+            self._listing = listing
+
+        return self._listing
+
+
     @property
     def children(self) -> List[Union[ProgramFile, SampleFile]]:
+        if self.header_only:
+            return self.listing  # type: ignore
+        result = self.files
+        return result  # type: ignore
+
+
+    @property
+    def export_children(self) -> List[Union[ProgramFile, SampleFile]]:
         result = self.files
         return result  # type: ignore
 
@@ -276,6 +428,15 @@ class PerformanceEntryAdapter(ElementAdapter):
                 container.patch_entries,
                 context
             ),
+            _f_patch_listings=container.patch_listings,
+            _f_patch_lookup=self.wrap_child_lookup(
+                container.patch_lookup,
+                context
+            ),
+            _f_sample_lookup=self.wrap_child_lookup(
+                container.sample_lookup,
+                context
+            ),
             _fat=fat,
             _parent=parent,
             _path=performance_path,
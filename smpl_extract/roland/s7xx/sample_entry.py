@@ -13,8 +13,8 @@ from construct.core import Int8ul
 from construct.core import Nibble
 from construct.core import PaddedString
 from construct.core import Padding
-from construct.core import Pointer
 from construct.core import Struct
+import numpy as np
 from typing import Any
 from typing import ClassVar
 from typing import Dict
@@ -27,6 +27,7 @@ from smpl_extract.base import ElementTypes
 from smpl_extract.base import Printable
 from smpl_extract.info import InfoTable
 from smpl_extract.midi import MidiNote
+from smpl_extract.util.constructs import CachedConstruct
 from smpl_extract.util.constructs import ChildInfo
 from smpl_extract.util.constructs import ElementAdapter
 from smpl_extract.util.constructs import MappingDefault
@@ -37,14 +38,16 @@ from smpl_extract.util.fat import FatNotPresent
 
 from .data_types import MAX_NUM_SAMPLE
 from .data_types import RolandLoopMode
+from .data_types import RolandFileType
 from .data_types import RolandSampleMode
-from .data_types import SAMPLE_DIRECTORY_AREA_OFFSET
-from .data_types import SAMPLE_DIRECTORY_ENTRY_SIZE
 from .data_types import SAMPLE_PARAMETER_AREA_OFFSET
 from .data_types import SAMPLE_PARAMETER_ENTRY_SIZE
 from .directory_area import DirectoryEntryContainer
-from .directory_area import DirectoryEntryParser
+from .directory_area import DirectoryEntryLookup
 from .fat import RolandFileAllocationTable
+from .parameter_area import decode_name
+from .parameter_area import ParameterLookup
+from .parameter_area import ParameterTable
 
 
 SampleParamLoopPointStruct = Struct(
@@ -183,28 +186,125 @@ class SampleParamEntryContainer(SampleParamCommon):
         field(default_factory=SampleParamOptionsSection)
 
 
+SAMPLE_PARAM_DTYPE = np.dtype({
+    "names": [
+        "name",
+        "start_sample",
+        "sustain_loop_start",
+        "sustain_loop_end",
+        "release_loop_start",
+        "release_loop_end",
+        "loop_mode",
+        "sustain_loop_enable",
+        "sustain_loop_tune",
+        "release_loop_tune",
+        "cluster_top",
+        "num_clusters",
+        "sample_options",
+        "original_key"
+    ],
+    "formats": [
+        (np.uint8, 16),
+        "<u4",
+        "<u4",
+        "<u4",
+        "<u4",
+        "<u4",
+        np.uint8,
+        np.uint8,
+        np.uint8,
+        np.uint8,
+        "<u2",
+        "<u2",
+        np.uint8,
+        np.uint8
+    ],
+    "offsets":  [0, 16, 20, 24, 28, 32, 36, 37, 38, 39, 40, 42, 44, 45],
+    "itemsize": SAMPLE_PARAMETER_ENTRY_SIZE
+})
+LOOP_POINT_FIELDS = (
+    "start_sample",
+    "sustain_loop_start",
+    "sustain_loop_end",
+    "release_loop_start",
+    "release_loop_end"
+)
+
+LOOP_MODE_TABLE = np.full(0x100, RolandLoopMode.FORWARD_END, np.uint8)
+LOOP_MODE_TABLE[[x.value for x in RolandLoopMode]] = \
+    [x.value for x in RolandLoopMode]
+
+SAMPLE_MODE_TABLE = np.full(0x10, RolandSampleMode.MONO, np.uint8)
+SAMPLE_MODE_TABLE[[x.value for x in RolandSampleMode]] = \
+    [x.value for x in RolandSampleMode]
+
+SAMPLING_FREQUENCY_INVALID = 0
+SAMPLING_FREQUENCY_TABLE = np.full(0x10, SAMPLING_FREQUENCY_INVALID, np.int32)
+SAMPLING_FREQUENCY_TABLE[:6] = [48000, 44100, 24000, 22050, 30000, 15000]
+
+
+class SampleParamTable(ParameterTable):
+    area_offset:    ClassVar[int]       = SAMPLE_PARAMETER_AREA_OFFSET
+    entry_dtype:    ClassVar[np.dtype]  = SAMPLE_PARAM_DTYPE
+    num_entries:    ClassVar[int]       = MAX_NUM_SAMPLE
+
+
+    def __init__(self, data) -> None:
+        super().__init__(data)
+        sample_options = self.entries["sample_options"]
+        self.loop_modes = LOOP_MODE_TABLE[self.entries["loop_mode"]]
+        self.sample_modes = SAMPLE_MODE_TABLE[sample_options >> 4]
+        self.sampling_frequencies = SAMPLING_FREQUENCY_TABLE[
+            sample_options & 0x0f
+        ]
+        self.valid &= self.sampling_frequencies != SAMPLING_FREQUENCY_INVALID
+
+
+    def _decode_entry(self, index: int) -> SampleParamEntryContainer:
+        entry = self.entries[index]
+        loop_points = {
+            key: SampleParamLoopPoint(
+                fine=int(entry[key]) & 0xff,
+                address=int(entry[key]) >> 8
+            )
+            for key in LOOP_POINT_FIELDS
+        }
+        sample_options = SampleParamOptionsSection(
+            sample_mode=RolandSampleMode(self.sample_modes[index]),
+            sampling_frequency=int(self.sampling_frequencies[index])
+        )
+        result = SampleParamEntryContainer(
+            **loop_points,
+            name=decode_name(entry["name"]),
+            index=index,
+            sustain_loop_enable=int(entry["sustain_loop_enable"]),
+            sustain_loop_tune=int(entry["sustain_loop_tune"]),
+            release_loop_tune=int(entry["release_loop_tune"]),
+            original_key=MidiNote.from_midi_byte(int(entry["original_key"])),
+            loop_mode=RolandLoopMode(self.loop_modes[index]),
+            cluster_top=int(entry["cluster_top"]),
+            num_clusters=int(entry["num_clusters"]),
+            sample_options=sample_options
+        )
+        return result
+
+
 def SampleEntryConstruct(index_expr) -> Construct:
     new_index_expr = pass_expression_deeper(index_expr)
 
-    result = UnsizedConstruct(Struct(
+    entry_struct = UnsizedConstruct(Struct(
         ExprValidator(
             Computed(lambda this: new_index_expr(this)), 
             lambda obj, ctx: obj < MAX_NUM_SAMPLE
         ),
         "index"     / Computed(new_index_expr),
-        "directory" / Pointer(
-            lambda this: \
-                (SAMPLE_DIRECTORY_ENTRY_SIZE*new_index_expr(this)) \
-                    + SAMPLE_DIRECTORY_AREA_OFFSET,
-            DirectoryEntryParser
+        "directory" / DirectoryEntryLookup(
+            RolandFileType.SAMPLE,
+            new_index_expr
         ),
-        "parameter" / Pointer(
-            lambda this: \
-                (SAMPLE_PARAMETER_ENTRY_SIZE*new_index_expr(this)) \
-                + SAMPLE_PARAMETER_AREA_OFFSET,
-            SampleParamEntryStruct
-        )
+        "parameter" / ParameterLookup(SampleParamTable, new_index_expr)
     ))
+    result = CachedConstruct("_sample_entries", index_expr, entry_struct)
     return result
 @dataclass
 class SampleEntryContainer:
@@ -213,6 +313,27 @@ class SampleEntryContainer:
     parameter:  SampleParamEntryContainer
 
 
+def SampleListingConstruct(index_expr) -> Construct:
+    new_index_expr = pass_expression_deeper(index_expr)
+
+    result = UnsizedConstruct(Struct(
+        ExprValidator(
+            Computed(lambda this: new_index_expr(this)),
+            lambda obj, ctx: 0 <= obj < MAX_NUM_SAMPLE
+        ),
+        "index"     / Computed(new_index_expr),
+        "directory" / DirectoryEntryLookup(
+            RolandFileType.SAMPLE,
+            new_index_expr
+        )
+    ))
+    return result
+@dataclass
+class SampleListingContainer:
+    index:      int
+    directory:  DirectoryEntryContainer
+
+
 @dataclass
 class SampleEntry(SampleParamCommon, SampleParamOptionsSection, Element):
     directory_name: str                     = ""
@@ -23,6 +23,7 @@ from smpl_extract.structural import SampleElement
 from smpl_extract.util.constructs import ChildInfo
 from smpl_extract.util.constructs import ElementAdapter
 from smpl_extract.util.dataclass import get_common_field_args
+from smpl_extract.util.extent import flatten_stream
 from smpl_extract.util.stream import StreamOffset
 from smpl_extract.util.stream import StreamReversed
 
@@ -298,7 +299,10 @@ class SampleFile(
             num_interleaved_channels=1
         )
         data_streams = [
-            DataStream(stream=data_stream, encoding=stream_encoding)
+            DataStream(
+                stream=flatten_stream(data_stream), 
+                encoding=stream_encoding
+            )
         ]
         result = Sample(
             name=self.name,
@@ -363,7 +367,7 @@ class SampleFileAdapter(ElementAdapter):
 class SampleFileListAdapter(Adapter):
 
 
-    def _decode(self, obj, context, path):
+    def decode_by_index(self, obj, context, path) -> Dict[int, SampleFile]:
         patch_entry = cast(PatchEntry, obj)
         sc = SampleFileAdapter(Pass)
 
@@ -374,6 +378,11 @@ class SampleFileListAdapter(Adapter):
                     sample_file = sc._decode(sample_entry, context, path)
                     sample_files[sample_entry.index] = sample_file
 
+        return sample_files
+
+
+    def _decode(self, obj, context, path):
+        sample_files = self.decode_by_index(obj, context, path)
         return list(sample_files.values())
 
 
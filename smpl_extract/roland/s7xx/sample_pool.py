@@ -0,0 +1,97 @@
+from construct.core import Construct
+from construct.core import Pass
+from construct.core import Struct
+from construct.lib.containers import Container
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Callable
+from typing import cast
+from typing import ClassVar
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from smpl_extract.base import Element
+from smpl_extract.base import ElementTypes
+from smpl_extract.structural import T_ROUTINE
+from smpl_extract.structural import Traversable
+from smpl_extract.util.constructs import pass_expression_deeper
+from smpl_extract.util.constructs import SafeListConstruct
+from smpl_extract.util.constructs import UnsizedConstruct
+
+from .sample_entry import SampleEntry
+from .sample_entry import SampleEntryAdapter
+from .sample_entry import SampleEntryConstruct
+from .sample_file import SampleFile
+from .sample_file import SampleFileAdapter
+
+
+SAMPLE_POOL_NAME = "_Samples"
+
+
+def SamplePoolConstruct(index_list_expr) -> Construct:
+    new_index_list_expr = pass_expression_deeper(index_list_expr)
+
+    result = UnsizedConstruct(Struct(
+        "sample_entries" / SafeListConstruct(
+            lambda this: len(new_index_list_expr(this)),
+            SampleEntryAdapter(SampleEntryConstruct(lambda this:
+                new_index_list_expr(this)[this._index]
+            ))
+        )
+    ))
+    return result
+@dataclass
+class SamplePoolContainer:
+    sample_entries: List[SampleEntry]
+
+
+@dataclass
+class SamplePool(Traversable[SampleFile]):
+    _f_sample_pool:     Callable                = lambda: None
+    _parent:            Optional[Element]       = None
+    _path:              List[str]               = field(default_factory=list)
+    _routines:          Dict[str, T_ROUTINE]    = field(default_factory=dict)
+
+    type_id:            ClassVar[ElementTypes]  = ElementTypes.DirectoryEntry
+    type_name:          ClassVar[str]           = "Roland S-7xx Sample Pool"
+
+
+    def __post_init__(self):
+        self._children = None
+        self._sample_files = None
+
+
+    @property
+    def name(self):
+        result = SAMPLE_POOL_NAME
+        return result
+
+
+    @property
+    def sample_files(self) -> Dict[int, SampleFile]:
+        if self._sample_files is None:
+            container = cast(SamplePoolContainer, self._f_sample_pool())
+            sc = SampleFileAdapter(Pass)
+            context = Container(_=Container(
+                _elem_parent=self,
+                _elem_routines=self._routines
+            ))
+            path = ""
+
+            sample_files = {}
+            for sample_entry in container.sample_entries:
+                sample_file = sc._decode(sample_entry, context, path)
+                sample_files[sample_entry.index] = sample_file
+            self._sample_files = sample_files
+        return self._sample_files
+
+
+    @property
+    def children(self) -> List[SampleFile]:
+        if self._children is None:
+            children = list(self.sample_files.values())
+            for routine in self._routines.values():
+                children = routine(children)  # type: ignore
+            self._children = children
+        return self._children
@@ -22,21 +22,19 @@ from typing import cast
 
 from smpl_extract.base import ElementTypes
 from smpl_extract.structural import Traversable
+from smpl_extract.util.constructs import CachedConstruct
 from smpl_extract.util.constructs import ElementAdapter
 from smpl_extract.util.constructs import pass_expression_deeper
 from smpl_extract.util.constructs import SafeListConstruct
 from smpl_extract.util.constructs import UnsizedConstruct
 
-from .data_types import PERFORMANCE_DIRECTORY_AREA_OFFSET
-from .data_types import MAX_NUM_PERFORMANCE
 from .data_types import MAX_NUM_VOLUME
 from .data_types import RolandFileType
-from .data_types import VOLUME_DIRECTORY_AREA_OFFSET
-from .data_types import VOLUME_DIRECTORY_ENTRY_SIZE
 from .data_types import VOLUME_PARAMETER_AREA_OFFSET
 from .data_types import VOLUME_PARAMETER_ENTRY_SIZE
 from .directory_area import DirectoryEntryContainer
-from .directory_area import DirectoryEntryParser
+from .directory_area import DirectoryEntryLookup
+from .directory_area import get_directory_area
 from .performance_entry import PerformanceEntry, PerformanceEntryAdapter
 from .performance_entry import PerformanceEntryConstruct
 
@@ -83,17 +81,19 @@ def VolumeEntryConstruct(index_expr) -> Construct:
             lambda obj, ctx: 0 <= obj < MAX_NUM_VOLUME
         ),
         "index"     / Computed(index_expr),
-        "directory" / Pointer(
-            lambda this: \
-                (VOLUME_DIRECTORY_ENTRY_SIZE*new_index_expr(this)) \
-                    + VOLUME_DIRECTORY_AREA_OFFSET,
-            DirectoryEntryParser
+        "directory" / DirectoryEntryLookup(
+            RolandFileType.VOLUME,
+            new_index_expr
         ),
-        "parameter" / Pointer(
-            lambda this: \
-                (VOLUME_PARAMETER_ENTRY_SIZE*new_index_expr(this)) \
-                + VOLUME_PARAMETER_AREA_OFFSET,
-            VolumeParamEntryParser
+        "parameter" / CachedConstruct(
+            "_volume_parameters",
+            new_index_expr,
+            Pointer(
+                lambda this: \
+                    (VOLUME_PARAMETER_ENTRY_SIZE*new_index_expr(this)) \
+                    + VOLUME_PARAMETER_AREA_OFFSET,
+                VolumeParamEntryParser
+            )
         ),
         "performance_entries" / Lazy(SafeListConstruct(
             lambda this: len(this.parameter.performance_ptrs),
@@ -128,6 +128,7 @@ class VolumeEntry(Traversable[PerformanceEntry]):
         self._parent = None
         self._routines = {}
         self._children = None
+        self.header_only = False
         
 
     @property
@@ -201,18 +202,9 @@ class VolumeEntriesList(Subconstruct):
             context, 
             path) -> List[VolumeEntry]:
 
-        # parse the entire performance directory
-        performances_construct = Pointer(PERFORMANCE_DIRECTORY_AREA_OFFSET, 
-            SafeListConstruct(
-                MAX_NUM_PERFORMANCE, 
-                DirectoryEntryParser,
-            )
-        )
-        performances = performances_construct._parsereport(stream, context, path)  # type: ignore
-        performances = cast(List[DirectoryEntryContainer], performances)
-        performances = list(p for p in performances if p.file_type == RolandFileType.PERFORMANCE)
-        
-        performance_ptrs = np.array(list(p.index for p in performances))
+        # scan the entire performance directory
+        directory_area = get_directory_area(stream, context, path)
+        performance_ptrs = directory_area.get_indices(RolandFileType.PERFORMANCE)
         if np.size(volume_performance_ptrs, 0) > 0:
             mask = np.isin(performance_ptrs, np.array(volume_performance_ptrs), invert=True)
             orphan_ptrs = performance_ptrs[mask].tolist()
@@ -1,5 +1,7 @@
 from abc import ABCMeta
 from abc import abstractmethod
+from construct.core import ConstructError
+import csv
 import os
 import re
 from typing import Any
@@ -18,9 +20,13 @@ from smpl_extract.base import ElementTypes
 from smpl_extract.base import Printable
 from smpl_extract.elements import LeafElement
 from smpl_extract.generalized.sample import combine_stereo
+from smpl_extract.generalized.sample import get_content_key
+from smpl_extract.generalized.sample import get_source_key
 from smpl_extract.generalized.sample import Sample
 from smpl_extract.generalized.wav import export_wav
 from smpl_extract.info import InfoTable
+from smpl_extract.util.fat import InvalidFatDefinition
+from smpl_extract.util.fat import RequestedInvalidSector
 
 
 class ErrorNoChildWithName(Exception): ...
@@ -34,6 +40,12 @@ T_ROUTINE = Callable[[List[Element]], List[Element]]
 T_SAMPLE_ROUTINE = Callable[[List[Sample]],List[Sample]]
 
 
+LINK_MODE_MAPPING = "mapping"
+LINK_MODE_SYMLINK = "symlink"
+LINK_MODE_HARDLINK = "hardlink"
+SAMPLE_MAP_FILE_NAME = "sample_map.csv"
+
+
 class SampleElement(LeafElement, metaclass=ABCMeta):
     type_id = ElementTypes.SampleEntry
 
@@ -45,6 +57,59 @@ class ProgramElement(LeafElement):
     type_id = ElementTypes.ProgramEntry
 
 
+class FileListing(Element):
+
+
+    def __init__(
+            self,
+            name: str,
+            type_name: str,
+            type_id: ElementTypes,
+            f_file: Callable[[], Optional[Element]],
+            path: Optional[List[str]] = None,
+            parent: Optional[Element] = None,
+            key: Any = None
+    ) -> None:
+        super().__init__(path, parent)
+        self.name = name
+        self.type_name = type_name
+        self.type_id = type_id
+        self.key = key
+        self._f_file = f_file
+
+
+    @property
+    def file(self):
+        try:
+            result = self._f_file()
+        except (
+                ConstructError, 
+                InvalidFatDefinition, 
+                RequestedInvalidSector
+        ) as e:
+            raise ErrorInvalidPath(
+                f"The entity \"{self.safe_name}\" could not be read."
+            ) from e
+        if result is None:
+            raise ErrorInvalidPath(
+                f"The entity \"{self.safe_name}\" could not be read."
+            )
+
+        result._safe_name = self._safe_name
+        result._export_name = self._export_name
+        return result
+
+
+    def get_info(self) -> Printable:
+        result = self.file.get_info()
+        return result
+
+
+    def to_generalized(self) -> Sample:
+        result = self.file.to_generalized()  # type: ignore
+        return result
+
+
 class ExportManager:
     def __init__(
             self,
@@ -52,17 +117,24 @@ class ExportManager:
             routines: Optional[Dict[
                 str, 
                 T_SAMPLE_ROUTINE
-            ]] = None
+            ]] = None,
+            dedup_mode: Optional[str] = None
         ) -> None:
         self.output_directory: str
         self.routines: Dict[str, Callable[[List[Sample]],List[Sample]]]
         self.samples: List[Sample]
         self.level: Tuple[str, ...]
+        self.dedup_mode: Optional[str]
+        self.exported_paths: Dict[Tuple[Any, ...], str]
+        self.mapped_links: List[Tuple[str, str]]
 
         self.output_directory = output_directory
         self.routines = routines or {}
         self.samples = []
         self.level = ()
+        self.dedup_mode = dedup_mode
+        self.exported_paths = {}
+        self.mapped_links = []
 
 
     def add_sample(self, sample: Sample):
@@ -85,6 +157,32 @@ class ExportManager:
         return result
 
 
+    def make_total_path(self, inner_path: str) -> str:
+        result = os.path.join(self.output_directory, inner_path) + ".wav"
+        return result
+
+
+    def get_sample_key(self, sample: Sample) -> Tuple[Any, ...]:
+        result = get_source_key(sample)
+        if result is None:
+            result = get_content_key(sample)
+        return result
+
+
+    def link_sample(self, inner_path: str, target_path: str) -> bool:
+        dedup_mode = cast(str, self.dedup_mode)
+        if dedup_mode == LINK_MODE_MAPPING:
+            self.mapped_links.append((inner_path, target_path))
+            print(f"Mapped {inner_path}.wav")
+            return True
+
+        try:
+            self.write_links([(inner_path, target_path)], dedup_mode)
+        except OSError:
+            return False
+        return True
+
+
     def export_samples(self):
         samples = self.samples
         for f_routine in self.routines.values():
@@ -92,17 +190,68 @@ class ExportManager:
 
         for sample in samples:
             inner_path = self.make_output_path(sample)
-            total_path = os.path.join(self.output_directory, inner_path) + ".wav"
+
+            sample_key = None
+            if self.dedup_mode is not None:
+                sample_key = self.get_sample_key(sample)
+                target_path = self.exported_paths.get(sample_key)
+                if target_path is not None and target_path != inner_path:
+                    if self.link_sample(inner_path, target_path):
+                        continue
+
+            total_path = self.make_total_path(inner_path)
             dir_name = os.path.dirname(total_path)
             if not os.path.exists(dir_name):
                 os.makedirs(dir_name)
             export_wav(sample, total_path)
             print(f"Exported {inner_path}.wav")
 
+            if sample_key is not None:
+                self.exported_paths[sample_key] = inner_path
+
         self.samples.clear()
         return 
 
 
+    def finish_export(self):
+        if len(self.mapped_links) > 0:
+            self.write_links(self.mapped_links, LINK_MODE_MAPPING)
+            self.mapped_links.clear()
+        return
+
+
+    def write_links(self, links: List[Tuple[str, str]], link_mode: str):
+        if link_mode == LINK_MODE_MAPPING:
+            map_path = os.path.join(self.output_directory, SAMPLE_MAP_FILE_NAME)
+            if not os.path.exists(self.output_directory):
+                os.makedirs(self.output_directory)
+            with open(map_path, "w", newline="", encoding="utf-8") as file:
+                writer = csv.writer(file)
+                writer.writerow(("path", "sample"))
+                for link_path, target_path in links:
+                    writer.writerow((link_path + ".wav", target_path + ".wav"))
+            print(f"Exported {SAMPLE_MAP_FILE_NAME}")
+
+        elif link_mode in (LINK_MODE_SYMLINK, LINK_MODE_HARDLINK):
+            for link_path, target_path in links:
+                total_link_path = self.make_total_path(link_path)
+                total_target_path = self.make_total_path(target_path)
+                dir_name = os.path.dirname(total_link_path)
+                if not os.path.exists(dir_name):
+                    os.makedirs(dir_name)
+                if os.path.lexists(total_link_path):
+                    os.remove(total_link_path)
+                if link_mode == LINK_MODE_SYMLINK:
+                    os.symlink(
+                        os.path.relpath(total_target_path, dir_name), 
+                        total_link_path
+                    )
+                else:
+                    os.link(total_target_path, total_link_path)
+                print(f"Linked {link_path}.wav")
+        return
+
+
 _T_CHILD = TypeVar("_T_CHILD", bound=Element)
 class Traversable(Element, Generic[_T_CHILD]):
 
@@ -142,6 +291,12 @@ class Traversable(Element, Generic[_T_CHILD]):
         return self._children  # type: ignore
 
 
+    @property
+    def export_children(self) -> List[_T_CHILD]:
+        result = self.children
+        return result
+
+
     def get_info(self) -> Printable:
         entries: List[Tuple[str, ...]] = []
         for child in self.children:
@@ -223,7 +378,7 @@ class Traversable(Element, Generic[_T_CHILD]):
             export_manager: ExportManager
     ):
         export_manager.set_level(tuple(self.path))
-        children = self.children
+        children = self.export_children
 
         for child in children:
             if child.type_id == ElementTypes.SampleEntry:
@@ -243,6 +398,11 @@ class Image(Traversable):
 
     _path: ClassVar = []
     _parent: ClassVar = None
+    header_only: bool = False
+
+
+    def set_header_only(self, header_only: bool):
+        self.header_only = header_only
 
 
     def combine_stereo_routine(
@@ -1,7 +1,10 @@
 from dataclasses import dataclass
+from io import IOBase
+from io import SEEK_SET
 import numpy as np
 from typing import Callable
 from typing import List
+from typing import Optional
 from typing import Tuple
 
 from smpl_extract.data_streams import DataStream
@@ -9,7 +12,14 @@ from smpl_extract.data_streams import NoDataStream
 from smpl_extract.data_streams import IncompatibleNumberOfChannels
 from smpl_extract.data_streams import StreamEncoding
 from smpl_extract.data_streams import system_byte_order
+from smpl_extract.util.extent import get_file_extents
+from smpl_extract.util.extent import truncate_extents
+from smpl_extract.util.stream import copy_range
+from smpl_extract.util.stream import get_fileno
 from smpl_extract.util.stream import SectorReadError
+from smpl_extract.util.stream import StreamWrapper
+from smpl_extract.util.stream import read_view
+from smpl_extract.util.stream import readinto
 
 
 _DEFAULT_BUFFER_SIZE = 0x1000
@@ -57,17 +67,40 @@ def pad_channels(channels: List[np.ndarray]) -> List[np.ndarray]:
     return result_channels
 
 
+def make_buffers(buffer_sizes: List[int]) -> List[bytearray]:
+    result = list(bytearray(x) for x in buffer_sizes)
+    return result
+
+
+def read_frame(
+        stream: DataStream,
+        size: int,
+        buffer: Optional[bytearray] = None
+) -> memoryview:
+    if buffer is None:
+        result = read_view(stream.stream, size)
+    else:
+        view = memoryview(buffer)[:size]
+        read_size = readinto(stream.stream, view)
+        result = view[:read_size]
+    return result
+
+
 def decode_frame(
         streams: List[DataStream], 
-        buffer_sizes: List[int]
+        buffer_sizes: List[int],
+        buffers: Optional[List[bytearray]] = None
 ) -> List[np.ndarray]:
 
     channels: List[np.ndarray] = []
 
-    for stream, size in zip(streams, buffer_sizes):
+    if buffers is None:
+        buffers = [None] * len(streams)  # type: ignore
+
+    for stream, size, reusable_buffer in zip(streams, buffer_sizes, buffers):
         dtype = stream.encoding.dtype
         num_channels = max(1, stream.encoding.num_interleaved_channels)
-        buffer = stream.stream.read(size)
+        buffer = read_frame(stream, size, reusable_buffer)
         buffer = resize_buffer(buffer, stream.frame_size)
 
         if buffer is None or len(buffer) <= 0:
@@ -93,6 +126,29 @@ def encode_frame(channels: List[np.ndarray], dest_dtype: np.dtype) -> bytes:
     return result
 
 
+def make_output_buffer(
+        num_frames: int, 
+        num_channels: int, 
+        dest_dtype: np.dtype
+) -> np.ndarray:
+    result = np.empty((num_frames, num_channels), dtype=dest_dtype)
+    return result
+
+
+# the returned view is only valid until output is encoded into again
+def encode_frame_into(
+        channels: List[np.ndarray], 
+        output: np.ndarray
+) -> memoryview:
+    if any(len(x) != len(channels[0]) for x in channels):
+        channels = pad_channels(channels)
+    frames = output[:len(channels[0])]
+    for i, channel in enumerate(channels):
+        np.copyto(frames[:, i], channel, casting="unsafe")
+    result = memoryview(frames).cast("B")
+    return result
+
+
 def swap_endianess(channels: List[np.ndarray]) -> List[np.ndarray]:
     result = list(x.byteswap() for x in channels)
     return result
@@ -137,6 +193,48 @@ class PassthroughTranscoder:
         return buffer
 
 
+    def copy_to(self, export_stream: IOBase) -> Optional[int]:
+        stream = self.data_stream.stream
+        if not isinstance(stream, StreamWrapper):
+            return None
+        if stream.end_of_file is None or stream.end_of_file <= 0:
+            return None
+        dest_fileno = get_fileno(export_stream)
+        if dest_fileno is None:
+            return None
+        file_extents = get_file_extents(
+            stream, 
+            stream.position, 
+            stream.end_of_file - stream.position
+        )
+        if file_extents is None:
+            return None
+        src_fileno, extents = file_extents
+
+        frame_size = self.data_stream.frame_size
+        total_size = sum(x[1] for x in extents)
+        num_frames = total_size // frame_size
+        extents = truncate_extents(extents, num_frames*frame_size)
+
+        export_stream.flush()
+        dest_offset = export_stream.tell()
+        result = 0
+        for address, size in extents:
+            num_copied = copy_range(
+                src_fileno, 
+                address, 
+                dest_fileno, 
+                dest_offset + result, 
+                size
+            )
+            result += num_copied
+            if num_copied < size:
+                break
+        export_stream.seek(dest_offset + result, SEEK_SET)
+        stream.seek(stream.end_of_file, SEEK_SET)
+        return result
+
+
 @dataclass
 class TranscodePipelineStruct:
     f_decode:       Callable[[List[DataStream]], List[np.ndarray]] 
@@ -145,6 +243,7 @@ class TranscodePipelineStruct:
             Callable[[List[np.ndarray]], List[np.ndarray]]
         ]]
     f_encode:       Callable[[List[np.ndarray]], bytes]
+    f_encode_into:  Callable[[List[np.ndarray]], memoryview]
 
 
 @dataclass
@@ -157,22 +256,45 @@ class PipelineTranscoder:
         return self
 
 
-    def __next__(self):
+    def _next_channels(self) -> Optional[List[np.ndarray]]:
         try:
             channels = self.pipeline.f_decode(self.data_streams)
         except SectorReadError:  # TODO: Create more robust handling for this
-            raise StopIteration
+            return None
         if any(len(x) <= 0 for x in channels):
-            raise StopIteration
+            return None
 
         for process in self.pipeline.processes:
             f_process = process[1]
             channels = f_process(channels)
+
+        result = channels
+        return result
+
+
+    def __next__(self):
+        channels = self._next_channels()
+        if channels is None:
+            raise StopIteration
         
         result = self.pipeline.f_encode(channels)
         return result
 
 
+    # encodes every frame into the same output buffer, so no block
+    # outlives the write it is passed to
+    def write_to(self, export_stream: IOBase) -> int:
+        result = 0
+        while True:
+            channels = self._next_channels()
+            if channels is None:
+                break
+            block = self.pipeline.f_encode_into(channels)
+            export_stream.write(block)
+            result += len(block)
+        return result
+
+
 def make_transcoder(
         data_streams: List[DataStream],
         dest_encoding: StreamEncoding
@@ -228,12 +350,24 @@ def make_transcoder(
 
     dest_dtype = dest_encoding.dtype
 
-    f_decode_frame = lambda x: decode_frame(x, buffer_sizes=buffer_sizes)
+    buffers = make_buffers(buffer_sizes)
+    f_decode_frame = lambda x: decode_frame(
+        x, 
+        buffer_sizes=buffer_sizes, 
+        buffers=buffers
+    )
+    output_buffer = make_output_buffer(
+        buffer_sizes[0] // data_streams[0].frame_size,
+        expected_num_channels,
+        dest_dtype
+    )
     f_encode_frame = lambda x: encode_frame(x, dest_dtype=dest_dtype)
+    f_encode_frame_into = lambda x: encode_frame_into(x, output_buffer)
     pipeline = TranscodePipelineStruct(
         f_decode_frame, 
         processes, 
-        f_encode_frame
+        f_encode_frame,
+        f_encode_frame_into
     )
 
     result = PipelineTranscoder(data_streams, pipeline)
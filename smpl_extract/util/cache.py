@@ -0,0 +1,166 @@
+from collections import OrderedDict
+from io import IOBase
+from io import SEEK_END
+from io import SEEK_SET
+from threading import Lock
+from typing import ClassVar
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+from .stream import StreamWrapper
+from .stream import pread_into
+
+
+DEFAULT_BLOCK_SIZE = 0x2000
+DEFAULT_MAX_BLOCKS = 0x800
+DEFAULT_BYPASS_SIZE = 0x10000
+
+
+class BlockCache:
+
+
+    def __init__(
+            self,
+            block_size: int = DEFAULT_BLOCK_SIZE,
+            max_blocks: int = DEFAULT_MAX_BLOCKS
+    ) -> None:
+        self.block_size = block_size
+        self.max_blocks = max_blocks
+        self.blocks: OrderedDict[int, bytes] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = Lock()
+
+
+    def __len__(self) -> int:
+        return len(self.blocks)
+
+
+    def get(self, block_index: int) -> Optional[bytes]:
+        with self.lock:
+            result = self.blocks.get(block_index)
+            if result is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self.blocks.move_to_end(block_index)
+        return result
+
+
+    def put(self, block_index: int, block: bytes):
+        if self.max_blocks <= 0:
+            return
+
+        with self.lock:
+            self.blocks[block_index] = block
+            self.blocks.move_to_end(block_index)
+            while len(self.blocks) > self.max_blocks:
+                self.blocks.popitem(last=False)
+                self.evictions += 1
+
+
+    def clear(self):
+        with self.lock:
+            self.blocks.clear()
+
+
+class CachedStream(StreamWrapper):
+    flattenable: ClassVar[bool] = False
+    shares_addresses: ClassVar[bool] = True
+
+
+    def __init__(
+            self,
+            substream:      IOBase,
+            cache:          Optional[BlockCache] = None,
+            bypass_size:    int = DEFAULT_BYPASS_SIZE,
+            position:       int = 0,
+            buffer_length:  int = 0x1000
+    ) -> None:
+
+        # get parent size
+        offset = substream.tell()
+        substream.seek(0, SEEK_END)
+        size = substream.tell()
+        substream.seek(offset, SEEK_SET)
+
+        super().__init__(
+            substream,
+            size,
+            position=position,
+            buffer_length=buffer_length
+        )
+        self.cache = cache if cache is not None else BlockCache()
+        self.bypass_size = bypass_size
+        self.current_block: Tuple[int, bytes] = (0, b"")
+
+
+    def _get_block(self, block_index: int) -> bytes:
+        result = self.cache.get(block_index)
+        if result is None:
+            block_size = self.cache.block_size
+            buffer = bytearray(block_size)
+            read_size = pread_into(
+                self.substream, 
+                block_index * block_size, 
+                memoryview(buffer)
+            )
+            result = bytes(buffer[:read_size])
+            self.cache.put(block_index, result)
+        return result
+
+
+    def _pread(self, address: int, size: int) -> Union[bytes, memoryview]:
+        block_start, block = self.current_block
+        block_offset = address - block_start
+        if block_offset < 0 or block_offset + size > len(block):
+            block_index, block_offset = divmod(address, self.cache.block_size)
+            if block_offset + size > self.cache.block_size:
+                buffer = memoryview(bytearray(size))
+                read_size = self._readinto_at(address, buffer)
+                result = buffer[:read_size]
+                return result
+
+            block = self._get_block(block_index)
+            self.current_block = (block_index * self.cache.block_size, block)
+
+        result = block[block_offset:block_offset + size]
+        return result
+
+
+    def _readinto_at(self, address: int, buffer: memoryview) -> int:
+        read_size = len(buffer)
+        if read_size >= self.bypass_size:
+            result = pread_into(self.substream, address, buffer)
+            return result
+
+        block_size = self.cache.block_size
+        result = 0
+        while result < read_size:
+            block_index, block_offset = divmod(address + result, block_size)
+            block = memoryview(self._get_block(block_index))
+            chunk = block[block_offset:block_offset + read_size - result]
+            if len(chunk) <= 0:
+                break
+            buffer[result:result + len(chunk)] = chunk
+            result += len(chunk)
+        return result
+
+
+    def read(self, size: Union[int, None] = -1) -> bytes:
+
+        # consecutive small reads usually land in the same block
+        block_start, block = self.current_block
+        block_offset = self.position - block_start
+        if size is not None and 0 <= size and 0 <= block_offset \
+                and block_offset + size <= len(block):
+            self.position += size
+            result = block[block_offset:block_offset + size]
+            return result
+
+        result = super().read(size)
+        return result
+
@@ -1,6 +1,7 @@
 from collections import namedtuple
 from construct.core import Adapter
 from construct.core import Array
+from construct.core import Construct
 from construct.core import ConstructError
 from construct.core import Enum as EnumConstruct
 from construct.core import evaluate
@@ -9,6 +10,8 @@ from construct.core import Mapping
 from construct.core import MappingError
 from construct.core import RangeError
 from construct.core import Slicing
+from construct.core import stream_seek
+from construct.core import stream_tell
 from construct.core import Subconstruct
 from construct.core import Sequence
 from construct.lib.containers import Container
@@ -87,7 +90,7 @@ ChildInfo = namedtuple("ChildInfo", [
 ])
 
 
-def _pull_from_context(context: Dict[str, Any], key: str, default = None):
+def pull_from_context(context: Dict[str, Any], key: str, default = None):
     current_context = context
     for i in range(2):
         if key in current_context.keys():
@@ -100,6 +103,38 @@ def _pull_from_context(context: Dict[str, Any], key: str, default = None):
     return result
 
 
+def find_in_context(context: Dict[str, Any], key: str, default = None):
+    current_context = context
+    while current_context is not None:
+        if key in current_context.keys():
+            result = current_context[key]
+            return result
+        current_context = current_context.get("_", None)
+    result = default
+    return result
+
+
+def get_root_context(context: Dict[str, Any]) -> Dict[str, Any]:
+    result = context
+    while result.get("_", None) is not None:
+        result = result["_"]
+    return result
+
+
+def find_or_parse_in_context(
+        key: str, 
+        subcon: Construct, 
+        stream, 
+        context: Dict[str, Any], 
+        path
+):
+    result = find_in_context(context, key)
+    if result is None:
+        result = subcon._parsereport(stream, context, path)  # type: ignore
+        get_root_context(context)[key] = result
+    return result
+
+
 def pull_child_info(context: Dict[str, Any], name: Optional[str] = None) -> ChildInfo:
     parent = None
     parent_path = []
@@ -108,9 +143,9 @@ def pull_child_info(context: Dict[str, Any], name: Optional[str] = None) -> Chil
 
     # name
     if name is None:
-        name = _pull_from_context(context, "_elem_name", None)
+        name = pull_from_context(context, "_elem_name", None)
     # parent
-    parent = _pull_from_context(context, "_elem_parent", None)
+    parent = pull_from_context(context, "_elem_parent", None)
     # parent_path
     if parent is not None:
         parent_path = parent.path
@@ -120,7 +155,7 @@ def pull_child_info(context: Dict[str, Any], name: Optional[str] = None) -> Chil
     else:
         resultant_path = parent_path
     # routines
-    routines = _pull_from_context(context, "_elem_routines", [])
+    routines = pull_from_context(context, "_elem_routines", [])
 
     result = ChildInfo(
         parent=parent, 
@@ -159,6 +194,25 @@ class ElementAdapter(Adapter):
         return result
 
 
+    @classmethod
+    def wrap_child_lookup(
+        cls,
+        f_lookup: Callable[[Any], Element],
+        context: Dict[str, Any]
+    ) -> Callable[[Dict[str, Any], Any], Element]:
+
+
+        def wrapped_lookup(context_additions: Dict[str, Any], key) -> Element:
+            for context_key, value in context_additions.items():
+                context[context_key] = value
+            result_wrapped = f_lookup(key)
+            return result_wrapped
+
+
+        result = wrapped_lookup
+        return result
+
+
     def _decode(self, obj, context, path):
         name = None
         if self.name_key is not None and self.name_key in context.keys():
@@ -370,6 +424,61 @@ class SafeListConstruct(Array):
         return list(obj.values())
 
 
+class CachedConstruct(Subconstruct):
+
+
+    def __init__(self, cache_name: str, key_expr, subcon) -> None:
+        super().__init__(subcon)  # type: ignore
+        self.cache_name = cache_name
+        self.key_expr = key_expr
+
+
+    def _parse(self, stream, context, path):
+        root_context = get_root_context(context)
+        if self.cache_name not in root_context.keys():
+            root_context[self.cache_name] = {}
+        cache = root_context[self.cache_name]
+
+        key = evaluate(self.key_expr, context)
+        if key not in cache.keys():
+            cache[key] = self.subcon._parsereport(  # type: ignore
+                stream, 
+                context, 
+                path
+            )
+        result = cache[key]
+        return result
+
+
+class LookupConstruct(Subconstruct):
+
+
+    def __init__(self, key_name: str, subcon) -> None:
+        super().__init__(subcon)  # type: ignore
+        self.key_name = key_name
+
+
+    def _parse(self, stream, context, path):
+
+
+        def lookup(key):
+            fallback = stream_tell(stream, path)
+            lookup_context = Container(context)
+            lookup_context[self.key_name] = key
+            try:
+                result = self.subcon._parsereport(  # type: ignore
+                    stream, 
+                    lookup_context, 
+                    path
+                )
+            finally:
+                stream_seek(stream, fallback, 0, path)
+            return result
+
+
+        return lookup
+
+
 class UnsizedConstruct(Subconstruct):
 
 
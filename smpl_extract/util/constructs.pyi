@@ -60,6 +60,36 @@ ChildInfo = namedtuple("ChildInfo", [
 ])
 
 
+def pull_from_context(
+    context: Dict[str, Any], 
+    key: str, 
+    default: Any = None
+) -> Any:
+    ...
+
+
+def find_in_context(
+    context: Dict[str, Any], 
+    key: str, 
+    default: Any = None
+) -> Any:
+    ...
+
+
+def get_root_context(context: Dict[str, Any]) -> Dict[str, Any]:
+    ...
+
+
+def find_or_parse_in_context(
+    key: str, 
+    subcon: Construct, 
+    stream: Any, 
+    context: Dict[str, Any], 
+    path: Any
+) -> Any:
+    ...
+
+
 def pull_child_info(
     context: Dict[str, Any], 
     name: Optional[str] = None
@@ -87,6 +117,15 @@ class ElementAdapter(Adapter):
         ...
 
 
+    @classmethod
+    def wrap_child_lookup(
+        cls,
+        f_lookup: Callable[[Any], Element],
+        context: Dict[str, Any]
+    ) -> Callable[[Dict[str, Any], Any], Element]:
+        ...
+
+
     def _decode_element(
             self, 
             obj, 
@@ -209,5 +248,21 @@ class SafeListConstruct(Array):
     ) -> SafeListConstruct: ...
 
 
+class CachedConstruct(Subconstruct):
+    cache_name: str
+    key_expr: ConstantOrContextLambda[Any]
+    def __init__(
+            self, 
+            cache_name: str, 
+            key_expr: ConstantOrContextLambda[Any], 
+            subcon: Construct
+    ) -> None: ...
+
+
+class LookupConstruct(Subconstruct):
+    key_name: str
+    def __init__(self, key_name: str, subcon: Construct) -> None: ...
+
+
 class UnsizedConstruct(Subconstruct): ...
 
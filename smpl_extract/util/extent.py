@@ -0,0 +1,211 @@
+from bisect import bisect_right
+from io import IOBase
+import os
+import stat
+from typing import Any
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from .sector import SpanStream
+from .stream import get_fileno
+from .stream import StreamReversed
+from .stream import StreamWrapper
+
+
+Extent = Tuple[int, int]
+
+
+def coalesce_extents(extents: List[Extent]) -> List[Extent]:
+    result: List[Extent] = []
+    for address, length in extents:
+        if length <= 0:
+            continue
+        if len(result) > 0:
+            extent_address, extent_length = result[-1]
+            if extent_address + extent_length == address:
+                result[-1] = (extent_address, extent_length + length)
+                continue
+        result.append((address, length))
+    return result
+
+
+def get_extent_starts(extents: List[Extent]) -> List[int]:
+    result = []
+    extent_start = 0
+    for _, extent_length in extents:
+        result.append(extent_start)
+        extent_start += extent_length
+    return result
+
+
+def get_extent_spans(
+        extents: List[Extent],
+        extent_starts: List[int],
+        content_address: int,
+        size: int
+) -> List[Extent]:
+    result = []
+    extent_index = bisect_right(extent_starts, content_address) - 1
+    remaining_size = size
+    while remaining_size > 0 and 0 <= extent_index < len(extents):
+        extent_address, extent_length = extents[extent_index]
+        extent_offset = content_address - extent_starts[extent_index]
+        span_size = min(remaining_size, extent_length - extent_offset)
+        if span_size <= 0:
+            break
+        result.append((extent_address + extent_offset, span_size))
+
+        content_address += span_size
+        remaining_size -= span_size
+        extent_index += 1
+
+    return result
+
+
+class ExtentStream(SpanStream):
+
+
+    def __init__(
+            self,
+            substream:      IOBase,
+            extents:        List[Extent],
+            size:           int = -1,
+            position:       int = 0,
+            buffer_length:  int = 0x1000
+    ) -> None:
+        if size < 0:
+            size = sum(x[1] for x in extents)
+        super().__init__(
+            substream,
+            size,
+            position=position,
+            buffer_length=buffer_length
+        )
+        self.extents = extents
+        self.extent_starts = get_extent_starts(extents)
+
+
+    def _get_spans(
+            self, 
+            content_address: int, 
+            size: int
+    ) -> List[Extent]:
+        result = get_extent_spans(
+            self.extents,
+            self.extent_starts,
+            content_address,
+            size
+        )
+        return result
+
+
+def get_root_extents(
+        stream: IOBase, 
+        address: int, 
+        size: int
+) -> Tuple[IOBase, List[Extent]]:
+    spans = [(address, size)]
+    while isinstance(stream, StreamWrapper) and stream.flattenable:
+        parent_spans = []
+        for span_address, span_size in spans:
+            if stream.end_of_file is not None and stream.end_of_file > 0:
+                span_size = min(span_size, stream.end_of_file - span_address)
+            if span_size <= 0:
+                continue
+            parent_spans += stream._get_spans(span_address, span_size)
+        spans = parent_spans
+        stream = stream.substream
+
+    result = coalesce_extents(spans)
+    return stream, result
+
+
+def flatten_stream(stream: IOBase) -> IOBase:
+    if isinstance(stream, StreamReversed):
+        result = StreamReversed(
+            flatten_stream(stream.substream),
+            stream.end_of_file,
+            sample_width=stream.sample_width,
+            position=stream.position,
+            buffer_length=stream.buffer_length,
+            read_ahead=stream.read_ahead
+        )
+        return result
+
+    if not isinstance(stream, StreamWrapper) or not stream.flattenable:
+        return stream
+    if stream.end_of_file is None or stream.end_of_file <= 0:
+        return stream
+
+    root, extents = get_root_extents(stream, 0, stream.end_of_file)
+    result = ExtentStream(
+        root,
+        extents,
+        size=stream.end_of_file,
+        position=stream.position,
+        buffer_length=stream.buffer_length
+    )
+    return result
+
+
+def get_stream_source(stream: IOBase) -> Optional[Tuple[Any, ...]]:
+    if isinstance(stream, StreamReversed):
+        substream_source = get_stream_source(stream.substream)
+        if substream_source is None:
+            return None
+        result = (
+            "reversed", 
+            stream.sample_width, 
+            stream.end_of_file, 
+            stream.position,
+            substream_source
+        )
+        return result
+
+    if not isinstance(stream, StreamWrapper) or not stream.flattenable:
+        return None
+    if stream.end_of_file is None or stream.end_of_file <= 0:
+        return None
+
+    root, extents = get_root_extents(
+        stream, 
+        stream.position, 
+        stream.end_of_file - stream.position
+    )
+    result = (root, tuple(extents))
+    return result
+
+
+def get_file_extents(
+        stream: IOBase, 
+        address: int, 
+        size: int
+) -> Optional[Tuple[int, List[Extent]]]:
+    if isinstance(stream, StreamReversed):
+        return None
+
+    root, extents = get_root_extents(stream, address, size)
+    # views such as caches and mappings read the file at the same addresses
+    while isinstance(root, StreamWrapper) and root.shares_addresses:
+        root = root.substream
+    if isinstance(root, StreamWrapper):
+        return None
+    fileno = get_fileno(root)
+    if fileno is None:
+        return None
+    file_stat = os.fstat(fileno)
+    if not stat.S_ISREG(file_stat.st_mode):
+        return None
+
+    # leave reads past the end of the file to the regular read path
+    if any(x[0] + x[1] > file_stat.st_size for x in extents):
+        return None
+
+    result = (fileno, extents)
+    return result
+
+
+def truncate_extents(extents: List[Extent], size: int) -> List[Extent]:
+    result = get_extent_spans(extents, get_extent_starts(extents), 0, size)
+    return result
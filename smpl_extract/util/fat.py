@@ -1,8 +1,16 @@
-from dataclasses import dataclass
 from io import IOBase
+import numpy as np
+from typing import cast
+from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import Union
 
+from smpl_extract.util.extent import coalesce_extents
+from smpl_extract.util.extent import get_extent_spans
+from smpl_extract.util.extent import get_extent_starts
 from smpl_extract.util.sector import SectorStream
 
 
@@ -30,6 +38,8 @@ class FileStream(SectorStream):
             buffer_length=buffer_length
         )
         self.sector_list = sector_list
+        self.extents = compile_extents(sector_list, sector_size)
+        self.extent_starts = get_extent_starts(self.extents)
 
     
     def _get_address_given_sector_index(
@@ -45,30 +55,101 @@ class FileStream(SectorStream):
         return result
 
 
-@dataclass
-class SectorLink:
-    next:   int     = 0
-    end:    bool    = True
+    def _get_spans(
+            self, 
+            content_address: int, 
+            size: int
+    )->List[Tuple[int, int]]:
+        result = get_extent_spans(
+            self.extents,
+            self.extent_starts,
+            content_address,
+            size
+        )
+        return result
+
+
+def compile_extents(
+        sector_list: List[int], 
+        sector_size: int
+)->List[Tuple[int, int]]:
+    extents = [(x * sector_size, sector_size) for x in sector_list]
+    result = coalesce_extents(extents)
+    return result
+
+
+SECTOR_LINK_END = -1
+
+
+SectorRun = Tuple[int, int]
+
+
+def make_sector_links(size: int)->np.ndarray:
+    result = np.full(size, SECTOR_LINK_END, dtype=np.dtype("int32"))
+    return result
 
 
 def add_to_sector_links(
-        links_arg:      List[int], 
-        sector_links:   List[SectorLink]
+        links_arg:      Union[List[int], np.ndarray], 
+        sector_links:   np.ndarray
     ):
 
-    links_iter = iter(links_arg)
-    prev_link = next(links_iter)
-    try:
-        for link in links_iter:
-            sector_links[prev_link] = SectorLink(next=link, end=False)
-            prev_link = link
-        sector_links[prev_link] = SectorLink(next=0, end=True)
+    links = np.asarray(links_arg, dtype=np.dtype("int64"))
+    if len(links) < 1:
+        return
 
-    except IndexError as e:
+    invalid = np.flatnonzero((links < 0) | (links >= len(sector_links)))
+    if len(invalid) > 0:
         raise InvalidFatDefinition(
-            f"FAT entry {prev_link} exceeds total "
+            f"FAT entry {links[invalid[0]]} exceeds total "
             f"number of FAT entries {len(sector_links)}."
-        ) from e
+        )
+
+    sector_links[links[:-1]] = links[1:]
+    sector_links[links[-1]] = SECTOR_LINK_END
+
+
+def walk_chain(next_links: List[int], starting_sector: int)->List[int]:
+    path = []
+    current_sector = starting_sector
+    while current_sector != SECTOR_LINK_END:
+        # a chain can visit each sector once; anything longer is a loop
+        if len(path) >= len(next_links):
+            raise InvalidFatDefinition(
+                "Broken FAT. Loop? Sector path exceeds size?"
+            )
+        if not 0 <= current_sector < len(next_links):
+            raise InvalidFatDefinition(
+                f"FAT entry {current_sector} exceeds total "
+                f"number of FAT entries {len(next_links)}."
+            )
+        path.append(current_sector)
+        current_sector = next_links[current_sector]
+    return path
+
+
+def get_sector_runs(path: List[int])->List[SectorRun]:
+    if len(path) < 1:
+        return []
+
+    sectors = np.array(path, dtype=np.dtype("int64"))
+    run_starts = np.flatnonzero(np.diff(sectors) != 1) + 1
+    run_starts = np.concatenate(([0], run_starts))
+    run_lengths = np.diff(np.concatenate((run_starts, [len(sectors)])))
+    result = list(zip(
+        sectors[run_starts].tolist(), 
+        run_lengths.tolist()
+    ))
+    return result
+
+
+def expand_sector_runs(runs: List[SectorRun])->List[int]:
+    result = [
+        sector 
+        for first_sector, num_sectors in runs 
+        for sector in range(first_sector, first_sector + num_sectors)
+    ]
+    return result
 
 
 class FileAllocationTable:
@@ -78,35 +159,76 @@ class FileAllocationTable:
             self,
             parent_stream: IOBase,
             size: int = 0,
-            sector_links: Optional[List[SectorLink]] = None
+            sector_links: Optional[np.ndarray] = None
     ) -> None:
         self.parent_stream = parent_stream
         self.size = size
-        self.sector_links = sector_links or []
+        if sector_links is None:
+            sector_links = make_sector_links(size)
+        self.sector_links = np.asarray(sector_links, dtype=np.dtype("int32"))
+        self.chains: Optional[Dict[int, List[SectorRun]]] = None
+        self.broken_chains: Set[int] = set()
+        self.cross_links: Set[int] = set()
+
+
+    def _resolve_chains(self):
+        links = self.sector_links
+        linked = np.flatnonzero(links != SECTOR_LINK_END)
+        targets = links[linked]
+        targets = targets[(targets >= 0) & (targets < len(links))]
+        in_degree = np.bincount(targets, minlength=len(links))
+        heads = linked[in_degree[linked] == 0]
+
+        next_links = links.tolist()
+        chains = {}
+        broken_chains = set()
+        for head in heads.tolist():
+            try:
+                chains[head] = get_sector_runs(walk_chain(next_links, head))
+            except InvalidFatDefinition:
+                broken_chains.add(head)
+
+        self.chains = chains
+        self.broken_chains = broken_chains
+        self.cross_links = set(np.flatnonzero(in_degree > 1).tolist())
+
+
+    def get_extents(
+            self, 
+            starting_sector: int
+    )->List[SectorRun]:
+
+        if not 0 <= starting_sector < len(self.sector_links):
+            raise RequestedInvalidSector
+
+        if self.chains is None:
+            self._resolve_chains()
+        chains = cast(Dict[int, List[SectorRun]], self.chains)
+
+        if starting_sector in self.broken_chains:
+            raise InvalidFatDefinition(
+                "Broken FAT. Loop? Sector path exceeds size?"
+            )
+
+        result = chains.get(starting_sector)
+        if result is None:
+            # sectors in the middle of a chain or outside of any chain
+            if self.sector_links[starting_sector] == SECTOR_LINK_END:
+                return [(starting_sector, 1)]
+            try:
+                path = walk_chain(self.sector_links.tolist(), starting_sector)
+            except InvalidFatDefinition:
+                self.broken_chains.add(starting_sector)
+                raise
+            result = get_sector_runs(path)
+            chains[starting_sector] = result
+
+        return result
 
     
     def get_path(
             self, 
             starting_sector: int
     )->List[int]:
-
-        path = []
-        current_sector = starting_sector
-
-        loop_cnt = 0
-        while loop_cnt < self.size:
-            if current_sector >= len(self.sector_links):
-                raise RequestedInvalidSector
-
-            path.append(current_sector)
-            sector_link = self.sector_links[current_sector]
-
-            if sector_link.end:
-                break
-            current_sector = sector_link.next
-
-        if loop_cnt >= self.size:
-            raise InvalidFatDefinition("Broken FAT. Loop? Sector path exceeds size?")
-
-        return path
-
+        result = expand_sector_runs(self.get_extents(starting_sector))
+        return result
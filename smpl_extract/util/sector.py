@@ -1,12 +1,78 @@
+from abc import ABCMeta
+from abc import abstractmethod
 from io import IOBase
-from io import SEEK_SET
+from typing import List
+from typing import Tuple
+from typing import Union
 
-from .stream import AttemptToReadBeyondBuffer
 from .stream import SectorReadError
 from .stream import StreamWrapper
+from .stream import pread
+from .stream import pread_into
 
 
-class SectorStream(StreamWrapper):
+class SpanStream(StreamWrapper, metaclass=ABCMeta):
+
+
+    def __new__(cls, *args, **kwargs):
+        # unlike object, IOBase does not refuse abstract classes itself
+        if cls.__abstractmethods__:
+            abstract_names = ", ".join(sorted(cls.__abstractmethods__))
+            raise TypeError(
+                f"Can't instantiate abstract class {cls.__name__} "
+                f"with abstract methods {abstract_names}"
+            )
+        result = super().__new__(cls)
+        return result
+
+
+    @abstractmethod
+    def _get_spans(
+            self, 
+            content_address: int, 
+            size: int
+    )->List[Tuple[int, int]]: ...
+
+
+    def _pread(
+            self, 
+            address: int, 
+            size: int
+    )->Union[bytes, memoryview]:
+        pieces = [
+            pread(self.substream, parent_address, span_size)
+            for parent_address, span_size in self._get_spans(address, size)
+        ]
+
+        read_size = sum(len(x) for x in pieces)
+        if read_size != size:
+            raise SectorReadError(f"Wanted {size}, read {read_size}.")
+
+        if len(pieces) == 1:
+            return pieces[0]
+        result = b"".join(pieces)
+        return result
+
+
+    def _readinto_at(self, address: int, buffer: memoryview)->int:
+        result = 0
+        for parent_address, span_size in self._get_spans(address, len(buffer)):
+            read_size = pread_into(
+                self.substream, 
+                parent_address, 
+                buffer[result:result + span_size]
+            )
+            result += read_size
+            if read_size != span_size:
+                break
+
+        if result != len(buffer):
+            raise SectorReadError(f"Wanted {len(buffer)}, read {result}.")
+
+        return result
+
+
+class SectorStream(SpanStream):
 
 
     def __init__(
@@ -57,66 +123,26 @@ class SectorStream(StreamWrapper):
         return partition_address
 
 
-    def _read_sector(
+    def _get_spans(
             self, 
-            sector_index: int, 
-            offset: int, 
+            content_address: int, 
             size: int
-    )->bytes:
-        if offset + size > self.sector_length:
-            raise AttemptToReadBeyondBuffer("Reading too much")
-
-        start_address = self._get_address_given_sector_index(
-            sector_index, 
-            offset
-        )
-    
-        self.substream.seek(start_address, SEEK_SET)
-        result = self.substream.read(size)
-        return result
-
-    
-    def _read(self, size: int)->bytes:
-
+    )->List[Tuple[int, int]]:
+        result = []
         remaining_size = size
-
-        initial_sector_index    = self.position // self.sector_length
-        initial_sector_offset   = self.position % self.sector_length
-        
-        # read partial initial sector
-        if initial_sector_offset + size <= self.sector_length:
-            initial_read_size = size
-        else:
-            initial_read_size = self.sector_length - initial_sector_offset
-        result = self._read_sector(
-            initial_sector_index, 
-            initial_sector_offset, 
-            initial_read_size
-        )
-        remaining_size -= initial_read_size
-
-        # read full size middle sectors
-        i = 1
-        while remaining_size > self.sector_length:
-            result += self._read_sector(
-                initial_sector_index + i, 
-                0, 
-                self.sector_length
-            )
-            remaining_size -= self.sector_length
-            i += 1
-        
-        # read partial final sector
-        final_sector_index = initial_sector_index + i
-        if remaining_size > 0:
-            result += self._read_sector(
-                final_sector_index, 
-                0, 
-                remaining_size
+        while remaining_size > 0:
+            sector_index    = content_address // self.sector_length
+            sector_offset   = content_address % self.sector_length
+            span_size = min(remaining_size, self.sector_length - sector_offset)
+
+            parent_address = self._get_address_given_sector_index(
+                sector_index, 
+                sector_offset
             )
+            result.append((parent_address, span_size))
 
-        if len(result) != size:
-            raise SectorReadError(f"Wanted {size}, read {len(result)}.")
+            content_address += span_size
+            remaining_size -= span_size
 
         return result
 
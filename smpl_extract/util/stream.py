@@ -3,7 +3,13 @@ from io import IOBase
 from io import SEEK_CUR
 from io import SEEK_END
 from io import SEEK_SET
+import mmap
 import numpy as np
+import os
+from typing import ClassVar
+from typing import List
+from typing import Optional
+from typing import Tuple
 from typing import Type
 from typing import Union
 
@@ -15,6 +21,10 @@ class BadAlign(Exception): ...
 
 
 class StreamWrapper(IOBase):
+    flattenable: ClassVar[bool] = True
+    shares_addresses: ClassVar[bool] = False
+
+
     def __init__(
             self, 
             substream: IOBase,
@@ -26,21 +36,44 @@ class StreamWrapper(IOBase):
         self.end_of_file = size 
         self.position = position 
         self.buffer_length = buffer_length
-        self.true_size = buffer_length
 
 
     def _translate_addr(self, address: int)->int:
         return address
 
 
+    def _get_spans(
+            self, 
+            content_address: int, 
+            size: int
+    )->List[Tuple[int, int]]:
+        result = [(self._translate_addr(content_address), size)]
+        return result
+
+
     def _seek(self, address: int)->int:
+        result = self._translate_addr(address)
+        return result
+
+
+    def _get_read_size(self, address: int, size: int)->int:
+        result = size
+        if self.end_of_file is not None and self.end_of_file > 0:
+            result = min(self.end_of_file - address, size)
+        if result < 0:
+            result = 0
+        return result
+
+
+    def _pread(self, address: int, size: int)->Union[bytes, memoryview]:
         true_address = self._translate_addr(address)
-        result = self.substream.seek(true_address, SEEK_SET)
+        result = pread(self.substream, true_address, size)
         return result
 
 
-    def _read(self, size: int)->bytes:
-        result = self.substream.read(size)
+    def _readinto_at(self, address: int, buffer: memoryview)->int:
+        true_address = self._translate_addr(address)
+        result = pread_into(self.substream, true_address, buffer)
         return result
 
 
@@ -61,41 +94,59 @@ class StreamWrapper(IOBase):
         elif new_position < 0:
             new_position = 0
 
-        self.true_size = 0
         self._seek(new_position)
         self.position = new_position
         return new_position
 
 
-    def read(self, size: Union[int, None])->bytes:
+    def pread(self, address: int, size: int)->Union[bytes, memoryview]:
+        read_size = self._get_read_size(address, size)
+        result = self._pread(address, read_size)
+        return result
+
+
+    def readinto_at(self, address: int, buffer)->int:
+        view = memoryview(buffer).cast("B")
+        read_size = self._get_read_size(address, len(view))
+        result = self._readinto_at(address, view[:read_size])
+        return result
+
+
+    def read(self, size: Union[int, None] = -1)->bytes:
         
         if size is None or size < 0:
             return self.readall()
 
-        self.true_size = size
-        if self.end_of_file is not None and self.end_of_file > 0:
-            self.true_size = min(self.end_of_file - self.position, size)
-        if self.true_size < 0:
-            self.true_size = 0
+        result = bytes(self.pread(self.position, size))
+        self.position += len(result)
+        return result
+
+
+    def read_view(self, size: Union[int, None] = -1)->memoryview:
+
+        if size is None or size < 0:
+            return memoryview(self.readall())
+
+        result = memoryview(self.pread(self.position, size))
+        self.position += len(result)
+        return result
 
-        true_position = self.substream.tell()
-        expected_position = self._translate_addr(self.position)
-        if expected_position != true_position:
-            self._seek(self.position)
 
-        result = self._read(self.true_size)
-        self.position += self.true_size
+    def readinto(self, buffer)->int:
+        result = self.readinto_at(self.position, buffer)
+        self.position += result
         return result
 
 
     def readall(self)->bytes:
-        result = bytes()
+        reads = []
         while True:
             new_read = self.read(self.buffer_length)
             if len(new_read) < 1:
                 break
-            result += new_read
+            reads.append(new_read)
         
+        result = b"".join(reads)
         return result
 
 
@@ -125,6 +176,7 @@ class StreamOffset(StreamWrapper):
 
 
 class StreamReversed(StreamWrapper):
+    flattenable: ClassVar[bool] = False
 
 
     def __init__(
@@ -134,6 +186,7 @@ class StreamReversed(StreamWrapper):
             sample_width:   int = 1,
             position:       int = 0,
             buffer_length:  int = 0x1000,
+            read_ahead:     int = 0x10000
     ) -> None:
         super().__init__(
             substream,
@@ -142,15 +195,26 @@ class StreamReversed(StreamWrapper):
             buffer_length=buffer_length
         )
         self.sample_width = sample_width
+        self.read_ahead = max(
+            sample_width, 
+            read_ahead - (read_ahead % sample_width)
+        )
 
+        # the read-ahead block and the scratch buffer are per-stream state,
+        # readers that run concurrently should each wrap the substream
+        self.scratch = bytearray(self.read_ahead)
+        self.block = bytearray(self.read_ahead)
+        self.block_start = 0
+        self.block_size = 0
 
-    def _translate_addr(self, address: int) -> int:
-        if self.true_size % self.sample_width != 0:
+
+    def _translate_span(self, address: int, size: int) -> int:
+        if size % self.sample_width != 0:
             raise BadReadSize(
-                f"Read Size: {self.true_size} is not evenly "
+                f"Read Size: {size} is not evenly "
                 f"divisible by {self.sample_width}."
             )
-        true_address = self.end_of_file - (address + self.true_size)
+        true_address = self.end_of_file - (address + size)
         if true_address % self.sample_width != 0:
             raise BadAlign(
                 f"Position: {true_address} is not evenly "
@@ -158,22 +222,275 @@ class StreamReversed(StreamWrapper):
             )
         return true_address
 
-    
-    def _read(self, size: int) -> bytes:
-        raw = super()._read(size)
 
-        arr = np.frombuffer(raw, np.dtype("int8"))
+    def _seek(self, address: int) -> int:
+        result = self._translate_span(address, 0)
+        return result
+
+
+    def _reverse_into(self, source: memoryview, dest: memoryview):
         num_cols = self.sample_width
-        num_rows = size // self.sample_width
+        source_arr = np.frombuffer(source, np.dtype("int8"))
+        dest_arr = np.frombuffer(dest, np.dtype("int8"))
+        np.copyto(
+            dest_arr.reshape((-1, num_cols)), 
+            source_arr.reshape((-1, num_cols))[::-1]
+        )
+
+
+    def _read_reversed(self, address: int, dest: memoryview):
+        self._translate_span(address, len(dest))
+        scratch = memoryview(self.scratch)
+        for offset in range(0, len(dest), len(scratch)):
+            chunk = dest[offset:offset + len(scratch)]
+            size = len(chunk)
+            true_address = self._translate_span(address + offset, size)
+            raw = scratch[:size]
+            read_size = pread_into(self.substream, true_address, raw)
+            if read_size != size:
+                raise SectorReadError(f"Wanted {size}, read {read_size}.")
+            self._reverse_into(raw, chunk)
+
+
+    def _load_block(self, address: int):
+        self._translate_span(address, 0)
+        block_size = min(self.read_ahead, self.end_of_file - address)
+        self.block_size = 0
+        self._read_reversed(address, memoryview(self.block)[:block_size])
+        self.block_start = address
+        self.block_size = block_size
+
+
+    def _readinto_at(self, address: int, buffer: memoryview) -> int:
+        size = len(buffer)
+        if size >= self.read_ahead:
+            self._read_reversed(address, buffer)
+            return size
+        
+        self._translate_span(address, size)
+        block_offset = address - self.block_start
+        if block_offset < 0 or block_offset + size > self.block_size:
+            self._load_block(address)
+            block_offset = 0
+        block = memoryview(self.block)
+        buffer[:] = block[block_offset:block_offset + size]
+        return size
+
+
+    def _pread(self, address: int, size: int) -> memoryview:
+        result = memoryview(bytearray(size))
+        self._readinto_at(address, result)
+        return result
+
 
-        arr = np.reshape(arr, [num_rows, num_cols])
-        arr = np.flip(arr, 0)
-        arr = arr.flatten(order="C")
+class MappedStream(StreamWrapper):
+    flattenable: ClassVar[bool] = False
+    shares_addresses: ClassVar[bool] = True
 
-        result = arr.tobytes()
+
+    def __init__(
+            self,
+            substream:      IOBase,
+            position:       int = 0,
+            buffer_length:  int = 0x1000
+    ) -> None:
+        fileno = substream.fileno()
+        size = os.fstat(fileno).st_size
+        super().__init__(
+            substream,
+            size,
+            position=position,
+            buffer_length=buffer_length
+        )
+
+        # zero length files cannot be mapped
+        self.mapping = None
+        if size > 0:
+            self.mapping = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+            self.view = memoryview(self.mapping)
+        else:
+            self.view = memoryview(b"")
+
+
+    def _pread(self, address: int, size: int) -> memoryview:
+        result = self.view[address:address + size]
         return result
 
 
+    def _readinto_at(self, address: int, buffer: memoryview) -> int:
+        source = self.view[address:address + len(buffer)]
+        result = len(source)
+        buffer[:result] = source
+        return result
+
+
+    def close(self) -> None:
+        if self.mapping is not None:
+            self.view.release()
+            try:
+                self.mapping.close()
+            except BufferError:
+                pass  # views are still held by readers
+            self.mapping = None
+        super().close()
+
+
+def read_view(stream: IOBase, size: int) -> memoryview:
+    if isinstance(stream, StreamWrapper):
+        result = stream.read_view(size)
+    else:
+        result = memoryview(stream.read(size))
+    return result
+
+
+def readinto(stream: IOBase, buffer: memoryview) -> int:
+    f_readinto = getattr(stream, "readinto", None)
+    if f_readinto is not None:
+        result = f_readinto(buffer) or 0
+    else:
+        data = stream.read(len(buffer))
+        result = len(data)
+        buffer[:result] = data
+    return result
+
+
+def get_fileno(stream: IOBase) -> Optional[int]:
+    try:
+        result = stream.fileno()
+    except (AttributeError, OSError):
+        result = None
+    return result
+
+
+def get_remaining_size(stream: IOBase) -> Optional[int]:
+    if isinstance(stream, StreamWrapper):
+        if stream.end_of_file is None or stream.end_of_file <= 0:
+            return None
+        result = max(0, stream.end_of_file - stream.position)
+        return result
+
+    try:
+        if not stream.seekable():
+            return None
+        position = stream.tell()
+        end_of_file = stream.seek(0, SEEK_END)
+        stream.seek(position, SEEK_SET)
+    except (AttributeError, OSError):
+        return None
+    result = max(0, end_of_file - position)
+    return result
+
+
+_COPY_RANGE_CHUNK_SIZE = 0x1000000
+def _copy_range_chunk(
+        src_fileno: int,
+        src_offset: int,
+        dest_fileno: int,
+        dest_offset: int,
+        size: int
+) -> int:
+    if hasattr(os, "copy_file_range"):
+        try:
+            result = os.copy_file_range(
+                src_fileno, 
+                dest_fileno, 
+                size, 
+                src_offset, 
+                dest_offset
+            )
+            return result
+        except OSError:
+            pass  # e.g. unsupported across these file systems
+
+    if hasattr(os, "sendfile"):
+        try:
+            os.lseek(dest_fileno, dest_offset, SEEK_SET)
+            result = os.sendfile(dest_fileno, src_fileno, src_offset, size)
+            return result
+        except OSError:
+            pass
+
+    data = os.pread(src_fileno, size, src_offset)
+    result = os.pwrite(dest_fileno, data, dest_offset)
+    return result
+
+
+def copy_range(
+        src_fileno: int,
+        src_offset: int,
+        dest_fileno: int,
+        dest_offset: int,
+        size: int
+) -> int:
+    result = 0
+    while result < size:
+        num_copied = _copy_range_chunk(
+            src_fileno,
+            src_offset + result,
+            dest_fileno,
+            dest_offset + result,
+            min(size - result, _COPY_RANGE_CHUNK_SIZE)
+        )
+        if num_copied <= 0:
+            break
+        result += num_copied
+    return result
+
+
+def pread(
+        stream: IOBase, 
+        address: int, 
+        size: int
+) -> Union[bytes, memoryview]:
+    if isinstance(stream, StreamWrapper):
+        result = stream.pread(address, size)
+        return result
+
+    fileno = get_fileno(stream)
+    if fileno is None:
+        stream.seek(address, SEEK_SET)
+        result = stream.read(size)
+        return result
+
+    result = os.pread(fileno, size, address)
+    if len(result) < size:
+        reads = [result]
+        read_size = len(result)
+        while read_size < size:
+            data = os.pread(fileno, size - read_size, address + read_size)
+            if len(data) <= 0:
+                break
+            reads.append(data)
+            read_size += len(data)
+        result = b"".join(reads)
+    return result
+
+
+def pread_into(stream: IOBase, address: int, buffer: memoryview) -> int:
+    if isinstance(stream, StreamWrapper):
+        result = stream.readinto_at(address, buffer)
+        return result
+
+    fileno = get_fileno(stream)
+    if fileno is None:
+        stream.seek(address, SEEK_SET)
+        result = readinto(stream, buffer)
+        return result
+
+    result = 0
+    while result < len(buffer):
+        if hasattr(os, "preadv"):
+            read_size = os.preadv(fileno, [buffer[result:]], address + result)
+        else:
+            data = os.pread(fileno, len(buffer) - result, address + result)
+            read_size = len(data)
+            buffer[result:result + read_size] = data
+        if read_size <= 0:
+            break
+        result += read_size
+    return result
+
+
 def _singleton(x) -> Construct:
     y = x()
     return y
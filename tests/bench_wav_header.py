@@ -0,0 +1,83 @@
+from argparse import ArgumentParser
+from io import BytesIO
+import timeit
+
+from smpl_extract.data_streams import DataStream
+from smpl_extract.data_streams import StreamEncoding
+from smpl_extract.formats.wav import WavRiffChunkStruct
+from smpl_extract.generalized.sample import LoopRegion
+from smpl_extract.generalized.sample import Sample
+from smpl_extract.generalized.wav import get_dest_encoding
+from smpl_extract.generalized.wav import get_header_chunks
+from smpl_extract.generalized.wav import pack_header_chunks
+from smpl_extract.generalized.wav import WavSampleBuilder
+from smpl_extract.generalized.wav import write_wav
+from smpl_extract.midi import MidiNote
+
+
+# roughly a short AKAI floppy sample
+SAMPLE_DATA = bytes(0x2000)
+
+
+def make_sample() -> Sample:
+    result = Sample(
+        sample_rate=22050,
+        num_channels=1,
+        data_streams=[DataStream(
+            BytesIO(SAMPLE_DATA),
+            StreamEncoding(sample_width=2)
+        )],
+        loop_regions=[LoopRegion(start_sample=0x100, end_sample=0xF00)],
+        midi_note=MidiNote.from_string("C4"),
+        pitch_offset_cents=7
+    )
+    return result
+
+
+def build_header_construct():
+    sample = make_sample()
+    dest_encoding = get_dest_encoding(sample)
+    result = b"".join(
+        WavRiffChunkStruct.build(x)
+        for x in get_header_chunks(sample, dest_encoding)
+    )
+    return result
+
+
+def build_header_packed():
+    sample = make_sample()
+    result = pack_header_chunks(sample, get_dest_encoding(sample))
+    return result
+
+
+def write_file() -> bytes:
+    export_stream = BytesIO()
+    write_wav(make_sample(), export_stream)
+    result = export_stream.getvalue()
+    return result
+
+
+def main():
+    parser = ArgumentParser(
+        description="Per-file overhead of writing small WAV exports."
+    )
+    parser.add_argument("-n", "--number", type=int, default=5000)
+    args = parser.parse_args()
+
+    assert build_header_construct() == build_header_packed()
+    assert WavSampleBuilder.build(make_sample()) == write_file()
+
+    benchmarks = (
+        ("header (construct)",  build_header_construct),
+        ("header (struct)",     build_header_packed),
+        ("write_wav",           write_file)
+    )
+    for name, f_benchmark in benchmarks:
+        duration = min(timeit.repeat(f_benchmark, number=args.number, repeat=3))
+        per_file = 1e6*duration/args.number
+        print(f"{name:<20} {per_file:8.1f} us/file")
+    return
+
+
+if __name__ == "__main__":
+    main()
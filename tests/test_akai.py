@@ -1,7 +1,17 @@
+from construct.core import ConstructError
 from construct.core import RangeError
+import numpy as np
 import unittest
 
+from smpl_extract.akai.akai_string import _char_format_convert_byte
+from smpl_extract.akai.akai_string import akai_name_array_is_valid
+from smpl_extract.akai.akai_string import akai_name_array_to_ascii
+from smpl_extract.akai.akai_string import AkaiPaddedString
+from smpl_extract.akai.akai_string import char_akai_to_ascii
+from smpl_extract.akai.akai_string import char_ascii_to_akai
 from smpl_extract.akai.data_types import AKAI_PARTITION_MAGIC
+from smpl_extract.akai.data_types import CharFormat
+from smpl_extract.akai.data_types import InvalidCharacter
 from smpl_extract.akai.keygroup import KeygroupConstruct
 from smpl_extract.akai.keygroup import KeygroupContainer
 from smpl_extract.akai.keygroup import VelocityZoneContainer
@@ -80,6 +90,56 @@ class AkaiTest(unittest.TestCase):
         )
 
 
+class AkaiString_Test(unittest.TestCase):
+
+
+    def test_table_matches_byte_conversion(self):
+        for byte_in in range(0x100):
+            try:
+                expected = chr(_char_format_convert_byte(
+                    byte_in, 
+                    CharFormat.AKAI, 
+                    CharFormat.ASCII
+                ))
+            except InvalidCharacter:
+                with self.assertRaises(InvalidCharacter):
+                    char_akai_to_ascii(bytes([byte_in]))
+                continue
+            self.assertEqual(char_akai_to_ascii(bytes([byte_in])), expected)
+
+
+    def test_round_trip(self):
+        name = "PIANO #1+-.Z"
+        self.assertEqual(char_akai_to_ascii(char_ascii_to_akai(name)), name)
+        self.assertEqual(char_ascii_to_akai("piano"), char_ascii_to_akai("PIANO"))
+        with self.assertRaises(InvalidCharacter):
+            char_ascii_to_akai("PIANO!")
+
+
+    def test_padded_string(self):
+        data = char_ascii_to_akai("BASS 2      ")
+        self.assertEqual(AkaiPaddedString(12).parse(data), "BASS 2")
+        with self.assertRaises(ConstructError):
+            AkaiPaddedString(12).parse(b"\xff" * 12)
+
+
+    def test_name_array(self):
+        names = np.frombuffer(
+            char_ascii_to_akai("KICK        ") 
+            + b"\x0b" * 11 + b"\xff"
+            + char_ascii_to_akai("  SNARE 2   "),
+            np.uint8
+        ).reshape((3, 12))
+        self.assertEqual(
+            akai_name_array_is_valid(names).tolist(), 
+            [True, False, True]
+        )
+        self.assertEqual(
+            akai_name_array_to_ascii(names), 
+            ["KICK", None, "  SNARE 2"]
+        )
+
+
 if __name__ == "__main__":
     try:
         unittest.main()
@@ -0,0 +1,202 @@
+from construct.core import ConstructError
+from io import BytesIO
+import unittest
+from unittest.mock import MagicMock
+
+from smpl_extract.akai.akai_string import char_ascii_to_akai
+from smpl_extract.akai.data_types import AKAI_VOLUME_ENTRY_CNT
+from smpl_extract.akai.data_types import FILE_TABLE_END_FLAG
+from smpl_extract.akai.data_types import FileType
+from smpl_extract.akai.data_types import VolumeType
+from smpl_extract.structural import ErrorInvalidPath
+from smpl_extract.akai.file_entry import FileEntry
+from smpl_extract.akai.volume import Volume
+from smpl_extract.akai.volume import VolumeBodyConstruct
+from smpl_extract.akai.volume import VolumeEntryTableConstruct
+from smpl_extract.util.fat import InvalidFatDefinition
+from smpl_extract.util.fat import RequestedInvalidSector
+
+
+def make_name(name: str) -> bytes:
+    result = char_ascii_to_akai(name.ljust(12))
+    return result
+
+
+def make_volume_entry(name: str, volume_type: int, start: int) -> bytes:
+    result = make_name(name) \
+        + volume_type.to_bytes(2, "little") \
+        + start.to_bytes(2, "little")
+    return result
+
+
+def make_file_entry(
+        name: bytes, 
+        file_type: int, 
+        size: int, 
+        start: int
+) -> bytes:
+    result = name + b"\x00" * 4 \
+        + bytes([file_type]) \
+        + size.to_bytes(3, "little") \
+        + start.to_bytes(2, "little") \
+        + b"\x00" * 2
+    return result
+
+
+class AkaiVolumeTable_Test(unittest.TestCase):
+
+
+    def test_active_entries(self):
+        entries = [make_volume_entry("", 0, 0)] * AKAI_VOLUME_ENTRY_CNT
+        entries[0] = make_volume_entry("VOLUME 1", 0x01, 0x10)
+        entries[7] = make_volume_entry("VOLUME 2", 0x43, 0x20)
+        result = VolumeEntryTableConstruct.parse(b"".join(entries))
+        self.assertEqual(len(result), 2)
+        self.assertEqual(result[0].name, "VOLUME 1")
+        self.assertEqual(result[0].type, VolumeType.VOLUME_S1000)
+        self.assertEqual(result[0].start, 0x10)
+        self.assertEqual(result[1].name, "VOLUME 2")
+        self.assertEqual(result[1].type, VolumeType.VOLUME_S3000)
+        self.assertEqual(result[1].start, 0x20)
+
+
+    def test_unknown_volume_type(self):
+        entries = [make_volume_entry("", 0, 0)] * AKAI_VOLUME_ENTRY_CNT
+        entries[3] = make_volume_entry("VOLUME", 0x02, 0x10)
+        with self.assertRaises(ConstructError):
+            VolumeEntryTableConstruct.parse(b"".join(entries))
+
+
+class AkaiFileTable_Test(unittest.TestCase):
+
+
+    def setUp(self):
+        end_entry = bytearray(make_file_entry(make_name(""), 0, 0, 0))
+        end_entry[8:10] = FILE_TABLE_END_FLAG.to_bytes(2, "little")
+        entries = [
+            make_file_entry(make_name("SAMPLE A"), FileType.SAMPLE_S1000, 0x100, 3),
+            make_file_entry(make_name(""), 0, 0, 0),
+            make_file_entry(b"\xff" * 12, FileType.SAMPLE_S1000, 0x100, 4),
+            make_file_entry(make_name("BAD TYPE"), 0x01, 0x100, 5),
+            make_file_entry(make_name("PROGRAM B"), FileType.PROGRAM_S3000, 0x80, 6),
+            bytes(end_entry),
+            make_file_entry(make_name("AFTER END"), FileType.SAMPLE_S1000, 0x100, 7)
+        ]
+        self.table = b"".join(entries)
+
+
+    def test_entries(self):
+        sat = MagicMock()
+        result = VolumeBodyConstruct.parse_stream(
+            BytesIO(self.table), 
+            sat=sat
+        ).file_entries
+        self.assertEqual([x.name for x in result], ["SAMPLE A", "PROGRAM B"])
+        self.assertEqual(
+            [x.file_type for x in result], 
+            [FileType.SAMPLE_S1000, FileType.PROGRAM_S3000]
+        )
+        sat.get_segment.assert_not_called()
+
+
+    def test_entries_without_segment_are_skipped(self):
+        for error in (RequestedInvalidSector, InvalidFatDefinition):
+            def get_extents(start):
+                if start == 3:
+                    raise error
+                return [(start, 1)]
+
+            sat = MagicMock()
+            sat.get_extents.side_effect = get_extents
+            result = VolumeBodyConstruct.parse_stream(
+                BytesIO(self.table), 
+                sat=sat
+            ).file_entries
+            self.assertEqual([x.name for x in result], ["PROGRAM B"])
+
+
+class AkaiVolumeListing_Test(unittest.TestCase):
+
+
+    def setUp(self):
+        self.parsed = []
+
+        def make_entry(name, file_type, valid=True):
+            def parse():
+                self.parsed.append(name)
+                if not valid:
+                    raise ConstructError
+                result = MagicMock()
+                result.name = name
+                return result
+            result = FileEntry(name, file_type, parse)
+            return result
+
+        self.file_entries = [
+            make_entry("PROGRAM", FileType.PROGRAM_S1000),
+            make_entry("SAMPLE", FileType.SAMPLE_S3000),
+            make_entry("BROKEN", FileType.SAMPLE_S1000, valid=False),
+            make_entry("DRUMS", FileType.DRUM)
+        ]
+
+
+    def test_listing_does_not_parse(self):
+        volume = Volume(
+            "VOLUME", 
+            VolumeType.VOLUME_S1000, 
+            path=["A:", "VOLUME"],
+            file_entries=self.file_entries, 
+            header_only=True
+        )
+        children = volume.children
+        self.assertEqual(
+            [(x.name, x.type_name) for x in children],
+            [
+                ("PROGRAM", "S1000 Program"), 
+                ("SAMPLE", "S3000 Sample"), 
+                ("BROKEN", "S1000 Sample")
+            ]
+        )
+        self.assertEqual(children[1].path, ["A:", "VOLUME", "SAMPLE"])
+        self.assertEqual(self.parsed, [])
+
+        children[1].get_info()
+        self.assertEqual(self.parsed, ["SAMPLE"])
+        with self.assertRaises(ErrorInvalidPath):
+            children[2].get_info()
+
+
+    def test_full_parse(self):
+        volume = Volume(
+            "VOLUME", 
+            VolumeType.VOLUME_S1000, 
+            file_entries=self.file_entries
+        )
+        self.assertEqual(
+            [x.name for x in volume.children], 
+            ["PROGRAM", "SAMPLE", "DRUMS"]
+        )
+        self.assertEqual(len(self.parsed), 4)
+
+
+    def test_export_uses_parsed_files(self):
+        volume = Volume(
+            "VOLUME", 
+            VolumeType.VOLUME_S1000, 
+            path=["A:", "VOLUME"],
+            file_entries=self.file_entries, 
+            header_only=True
+        )
+        export_manager = MagicMock()
+        volume.export_samples(export_manager)
+
+        export_manager.set_level.assert_called_once_with(("A:", "VOLUME"))
+        export_manager.finish_level.assert_called_once()
+        self.assertEqual(len(self.parsed), 4)
+
+
+if __name__ == "__main__":
+    try:
+        unittest.main()
+    except SystemExit as e:
+        pass
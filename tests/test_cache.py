@@ -0,0 +1,90 @@
+from io import BytesIO
+from io import SEEK_SET
+import unittest
+
+from smpl_extract.util.cache import BlockCache
+from smpl_extract.util.cache import CachedStream
+from smpl_extract.util.stream import StreamOffset
+
+
+def generate_consecutive_bytes(size: int):
+    result = bytes(i % 0xFB for i in range(size))
+    return result
+
+
+class BlockCache_Test(unittest.TestCase):
+
+
+    def test_hit_and_miss_counters(self):
+        cache = BlockCache(block_size=0x10, max_blocks=4)
+        self.assertIsNone(cache.get(0))
+        cache.put(0, b"\x00" * 0x10)
+        self.assertIsNotNone(cache.get(0))
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 1)
+
+
+    def test_least_recently_used_is_evicted(self):
+        cache = BlockCache(block_size=0x10, max_blocks=2)
+        cache.put(0, b"a")
+        cache.put(1, b"b")
+        cache.get(0)
+        cache.put(2, b"c")
+        self.assertEqual(cache.evictions, 1)
+        self.assertEqual(cache.get(0), b"a")
+        self.assertIsNone(cache.get(1))
+
+
+class CachedStream_Test(unittest.TestCase):
+
+
+    def setUp(self):
+        self.data = generate_consecutive_bytes(0x1000)
+        self.cache = BlockCache(block_size=0x100, max_blocks=4)
+        self.stream = CachedStream(BytesIO(self.data), self.cache)
+
+
+    def test_read_across_blocks(self):
+        self.stream.seek(0xf0, SEEK_SET)
+        result = self.stream.read(0x220)
+        self.assertEqual(result, self.data[0xf0:0x310])
+        self.assertEqual(self.stream.tell(), 0x310)
+        self.assertEqual(self.cache.misses, 4)
+
+
+    def test_repeated_reads_hit_cache(self):
+        stream_offset = StreamOffset(self.stream, 0x200, 0x400)
+        for _ in range(3):
+            stream_offset.seek(0, SEEK_SET)
+            result = stream_offset.read(0x200)
+            self.assertEqual(result, self.data[0x400:0x600])
+        self.assertEqual(self.cache.misses, 2)
+        self.assertEqual(self.cache.hits, 4)
+
+
+    def test_small_reads(self):
+        self.stream.seek(0xfe, SEEK_SET)
+        result = b"".join(self.stream.read(2) for _ in range(4))
+        self.assertEqual(result, self.data[0xfe:0x106])
+
+
+    def test_read_past_end(self):
+        self.stream.seek(0xff0, SEEK_SET)
+        self.assertEqual(self.stream.read(0x20), self.data[0xff0:])
+        self.assertEqual(self.stream.read(0x20), b"")
+
+
+    def test_large_reads_bypass_cache(self):
+        stream = CachedStream(BytesIO(self.data), self.cache, bypass_size=0x800)
+        buffer = bytearray(0x800)
+        result = stream.readinto(buffer)
+        self.assertEqual(result, 0x800)
+        self.assertEqual(bytes(buffer), self.data[:0x800])
+        self.assertEqual(len(self.cache), 0)
+
+
+if __name__ == "__main__":
+    try:
+        unittest.main()
+    except SystemExit as e:
+        pass
@@ -0,0 +1,176 @@
+import csv
+from io import BytesIO
+import os
+import tempfile
+import unittest
+
+from smpl_extract.data_streams import DataStream
+from smpl_extract.data_streams import StreamEncoding
+from smpl_extract.generalized.sample import LoopRegion
+from smpl_extract.generalized.sample import Sample
+from smpl_extract.structural import ExportManager
+from smpl_extract.structural import LINK_MODE_HARDLINK
+from smpl_extract.structural import LINK_MODE_MAPPING
+from smpl_extract.structural import LINK_MODE_SYMLINK
+from smpl_extract.structural import SAMPLE_MAP_FILE_NAME
+from smpl_extract.util.stream import StreamOffset
+
+
+LINKS = [
+    ("Volume 0/Perf 0/Kick", "_Samples/Kick"),
+    ("Volume 0/Perf 1/Kick", "_Samples/Kick"),
+    ("Volume 1/Perf 2/Snare", "_Samples/Snare")
+]
+
+
+class ExportManagerLinks_Test(unittest.TestCase):
+
+
+    def test_mapping(self):
+        with tempfile.TemporaryDirectory() as output_directory:
+            export_manager = ExportManager(output_directory)
+            export_manager.write_links(LINKS, LINK_MODE_MAPPING)
+
+            map_path = os.path.join(output_directory, SAMPLE_MAP_FILE_NAME)
+            with open(map_path, "r", newline="", encoding="utf-8") as file:
+                rows = list(csv.reader(file))
+
+        self.assertEqual(rows[0], ["path", "sample"])
+        self.assertEqual(
+            rows[1:],
+            [[x + ".wav", y + ".wav"] for x, y in LINKS]
+        )
+
+
+    @unittest.skipUnless(hasattr(os, "symlink"), "symlinks unsupported")
+    def test_symlinks(self):
+        with tempfile.TemporaryDirectory() as output_directory:
+            os.makedirs(os.path.join(output_directory, "_Samples"))
+            for target in ("Kick", "Snare"):
+                target_path = os.path.join(output_directory, "_Samples", target)
+                with open(target_path + ".wav", "wb") as file:
+                    file.write(target.encode("ascii"))
+
+            export_manager = ExportManager(output_directory)
+            export_manager.write_links(LINKS, LINK_MODE_SYMLINK)
+            export_manager.write_links(LINKS, LINK_MODE_SYMLINK)
+
+            for link_path, target in LINKS:
+                total_path = os.path.join(output_directory, link_path) + ".wav"
+                self.assertTrue(os.path.islink(total_path))
+                self.assertFalse(os.path.isabs(os.readlink(total_path)))
+                with open(total_path, "rb") as file:
+                    self.assertEqual(file.read(), target[9:].encode("ascii"))
+
+
+ENCODING = StreamEncoding(sample_width=2)
+
+
+def make_sample(name, stream, loop_regions=None):
+    result = Sample(
+        name=name,
+        sample_rate=44100,
+        data_streams=[DataStream(stream, ENCODING)],
+        loop_regions=loop_regions or [],
+        _path=[name],
+        _export_name=name
+    )
+    return result
+
+
+def make_stream(root, address, size):
+    result = StreamOffset(root, size, address)
+    return result
+
+
+class ExportManagerDedup_Test(unittest.TestCase):
+
+
+    def _export(self, output_directory, samples, dedup_mode):
+        export_manager = ExportManager(output_directory, dedup_mode=dedup_mode)
+        export_manager.set_level(())
+        for sample in samples:
+            export_manager.add_sample(sample)
+        export_manager.finish_level()
+        export_manager.finish_export()
+
+
+    def _read(self, output_directory, name):
+        with open(os.path.join(output_directory, name + ".wav"), "rb") as file:
+            result = file.read()
+        return result
+
+
+    def test_source_identity(self):
+        root = BytesIO(bytes(range(0x100)) * 0x10)
+        samples = [
+            make_sample("a", make_stream(root, 0x100, 0x200)),
+            make_sample("b", make_stream(root, 0x100, 0x200)),
+            make_sample("c", make_stream(root, 0x200, 0x200)),
+            make_sample(
+                "d", 
+                make_stream(root, 0x100, 0x200), 
+                [LoopRegion(start_sample=1, end_sample=4)]
+            )
+        ]
+        with tempfile.TemporaryDirectory() as output_directory:
+            self._export(output_directory, samples, LINK_MODE_HARDLINK)
+            stats = {
+                name: os.stat(os.path.join(output_directory, name + ".wav"))
+                for name in ("a", "b", "c", "d")
+            }
+            self.assertEqual(stats["a"].st_ino, stats["b"].st_ino)
+            self.assertNotEqual(stats["a"].st_ino, stats["c"].st_ino)
+            self.assertNotEqual(stats["a"].st_ino, stats["d"].st_ino)
+            self.assertEqual(
+                self._read(output_directory, "a"), 
+                self._read(output_directory, "b")
+            )
+
+
+    def test_content_hash_fallback(self):
+        data = bytes(range(0x100))
+        samples = [
+            make_sample("a", BytesIO(data)),
+            make_sample("b", BytesIO(data)),
+            make_sample("c", BytesIO(data[::-1]))
+        ]
+        with tempfile.TemporaryDirectory() as output_directory:
+            self._export(output_directory, samples, LINK_MODE_MAPPING)
+            self.assertTrue(os.path.exists(
+                os.path.join(output_directory, "a.wav")
+            ))
+            self.assertFalse(os.path.exists(
+                os.path.join(output_directory, "b.wav")
+            ))
+            self.assertEqual(
+                len(self._read(output_directory, "c")),
+                len(self._read(output_directory, "a"))
+            )
+
+            map_path = os.path.join(output_directory, SAMPLE_MAP_FILE_NAME)
+            with open(map_path, "r", newline="", encoding="utf-8") as file:
+                rows = list(csv.reader(file))
+        self.assertEqual(rows, [["path", "sample"], ["b.wav", "a.wav"]])
+
+
+    def test_no_dedup_by_default(self):
+        root = BytesIO(bytes(0x400))
+        samples = [
+            make_sample("a", make_stream(root, 0, 0x200)),
+            make_sample("b", make_stream(root, 0, 0x200))
+        ]
+        with tempfile.TemporaryDirectory() as output_directory:
+            self._export(output_directory, samples, None)
+            stats = [
+                os.stat(os.path.join(output_directory, name + ".wav"))
+                for name in ("a", "b")
+            ]
+            self.assertNotEqual(stats[0].st_ino, stats[1].st_ino)
+
+
+if __name__ == "__main__":
+    try:
+        unittest.main()
+    except SystemExit as e:
+        pass
@@ -0,0 +1,90 @@
+from io import BytesIO
+from io import SEEK_SET
+import unittest
+
+from smpl_extract.util.extent import ExtentStream
+from smpl_extract.util.extent import coalesce_extents
+from smpl_extract.util.extent import flatten_stream
+from smpl_extract.util.fat import FileStream
+from smpl_extract.util.sector import SectorStream
+from smpl_extract.util.stream import StreamOffset
+from smpl_extract.util.stream import StreamReversed
+from smpl_extract.util.stream import StreamWrapper
+
+
+class FramedStream(SectorStream):
+
+
+    def __init__(self, parent_stream, size):
+        super().__init__(parent_stream, size, sector_length=0x10)
+
+    
+    def _get_address_given_sector_index(self, sector_index, offset):
+        result = sector_index * 0x18 + 0x4 + offset
+        return result
+
+
+def generate_consecutive_bytes(size: int):
+    result = bytes(i % 0xFD for i in range(size))
+    return result
+
+
+def read_all(stream):
+    stream.seek(0, SEEK_SET)
+    result = stream.read(-1)
+    return result
+
+
+class ExtentStream_Test(unittest.TestCase):
+
+
+    def setUp(self):
+        self.root = BytesIO(generate_consecutive_bytes(0x18 * 0x40))
+        framed = FramedStream(self.root, 0x10 * 0x40)
+        partition = StreamOffset(framed, 0x300, 0x40)
+        file = FileStream(partition, 0x20, [4, 5, 1, 2, 3, 9])
+        self.nested = StreamOffset(StreamWrapper(file, 0xb0), 0x80, 0x16)
+
+
+    def test_coalesce_extents(self):
+        extents = [(0x0, 0x10), (0x10, 0x8), (0x20, 0x4), (0x24, 0)]
+        result = coalesce_extents(extents)
+        self.assertEqual(result, [(0x0, 0x18), (0x20, 0x4)])
+
+
+    def test_flattened_chain_reads_from_root(self):
+        flat = flatten_stream(self.nested)
+        self.assertIsInstance(flat, ExtentStream)
+        self.assertIs(flat.substream, self.root)
+        self.assertEqual(read_all(flat), read_all(self.nested))
+
+
+    def test_flattened_chain_seek_read(self):
+        flat = flatten_stream(self.nested)
+        for position in (0x0, 0x7, 0x3f, 0x70):
+            flat.seek(position, SEEK_SET)
+            self.nested.seek(position, SEEK_SET)
+            self.assertEqual(flat.read(0x11), self.nested.read(0x11))
+
+
+    def test_flattened_chain_readinto(self):
+        flat = flatten_stream(self.nested)
+        buffer = bytearray(0x80)
+        result = flat.readinto(buffer)
+        self.assertEqual(result, 0x80)
+        self.assertEqual(bytes(buffer), read_all(self.nested))
+
+
+    def test_reversed_chain_keeps_reversal_on_top(self):
+        reversed_stream = StreamReversed(self.nested, 0x80, sample_width=2)
+        flat = flatten_stream(reversed_stream)
+        self.assertIsInstance(flat, StreamReversed)
+        self.assertIsInstance(flat.substream, ExtentStream)
+        self.assertEqual(read_all(flat), read_all(reversed_stream))
+
+
+if __name__ == "__main__":
+    try:
+        unittest.main()
+    except SystemExit as e:
+        pass
@@ -0,0 +1,174 @@
+from io import BytesIO
+from io import SEEK_SET
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from smpl_extract.util.fat import add_to_sector_links
+from smpl_extract.util.fat import FileAllocationTable
+from smpl_extract.util.fat import FileStream
+from smpl_extract.util.fat import compile_extents
+from smpl_extract.util.fat import InvalidFatDefinition
+from smpl_extract.util.fat import make_sector_links
+from smpl_extract.util.fat import RequestedInvalidSector
+
+
+SECTOR_SIZE = 0x10
+
+
+def generate_sectors(num_sectors: int) -> bytes:
+    result = b"".join(bytes([i]) * SECTOR_SIZE for i in range(num_sectors))
+    return result
+
+
+class FileStream_Test(unittest.TestCase):
+
+
+    def setUp(self):
+        self.data = generate_sectors(16)
+        self.sector_list = [2, 3, 4, 9, 10, 1, 12, 13, 14, 15]
+        self.expected = b"".join(
+            self.data[x*SECTOR_SIZE:(x+1)*SECTOR_SIZE] for x in self.sector_list
+        )
+        self.file_stream = FileStream(
+            BytesIO(self.data), 
+            SECTOR_SIZE, 
+            self.sector_list
+        )
+
+
+    def test_compile_extents(self):
+        result = compile_extents(self.sector_list, SECTOR_SIZE)
+        expected = [
+            (0x20, 0x30), 
+            (0x90, 0x20), 
+            (0x10, 0x10), 
+            (0xc0, 0x40)
+        ]
+        self.assertEqual(result, expected)
+
+
+    def test_spans_are_coalesced(self):
+        result = self.file_stream._get_spans(0x08, 0x50)
+        expected = [
+            (0x28, 0x28), 
+            (0x90, 0x20), 
+            (0x10, 0x08)
+        ]
+        self.assertEqual(result, expected)
+
+
+    def test_read(self):
+        result = self.file_stream.read(-1)
+        self.assertEqual(result, self.expected)
+
+
+    def test_readinto_at_offset(self):
+        buffer = bytearray(0x44)
+        self.file_stream.seek(0x2a, SEEK_SET)
+        result = self.file_stream.readinto(buffer)
+        self.assertEqual(result, 0x44)
+        self.assertEqual(bytes(buffer), self.expected[0x2a:0x6e])
+
+
+    def test_readinto_at_does_not_move_position(self):
+        buffer = bytearray(0x20)
+        result = self.file_stream.readinto_at(0x58, buffer)
+        self.assertEqual(result, 0x20)
+        self.assertEqual(bytes(buffer), self.expected[0x58:0x78])
+        self.assertEqual(self.file_stream.tell(), 0)
+
+
+    def test_one_pread_per_extent(self):
+        handle, file_path = tempfile.mkstemp()
+        with os.fdopen(handle, "wb") as file:
+            file.write(self.data)
+        
+        buffer = bytearray(len(self.expected))
+        with open(file_path, "rb") as file:
+            file_stream = FileStream(file, SECTOR_SIZE, self.sector_list)
+            with patch("os.preadv", wraps=os.preadv) as preadv:
+                result = file_stream.readinto(buffer)
+                self.assertEqual(preadv.call_count, 4)
+        os.remove(file_path)
+
+        self.assertEqual(result, len(self.expected))
+        self.assertEqual(bytes(buffer), self.expected)
+
+
+class FileAllocationTable_Test(unittest.TestCase):
+
+
+    def setUp(self):
+        sector_links = make_sector_links(16)
+        add_to_sector_links([2, 3, 4, 9, 10], sector_links)
+        add_to_sector_links([5, 6, 12, 13], sector_links)
+        self.fat = FileAllocationTable(BytesIO(), 16, sector_links)
+
+
+    def test_get_path(self):
+        self.assertEqual(self.fat.get_path(2), [2, 3, 4, 9, 10])
+        self.assertEqual(self.fat.get_path(5), [5, 6, 12, 13])
+        self.assertEqual(self.fat.get_path(4), [4, 9, 10])
+        self.assertEqual(self.fat.get_path(15), [15])
+
+
+    def test_get_extents(self):
+        self.assertEqual(self.fat.get_extents(2), [(2, 3), (9, 2)])
+        self.assertEqual(self.fat.get_extents(5), [(5, 2), (12, 2)])
+
+
+    def test_invalid_sector(self):
+        with self.assertRaises(RequestedInvalidSector):
+            self.fat.get_path(16)
+
+
+    def test_entry_exceeds_table(self):
+        with self.assertRaises(InvalidFatDefinition):
+            add_to_sector_links([1, 16], self.fat.sector_links)
+
+
+    def test_cycle(self):
+        sector_links = make_sector_links(8)
+        add_to_sector_links([1, 2, 3], sector_links)
+        sector_links[3] = 2
+        fat = FileAllocationTable(BytesIO(), 8, sector_links)
+        with self.assertRaises(InvalidFatDefinition):
+            fat.get_path(1)
+        with self.assertRaises(InvalidFatDefinition):
+            fat.get_path(2)
+        self.assertEqual(fat.get_path(5), [5])
+
+
+    def test_cross_link(self):
+        sector_links = make_sector_links(8)
+        add_to_sector_links([1, 2, 3], sector_links)
+        add_to_sector_links([5, 2, 3], sector_links)
+        fat = FileAllocationTable(BytesIO(), 8, sector_links)
+        self.assertEqual(fat.get_path(1), [1, 2, 3])
+        self.assertEqual(fat.get_path(5), [5, 2, 3])
+        self.assertEqual(fat.cross_links, {2})
+
+
+    def test_link_exceeds_table(self):
+        sector_links = make_sector_links(8)
+        add_to_sector_links([1, 2, 3], sector_links)
+        add_to_sector_links([5, 6], sector_links)
+        sector_links[2] = 8
+        sector_links[6] = -5
+        fat = FileAllocationTable(BytesIO(), 8, sector_links)
+        with self.assertRaises(InvalidFatDefinition):
+            fat.get_path(1)
+        with self.assertRaises(InvalidFatDefinition):
+            fat.get_path(5)
+        self.assertEqual(fat.broken_chains, {1, 5})
+        self.assertEqual(fat.cross_links, set())
+        self.assertEqual(fat.get_path(3), [3])
+
+
+if __name__ == "__main__":
+    try:
+        unittest.main()
+    except SystemExit as e:
+        pass
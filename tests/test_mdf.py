@@ -0,0 +1,85 @@
+from io import BytesIO
+from io import SEEK_SET
+import os
+import unittest
+
+from smpl_extract.alcohol.mdf import is_mdf_image
+from smpl_extract.alcohol.mdf import MDF_SECTOR_BODY_SIZE
+from smpl_extract.alcohol.mdf import MDF_SECTOR_HEADER_MAGIC
+from smpl_extract.alcohol.mdf import MDF_SECTOR_SIZE
+from smpl_extract.alcohol.mdf import MDF_SUBCHANNEL_SECTOR_SIZE
+from smpl_extract.alcohol.mdf import MdfStream
+from smpl_extract.util.extent import flatten_stream
+from smpl_extract.util.stream import StreamOffset
+
+
+def make_mdf(body: bytes, sector_size: int) -> bytes:
+    sectors = []
+    num_sectors = len(body) // MDF_SECTOR_BODY_SIZE
+    footer_size = sector_size - len(MDF_SECTOR_HEADER_MAGIC) - 4 \
+        - MDF_SECTOR_BODY_SIZE
+    for i in range(num_sectors):
+        sectors.append(MDF_SECTOR_HEADER_MAGIC)
+        sectors.append(i.to_bytes(3, "big") + b"\x01")
+        sectors.append(
+            body[i*MDF_SECTOR_BODY_SIZE:(i + 1)*MDF_SECTOR_BODY_SIZE]
+        )
+        sectors.append(b"\xEE" * footer_size)
+    result = b"".join(sectors)
+    return result
+
+
+class MdfStream_Test(unittest.TestCase):
+
+
+    def setUp(self):
+        self.body = os.urandom(0x40 * MDF_SECTOR_BODY_SIZE)
+
+
+    def check_reads(self, sector_size: int):
+        mdf = make_mdf(self.body, sector_size)
+        stream = MdfStream(BytesIO(mdf))
+        self.assertTrue(is_mdf_image(stream.substream))
+        self.assertEqual(stream.raw_sector_length, sector_size)
+        self.assertEqual(stream.read(-1), self.body)
+
+        for address, size in [
+                (0x0, 0x10),
+                (0x7F0, 0x20),
+                (0x100, 0x3000),
+                (0x800, 0x1000),
+                (0x123, len(self.body) - 0x123)
+        ]:
+            stream.seek(address, SEEK_SET)
+            self.assertEqual(
+                stream.read(size), 
+                self.body[address:address + size]
+            )
+            buffer = bytearray(size)
+            self.assertEqual(stream.readinto_at(address, buffer), size)
+            self.assertEqual(bytes(buffer), self.body[address:address + size])
+
+
+    def test_mode1_2352(self):
+        self.check_reads(MDF_SECTOR_SIZE)
+
+
+    def test_subchannel_2448(self):
+        self.check_reads(MDF_SUBCHANNEL_SECTOR_SIZE)
+
+
+    def test_flatten_stops_at_mdf(self):
+        mdf = make_mdf(self.body, MDF_SECTOR_SIZE)
+        stream = MdfStream(BytesIO(mdf))
+        offset_stream = StreamOffset(stream, 0x5000, 0x700)
+        flattened = flatten_stream(offset_stream)
+        self.assertIs(flattened.substream, stream)
+        self.assertEqual(flattened.extents, [(0x700, 0x5000)])
+        self.assertEqual(flattened.read(-1), self.body[0x700:0x5700])
+
+
+if __name__ == "__main__":
+    try:
+        unittest.main()
+    except SystemExit as e:
+        pass
@@ -127,6 +127,118 @@ class ReverseStream_Test(unittest.TestCase):
         self.assertEqual(resulting_bytes, expected_bytes)
 
 
+    def test_width_2_readinto(self):
+        initial_bytes = generate_consecutive_bytes(6, width=2)
+        expected_bytes = generate_consecutive_bytes(4, width=2, reverse=True)
+
+        stream = BytesIO(initial_bytes)
+        stream_reverse = StreamReversed(stream, len(initial_bytes), sample_width=2)
+        stream_reverse.seek(4)
+        
+        resulting_bytes = b""
+        buffer = bytearray(4)
+        while True:
+            result = stream_reverse.readinto(buffer)
+            if result <= 0:
+                break
+            resulting_bytes += buffer[:result]
+        
+        self.assertEqual(resulting_bytes, expected_bytes)
+
+
+    def test_read_ahead_blocks(self):
+        initial_bytes = generate_consecutive_bytes(0x40, width=2)
+        expected_bytes = generate_consecutive_bytes(0x40, width=2, reverse=True)
+
+        stream = BytesIO(initial_bytes)
+        stream_reverse = StreamReversed(
+            stream, 
+            len(initial_bytes), 
+            sample_width=2, 
+            read_ahead=0x10
+        )
+        
+        resulting_bytes = b""
+        while True:
+            result = stream_reverse.read(6)
+            if len(result) <= 0:
+                break
+            resulting_bytes += result
+        
+        self.assertEqual(resulting_bytes, expected_bytes)
+
+
+    def test_positional_reads_do_not_share_state(self):
+        initial_bytes = generate_consecutive_bytes(0x40, width=2)
+        expected_bytes = generate_consecutive_bytes(0x40, width=2, reverse=True)
+
+        stream = BytesIO(initial_bytes)
+        stream_reverse = StreamReversed(
+            stream, 
+            len(initial_bytes), 
+            sample_width=2, 
+            read_ahead=0x20
+        )
+        
+        buffer_a = bytearray(0x8)
+        buffer_b = bytearray(0x40)
+        stream_reverse.readinto_at(0x70, buffer_a)
+        stream_reverse.readinto_at(0x10, buffer_b)
+        self.assertEqual(bytes(buffer_a), expected_bytes[0x70:0x78])
+        self.assertEqual(bytes(buffer_b), expected_bytes[0x10:0x50])
+        self.assertEqual(stream_reverse.tell(), 0)
+
+
+    def test_large_reads_reuse_scratch(self):
+        initial_bytes = generate_consecutive_bytes(0x40, width=2)
+        expected_bytes = generate_consecutive_bytes(0x40, width=2, reverse=True)
+
+        stream = BytesIO(initial_bytes)
+        stream_reverse = StreamReversed(
+            stream, 
+            len(initial_bytes), 
+            sample_width=2, 
+            read_ahead=0x10
+        )
+        scratch = stream_reverse.scratch
+        block = stream_reverse.block
+
+        buffer = bytearray(0x36)
+        stream_reverse.readinto_at(0x4, buffer)
+        self.assertEqual(bytes(buffer), expected_bytes[0x4:0x3a])
+        self.assertEqual(stream_reverse.read(0x6), expected_bytes[:0x6])
+        self.assertEqual(stream_reverse.read(0x22), expected_bytes[0x6:0x28])
+        self.assertIs(stream_reverse.scratch, scratch)
+        self.assertIs(stream_reverse.block, block)
+
+
+    def test_read_ahead_is_per_stream(self):
+        initial_bytes = generate_consecutive_bytes(0x40, width=2)
+        expected_bytes = generate_consecutive_bytes(0x40, width=2, reverse=True)
+
+        stream = BytesIO(initial_bytes)
+        streams_reverse = list(
+            StreamReversed(
+                stream, 
+                len(initial_bytes), 
+                sample_width=2, 
+                read_ahead=0x10
+            )
+            for i in range(2)
+        )
+        streams_reverse[1].seek(0x40)
+
+        results = [b"", b""]
+        for i in range(0x10):
+            for j, stream_reverse in enumerate(streams_reverse):
+                results[j] += stream_reverse.read(4)
+        self.assertEqual(results[0], expected_bytes[:0x40])
+        self.assertEqual(results[1], expected_bytes[0x40:])
+        self.assertEqual(streams_reverse[0].block_start, 0x30)
+        self.assertEqual(streams_reverse[1].block_start, 0x70)
+        self.assertIsNot(streams_reverse[0].block, streams_reverse[1].block)
+
+
     def test_width_2_seek_bad_align(self):
         initial_bytes = generate_consecutive_bytes(6, width=2)
         stream = BytesIO(initial_bytes)
@@ -0,0 +1,112 @@
+from construct.core import ConstructError
+import numpy as np
+import unittest
+
+from smpl_extract.roland.s7xx.data_types import PERFORMANCE_DIRECTORY_AREA_OFFSET
+from smpl_extract.roland.s7xx.data_types import RolandFileType
+from smpl_extract.roland.s7xx.data_types import SAMPLE_DIRECTORY_AREA_OFFSET
+from smpl_extract.roland.s7xx.data_types import TOTAL_DIRECTORY_AREA_OFFSET
+from smpl_extract.roland.s7xx.data_types import TOTAL_DIRECTORY_AREA_SIZE
+from smpl_extract.roland.s7xx.directory_area import DIRECTORY_ENTRY_SIZE
+from smpl_extract.roland.s7xx.directory_area import DirectoryArea
+from smpl_extract.roland.s7xx.directory_area import DirectoryEntryParser
+
+
+def make_directory_area(seed=0):
+    rng = np.random.default_rng(seed)
+    data = bytearray(
+        rng.integers(0, 0x100, TOTAL_DIRECTORY_AREA_SIZE, dtype=np.uint8)
+    )
+    names = rng.integers(0x20, 0x7f, (TOTAL_DIRECTORY_AREA_SIZE // 0x20, 16))
+    for i, name in enumerate(names):
+        if i % 7 != 0:
+            data[i*0x20:i*0x20 + 16] = bytes(name.astype(np.uint8))
+        if i % 5 == 0:
+            data[i*0x20 + 10:i*0x20 + 16] = bytes(6)
+        if i % 3 == 0:
+            data[i*0x20 + 16] = 0x41
+    return bytes(data)
+
+
+class DirectoryArea_Test(unittest.TestCase):
+
+
+    def _get_reference(self, data, area_offset, index, version):
+        address = area_offset - TOTAL_DIRECTORY_AREA_OFFSET \
+            + DIRECTORY_ENTRY_SIZE*index
+        try:
+            result = DirectoryEntryParser.parse(
+                data[address:address + DIRECTORY_ENTRY_SIZE],
+                _=dict(_dir_version=version)
+            )
+        except (ConstructError, UnicodeDecodeError):
+            result = None
+        return result
+
+
+    def test_entries_match_parser(self):
+        data = make_directory_area()
+        for version in (1, 2):
+            directory_area = DirectoryArea(data, version)
+            for index in range(0x200):
+                reference = self._get_reference(
+                    data,
+                    SAMPLE_DIRECTORY_AREA_OFFSET,
+                    index,
+                    version
+                )
+                if reference is None:
+                    with self.assertRaises(ConstructError):
+                        directory_area.get_entry(RolandFileType.SAMPLE, index)
+                    continue
+
+                entry = directory_area.get_entry(RolandFileType.SAMPLE, index)
+                self.assertEqual(entry.index, index)
+                for key in (
+                    "name",
+                    "file_type",
+                    "file_attributes",
+                    "forward_link_ptr",
+                    "backward_link_ptr",
+                    "link_id",
+                    "reserved",
+                    "fat_entry",
+                    "num_clusters"
+                ):
+                    self.assertEqual(getattr(entry, key), reference[key])
+
+
+    def test_get_indices(self):
+        data = make_directory_area(1)
+        directory_area = DirectoryArea(data)
+        expected = []
+        for index in range(0x200):
+            reference = self._get_reference(
+                data,
+                PERFORMANCE_DIRECTORY_AREA_OFFSET,
+                index,
+                1
+            )
+            if reference is None:
+                continue
+            if reference.file_type == RolandFileType.PERFORMANCE:
+                expected.append(index)
+
+        result = directory_area.get_indices(RolandFileType.PERFORMANCE)
+        self.assertGreater(len(expected), 0)
+        self.assertEqual(result.tolist(), expected)
+
+
+    def test_out_of_range(self):
+        directory_area = DirectoryArea(bytes(TOTAL_DIRECTORY_AREA_SIZE))
+        with self.assertRaises(ConstructError):
+            directory_area.get_entry(RolandFileType.VOLUME, 0x80)
+        with self.assertRaises(ConstructError):
+            directory_area.get_entry(RolandFileType.VOLUME, -1)
+
+
+if __name__ == "__main__":
+    try:
+        unittest.main()
+    except SystemExit as e:
+        pass
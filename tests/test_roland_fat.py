@@ -0,0 +1,90 @@
+from construct.core import ConstructError
+import numpy as np
+import unittest
+
+from smpl_extract.roland.s7xx.data_types import FAT_END
+from smpl_extract.roland.s7xx.data_types import FAT_ERROR_FLAG
+from smpl_extract.roland.s7xx.data_types import FAT_FREE_FLAG
+from smpl_extract.roland.s7xx.data_types import FAT_IS_END_F
+from smpl_extract.roland.s7xx.data_types import FAT_NUM_ENTRIES
+from smpl_extract.roland.s7xx.data_types import FAT_RESERVED_FLAG
+from smpl_extract.roland.s7xx.fat import decode_fat_links
+from smpl_extract.util.fat import add_to_sector_links
+from smpl_extract.util.fat import make_sector_links
+
+
+def decode_fat_links_reference(fat_entries):
+    sector_links = make_sector_links(FAT_NUM_ENTRIES)
+    dirty_flags = [False] * FAT_NUM_ENTRIES
+    dirty_flags[0:2] = [True, True]
+    for i in range(2, FAT_NUM_ENTRIES - 9):
+        if dirty_flags[i]:
+            continue
+        subpath_links = []
+        subpath_index = i
+        while True:
+            value = fat_entries[subpath_index]
+            dirty_flags[subpath_index] = True
+            if value == FAT_ERROR_FLAG:
+                raise ConstructError("Encountered ERROR_FLAG in FAT.")
+            if value in (FAT_RESERVED_FLAG, FAT_FREE_FLAG):
+                if len(subpath_links) > 0:
+                    raise ConstructError("Unexpected flag in FAT.")
+                break
+            subpath_links.append(subpath_index)
+            if FAT_IS_END_F(value):
+                add_to_sector_links(subpath_links, sector_links)
+                break
+            subpath_index = value
+    return sector_links
+
+
+def generate_fat(seed: int):
+    rng = np.random.default_rng(seed)
+    fat_entries = np.full(FAT_NUM_ENTRIES, FAT_FREE_FLAG, dtype="<u2")
+    fat_entries[0:2] = (0xfffa, 0x100)
+    clusters = rng.permutation(np.arange(2, FAT_ERROR_FLAG))[:0x8000]
+    boundaries = np.sort(rng.choice(len(clusters), 0x400, replace=False))
+    for chain in np.split(clusters, boundaries):
+        if len(chain) < 1:
+            continue
+        fat_entries[chain[:-1]] = chain[1:]
+        fat_entries[chain[-1]] = FAT_END + rng.integers(0, 7)
+    reserved = np.flatnonzero(fat_entries == FAT_FREE_FLAG)[::7]
+    fat_entries[reserved] = FAT_RESERVED_FLAG
+    return fat_entries
+
+
+class RolandFat_Test(unittest.TestCase):
+
+
+    def test_matches_reference(self):
+        for seed in range(3):
+            fat_entries = generate_fat(seed)
+            result = decode_fat_links(fat_entries)
+            expected = decode_fat_links_reference(fat_entries.tolist())
+            np.testing.assert_array_equal(result, expected)
+
+
+    def test_error_flag(self):
+        fat_entries = generate_fat(0)
+        fat_entries[np.flatnonzero(fat_entries == FAT_FREE_FLAG)[0]] = \
+            FAT_ERROR_FLAG
+        with self.assertRaises(ConstructError):
+            decode_fat_links(fat_entries)
+
+
+    def test_chain_into_free_cluster(self):
+        fat_entries = generate_fat(0)
+        free = np.flatnonzero(fat_entries == FAT_FREE_FLAG)[0]
+        end = np.flatnonzero(fat_entries[2:] >= FAT_END)[0] + 2
+        fat_entries[end] = free
+        with self.assertRaises(ConstructError):
+            decode_fat_links(fat_entries)
+
+
+if __name__ == "__main__":
+    try:
+        unittest.main()
+    except SystemExit as e:
+        pass
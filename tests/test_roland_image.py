@@ -0,0 +1,426 @@
+import csv
+from io import BytesIO
+import os
+import struct
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from smpl_extract.actions import export_sample_pool_to_wav
+from smpl_extract.generalized.wav import WavSampleBuilder
+from smpl_extract.roland.s7xx.data_types import DATA_FAT_OFFSET
+from smpl_extract.roland.s7xx.data_types import FAT_AREA_ID
+from smpl_extract.roland.s7xx.data_types import FAT_AREA_OFFSET
+from smpl_extract.roland.s7xx.data_types import FAT_END
+from smpl_extract.roland.s7xx.data_types import FAT_FREE_FLAG
+from smpl_extract.roland.s7xx.data_types import FAT_NUM_ENTRIES
+from smpl_extract.roland.s7xx.data_types import FAT_VERSION_1_FLAG
+from smpl_extract.roland.s7xx.data_types import MAX_NUM_PATCH
+from smpl_extract.roland.s7xx.data_types import MAX_NUM_SAMPLE
+from smpl_extract.roland.s7xx.data_types import NUM_KEYS
+from smpl_extract.roland.s7xx.data_types import PARTIAL_DIRECTORY_AREA_OFFSET
+from smpl_extract.roland.s7xx.data_types import PARTIAL_PARAMETER_AREA_OFFSET
+from smpl_extract.roland.s7xx.data_types import PARTIAL_PARAMETER_ENTRY_SIZE
+from smpl_extract.roland.s7xx.data_types import PATCH_DIRECTORY_AREA_OFFSET
+from smpl_extract.roland.s7xx.data_types import PATCH_PARAMETER_AREA_OFFSET
+from smpl_extract.roland.s7xx.data_types import PATCH_PARAMETER_ENTRY_SIZE
+from smpl_extract.roland.s7xx.data_types import PERFORMANCE_DIRECTORY_AREA_OFFSET
+from smpl_extract.roland.s7xx.data_types import PERFORMANCE_PARAMETER_AREA_OFFSET
+from smpl_extract.roland.s7xx.data_types import PERFORMANCE_PARAMETER_ENTRY_SIZE
+from smpl_extract.roland.s7xx.data_types import ROLAND_CLUSTER_SIZE
+from smpl_extract.roland.s7xx.data_types import RolandFileType
+from smpl_extract.roland.s7xx.data_types import RolandLoopMode
+from smpl_extract.roland.s7xx.data_types import SAMPLE_DIRECTORY_AREA_OFFSET
+from smpl_extract.roland.s7xx.data_types import SAMPLE_PARAMETER_AREA_OFFSET
+from smpl_extract.roland.s7xx.data_types import SAMPLE_PARAMETER_ENTRY_SIZE
+from smpl_extract.roland.s7xx.data_types import VOLUME_DIRECTORY_AREA_OFFSET
+from smpl_extract.roland.s7xx.data_types import VOLUME_PARAMETER_AREA_OFFSET
+from smpl_extract.roland.s7xx.image import RolandSxxImageParser
+from smpl_extract.roland.s7xx.patch_entry import PATCH_PARTIAL_LIST_OFFSET
+from smpl_extract.roland.s7xx.patch_entry import PatchEntryAdapter
+from smpl_extract.roland.s7xx.partial_entry import PARTIAL_SAMPLE_SECTION_OFFSET
+from smpl_extract.roland.s7xx.partial_entry import PARTIAL_SAMPLE_SECTION_SIZE
+from smpl_extract.roland.s7xx.sample_entry import SampleEntryAdapter
+from smpl_extract.structural import LINK_MODE_HARDLINK
+from smpl_extract.structural import LINK_MODE_MAPPING
+from smpl_extract.structural import LINK_MODE_SYMLINK
+from smpl_extract.structural import SAMPLE_MAP_FILE_NAME
+
+
+SAMPLES = (
+    ("Kick", 0x400, RolandLoopMode.FORWARD_END),
+    ("Snare", 0x1800, RolandLoopMode.FORWARD_RELEASE),
+    ("Reverse", 0x600, RolandLoopMode.REVERSE_ONESHOT)
+)
+PARTIALS = ((0, 1), (2,))
+PATCHES = ((0,), (1,))
+PERFORMANCES = ((0,), (0, 1))
+
+
+def write_name(image, address, name):
+    image[address:address + 16] = name.encode("ascii").ljust(16)
+
+
+def write_directory_entry(
+        image,
+        area_offset,
+        index,
+        name,
+        file_type,
+        fat_entry=0,
+        num_clusters=0
+):
+    address = area_offset + 0x20*index
+    write_name(image, address, name)
+    image[address + 16:address + 32] = bytes([file_type, 0]) \
+        + struct.pack("<HHHIHH", 0, 0, 0, 0, fat_entry, num_clusters)
+
+
+def make_sample_data(index, num_samples):
+    result = bytes((index*0x31 + i) & 0xFF for i in range(2*num_samples))
+    return result
+
+
+def write_id_area(image):
+    id_area = struct.pack("<I", 1) \
+        + b"S770 MR25A\x00\x00" + b" "*15 + b"\x00" \
+        + b"S-770 Hard Disk Ver. 1.00".ljust(31) + b"\x00" \
+        + b"Copyright Roland".ljust(31) + b"\x00" \
+        + bytes(160) \
+        + b"TEST DISK".ljust(16) \
+        + struct.pack("<I", 1000) \
+        + struct.pack(
+            "<5H",
+            1,
+            len(PERFORMANCES),
+            len(PATCHES),
+            len(PARTIALS),
+            len(SAMPLES)
+        )
+    image[:len(id_area)] = id_area
+
+
+def write_samples(image, num_clusters):
+    fat = [FAT_FREE_FLAG]*FAT_NUM_ENTRIES
+    fat[0] = FAT_AREA_ID
+    fat[-2:] = [FAT_VERSION_1_FLAG]*2
+
+    cluster = 2
+    for index, (name, num_samples, loop_mode) in enumerate(SAMPLES):
+        chain = list(range(cluster, cluster + num_clusters[index]))
+        fat[chain[0]:chain[-1]] = chain[1:]
+        fat[chain[-1]] = FAT_END
+        data = make_sample_data(index, num_samples)
+        address = DATA_FAT_OFFSET + cluster*ROLAND_CLUSTER_SIZE
+        image[address:address + len(data)] = data
+        cluster += len(chain)
+
+        write_directory_entry(
+            image,
+            SAMPLE_DIRECTORY_AREA_OFFSET,
+            index,
+            name,
+            RolandFileType.SAMPLE,
+            chain[0],
+            len(chain)
+        )
+        address = SAMPLE_PARAMETER_AREA_OFFSET \
+            + SAMPLE_PARAMETER_ENTRY_SIZE*index
+        write_name(image, address, name)
+        points = (0, 0x10, num_samples - 0x10, 0x10, num_samples - 1)
+        image[address + 16:address + 48] = \
+            struct.pack("<5I", *(x << 8 for x in points)) \
+            + bytes([loop_mode, 1, 0, 0]) \
+            + struct.pack("<HH", 0, len(chain)) \
+            + bytes([1, 60, 0, 0])
+
+    image[FAT_AREA_OFFSET:FAT_AREA_OFFSET + 2*FAT_NUM_ENTRIES] = \
+        struct.pack(f"<{FAT_NUM_ENTRIES}H", *fat)
+
+
+def write_partials(image):
+    for index, sample_list in enumerate(PARTIALS):
+        name = f"Partial {index}"
+        write_directory_entry(
+            image,
+            PARTIAL_DIRECTORY_AREA_OFFSET,
+            index,
+            name,
+            RolandFileType.PARTIAL
+        )
+        address = PARTIAL_PARAMETER_AREA_OFFSET \
+            + PARTIAL_PARAMETER_ENTRY_SIZE*index
+        write_name(image, address, name)
+        for i in range(4):
+            selection = sample_list[i] if i < len(sample_list) else -1
+            section_address = address \
+                + PARTIAL_SAMPLE_SECTION_OFFSET \
+                + PARTIAL_SAMPLE_SECTION_SIZE*i
+            image[section_address:section_address + 11] = struct.pack(
+                "<hBBbbbBBBB",
+                selection, 0, 100, 0, 0, 0, 0, 0, 127, 0
+            )
+
+
+def write_patches(image):
+    for index, partial_list in enumerate(PATCHES):
+        name = f"Patch {index}"
+        write_directory_entry(
+            image,
+            PATCH_DIRECTORY_AREA_OFFSET,
+            index,
+            name,
+            RolandFileType.PATCH
+        )
+        address = PATCH_PARAMETER_AREA_OFFSET \
+            + PATCH_PARAMETER_ENTRY_SIZE*index
+        write_name(image, address, name)
+        partial_list = list(partial_list) \
+            + [-1]*(NUM_KEYS - len(partial_list))
+        address += PATCH_PARTIAL_LIST_OFFSET
+        image[address:address + 2*NUM_KEYS] = \
+            struct.pack(f"<{NUM_KEYS}h", *partial_list)
+
+
+def write_performances(image):
+    for index, patch_list in enumerate(PERFORMANCES):
+        name = f"Performance {index}"
+        write_directory_entry(
+            image,
+            PERFORMANCE_DIRECTORY_AREA_OFFSET,
+            index,
+            name,
+            RolandFileType.PERFORMANCE
+        )
+        address = PERFORMANCE_PARAMETER_AREA_OFFSET \
+            + PERFORMANCE_PARAMETER_ENTRY_SIZE*index
+        write_name(image, address, name)
+        patch_list = list(patch_list) + [-1]*(32 - len(patch_list))
+        image[address + 0x100:address + 0x140] = \
+            struct.pack("<32h", *patch_list)
+
+    write_directory_entry(
+        image,
+        VOLUME_DIRECTORY_AREA_OFFSET,
+        0,
+        "Volume",
+        RolandFileType.VOLUME
+    )
+    write_name(image, VOLUME_PARAMETER_AREA_OFFSET, "Volume")
+    performance_list = list(range(len(PERFORMANCES))) \
+        + [-1]*(64 - len(PERFORMANCES))
+    address = VOLUME_PARAMETER_AREA_OFFSET + 0x20
+    image[address:address + 0x80] = struct.pack("<64h", *performance_list)
+
+
+def make_image_data():
+    num_clusters = [
+        -(-2*num_samples // ROLAND_CLUSTER_SIZE)
+        for _, num_samples, _ in SAMPLES
+    ]
+    image = bytearray(
+        DATA_FAT_OFFSET + (2 + sum(num_clusters))*ROLAND_CLUSTER_SIZE
+    )
+    write_id_area(image)
+    write_samples(image, num_clusters)
+    write_partials(image)
+    write_patches(image)
+    write_performances(image)
+    return bytes(image)
+
+
+def make_image(header_only: bool = False):
+    image = RolandSxxImageParser(BytesIO(make_image_data()))
+    image.set_routines({
+        "make_safe_names": image.make_safe_names_routine,
+        "make_export_names": image.make_export_names_routine
+    })
+    image.set_header_only(header_only)
+    return image
+
+
+def read_sample_data(sample_file):
+    sample = sample_file.to_generalized()
+    result = sample.data_streams[0].stream.read()
+    return result
+
+
+class PerformanceLookup_Test(unittest.TestCase):
+
+
+    def _count_decodes(self, adapter_class):
+        result = patch.object(
+            adapter_class,
+            "_decode_element",
+            autospec=True,
+            side_effect=adapter_class._decode_element
+        )
+        return result
+
+
+    def test_get_file_parses_only_named_entries(self):
+        performance = make_image(header_only=True).children[0].children[1]
+        listing = {x.key: x for x in performance.children}
+        self.assertEqual(
+            list(listing.keys()),
+            [(0, None), (1, None), (0, 0), (0, 1), (1, 2)]
+        )
+
+        with self._count_decodes(PatchEntryAdapter) as patch_decodes, \
+                self._count_decodes(SampleEntryAdapter) as sample_decodes:
+            program = listing[(1, None)].file
+            sample = listing[(0, 1)].file
+
+        patch_indices = [x.args[1].index for x in patch_decodes.call_args_list]
+        sample_indices = [
+            x.args[1].index for x in sample_decodes.call_args_list
+        ]
+        self.assertEqual(patch_indices, [1])
+        self.assertEqual(sample_indices, [2, 1])
+        self.assertIsNone(performance._patch_entries)
+        self.assertIsNone(performance._files)
+        self.assertIs(listing[(1, None)].file, program)
+        self.assertIs(listing[(0, 1)].file, sample)
+
+
+    def test_get_file_matches_full_parse(self):
+        performance = make_image(header_only=True).children[0].children[1]
+        full_performance = make_image().children[0].children[1]
+        full_files = {tuple(x.path): x for x in full_performance.children}
+
+        for file_listing in performance.children:
+            result = file_listing.file
+            expected = full_files[tuple(file_listing.path)]
+            self.assertEqual(result.path, expected.path)
+            self.assertEqual(result.name, expected.name)
+            self.assertEqual(type(result), type(expected))
+            if file_listing.key[1] is None:
+                self.assertEqual(result.partials, expected.partials)
+            else:
+                self.assertEqual(
+                    read_sample_data(result),
+                    read_sample_data(expected)
+                )
+
+
+    def test_get_file_bad_index(self):
+        performance = make_image(header_only=True).children[0].children[1]
+        self.assertIsNone(performance.get_file((MAX_NUM_PATCH, None)))
+        self.assertIsNone(performance.get_file((0, MAX_NUM_SAMPLE)))
+
+
+SAMPLE_LINKS = [
+    ("Volume/Performance 0/Kick", "_Samples/Kick"),
+    ("Volume/Performance 0/Snare", "_Samples/Snare"),
+    ("Volume/Performance 1/Kick", "_Samples/Kick"),
+    ("Volume/Performance 1/Snare", "_Samples/Snare"),
+    ("Volume/Performance 1/Reverse", "_Samples/Reverse")
+]
+
+
+class SamplePoolExport_Test(unittest.TestCase):
+
+
+    def _export(self, output_directory, link_mode=None, header_only=False):
+        image = make_image(header_only)
+        export_sample_pool_to_wav(image, output_directory, link_mode)
+        self.assertEqual(image.header_only, header_only)
+        for volume in image.children:
+            for performance in volume.children:
+                self.assertIsNone(performance._files)
+
+
+    def _read_file(self, output_directory, inner_path):
+        total_path = os.path.join(output_directory, inner_path) + ".wav"
+        with open(total_path, "rb") as file:
+            result = file.read()
+        return result
+
+
+    def test_get_sample_links(self):
+        image = make_image()
+        self.assertEqual(image.get_sample_links(), SAMPLE_LINKS)
+
+
+    def test_export_sample_pool(self):
+        expected = {
+            "/".join(x.export_path()): WavSampleBuilder.build(x.to_generalized())
+            for x in make_image().sample_pool.children
+        }
+        self.assertEqual(
+            sorted(expected.keys()),
+            ["_Samples/Kick", "_Samples/Reverse", "_Samples/Snare"]
+        )
+
+        for header_only in (False, True):
+            with tempfile.TemporaryDirectory() as output_directory:
+                self._export(output_directory, header_only=header_only)
+                self.assertEqual(
+                    sorted(os.listdir(output_directory)),
+                    ["_Samples"]
+                )
+                self.assertEqual(
+                    sorted(os.listdir(os.path.join(output_directory, "_Samples"))),
+                    ["Kick.wav", "Reverse.wav", "Snare.wav"]
+                )
+                for inner_path, data in expected.items():
+                    self.assertEqual(
+                        self._read_file(output_directory, inner_path), 
+                        data
+                    )
+
+
+    def test_mapping(self):
+        with tempfile.TemporaryDirectory() as output_directory:
+            self._export(output_directory, LINK_MODE_MAPPING)
+
+            map_path = os.path.join(output_directory, SAMPLE_MAP_FILE_NAME)
+            with open(map_path, "r", newline="", encoding="utf-8") as file:
+                rows = list(csv.reader(file))
+            self.assertFalse(
+                os.path.exists(os.path.join(output_directory, "Volume"))
+            )
+
+        self.assertEqual(rows[0], ["path", "sample"])
+        self.assertEqual(
+            rows[1:],
+            [[x + ".wav", y + ".wav"] for x, y in SAMPLE_LINKS]
+        )
+
+
+    def test_hardlinks(self):
+        with tempfile.TemporaryDirectory() as output_directory:
+            self._export(output_directory, LINK_MODE_HARDLINK)
+
+            for link_path, target_path in SAMPLE_LINKS:
+                total_link_path = \
+                    os.path.join(output_directory, link_path) + ".wav"
+                total_target_path = \
+                    os.path.join(output_directory, target_path) + ".wav"
+                self.assertFalse(os.path.islink(total_link_path))
+                self.assertTrue(
+                    os.path.samefile(total_link_path, total_target_path)
+                )
+
+
+    @unittest.skipUnless(hasattr(os, "symlink"), "symlinks unsupported")
+    def test_symlinks(self):
+        with tempfile.TemporaryDirectory() as output_directory:
+            self._export(output_directory, LINK_MODE_SYMLINK)
+
+            for link_path, target_path in SAMPLE_LINKS:
+                total_link_path = \
+                    os.path.join(output_directory, link_path) + ".wav"
+                self.assertTrue(os.path.islink(total_link_path))
+                self.assertFalse(os.path.isabs(os.readlink(total_link_path)))
+                self.assertEqual(
+                    self._read_file(output_directory, link_path),
+                    self._read_file(output_directory, target_path)
+                )
+
+
+if __name__ == "__main__":
+    try:
+        unittest.main()
+    except SystemExit as e:
+        pass
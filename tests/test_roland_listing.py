@@ -0,0 +1,147 @@
+from io import BytesIO
+import struct
+import unittest
+
+from smpl_extract.roland.s7xx.data_types import DATA_AREA_OFFSET
+from smpl_extract.roland.s7xx.data_types import NUM_KEYS
+from smpl_extract.roland.s7xx.data_types import PARTIAL_DIRECTORY_AREA_OFFSET
+from smpl_extract.roland.s7xx.data_types import PARTIAL_DIRECTORY_ENTRY_SIZE
+from smpl_extract.roland.s7xx.data_types import PARTIAL_PARAMETER_AREA_OFFSET
+from smpl_extract.roland.s7xx.data_types import PARTIAL_PARAMETER_ENTRY_SIZE
+from smpl_extract.roland.s7xx.data_types import PATCH_DIRECTORY_AREA_OFFSET
+from smpl_extract.roland.s7xx.data_types import PATCH_DIRECTORY_ENTRY_SIZE
+from smpl_extract.roland.s7xx.data_types import PATCH_PARAMETER_AREA_OFFSET
+from smpl_extract.roland.s7xx.data_types import PATCH_PARAMETER_ENTRY_SIZE
+from smpl_extract.roland.s7xx.data_types import SAMPLE_DIRECTORY_AREA_OFFSET
+from smpl_extract.roland.s7xx.data_types import SAMPLE_DIRECTORY_ENTRY_SIZE
+from smpl_extract.roland.s7xx.patch_entry import PATCH_PARTIAL_LIST_OFFSET
+from smpl_extract.roland.s7xx.patch_entry import PatchListingConstruct
+from smpl_extract.roland.s7xx.partial_entry import PARTIAL_SAMPLE_SECTION_OFFSET
+from smpl_extract.roland.s7xx.partial_entry import PARTIAL_SAMPLE_SECTION_SIZE
+from smpl_extract.roland.s7xx.sample_entry import SampleEntryConstruct
+from smpl_extract.util.constructs import SafeListConstruct
+
+
+def write_directory_entry(image, address, name, file_type):
+    entry = name.encode("ascii").ljust(16, b"\x00") + bytes([file_type])
+    image[address:address + len(entry)] = entry
+
+
+def write_partial_list(image, patch_index, partial_list):
+    address = PATCH_PARAMETER_AREA_OFFSET \
+        + PATCH_PARAMETER_ENTRY_SIZE*patch_index \
+        + PATCH_PARTIAL_LIST_OFFSET
+    image[address:address + 2*NUM_KEYS] = \
+        struct.pack(f"<{NUM_KEYS}h", *partial_list)
+
+
+def make_listing_image():
+    image = bytearray(DATA_AREA_OFFSET)
+
+    patch_index = 3
+    write_directory_entry(
+        image,
+        PATCH_DIRECTORY_AREA_OFFSET + PATCH_DIRECTORY_ENTRY_SIZE*patch_index,
+        "Piano",
+        0x42
+    )
+    partial_list = [-1] * NUM_KEYS
+    partial_list[10:20] = [7] * 10
+    partial_list[40:50] = [5] * 10
+    write_partial_list(image, patch_index, partial_list)
+    write_partial_list(image, patch_index + 1, [-1] * NUM_KEYS)
+
+    partials = {5: (1, -1, 2, -1), 7: (2, 9000, -1, 1)}
+    for partial_index, selections in partials.items():
+        write_directory_entry(
+            image,
+            PARTIAL_DIRECTORY_AREA_OFFSET
+                + PARTIAL_DIRECTORY_ENTRY_SIZE*partial_index,
+            f"Partial {partial_index}",
+            0x43
+        )
+        for i, selection in enumerate(selections):
+            address = PARTIAL_PARAMETER_AREA_OFFSET \
+                + PARTIAL_PARAMETER_ENTRY_SIZE*partial_index \
+                + PARTIAL_SAMPLE_SECTION_OFFSET \
+                + PARTIAL_SAMPLE_SECTION_SIZE*i
+            image[address:address + 2] = struct.pack("<h", selection)
+
+    for sample_index in (1, 2):
+        write_directory_entry(
+            image,
+            SAMPLE_DIRECTORY_AREA_OFFSET
+                + SAMPLE_DIRECTORY_ENTRY_SIZE*sample_index,
+            f"Sample {sample_index}",
+            0x44
+        )
+
+    return BytesIO(bytes(image))
+
+
+class PatchListing_Test(unittest.TestCase):
+
+
+    def test_listing_from_directory_entries(self):
+        stream = make_listing_image()
+        patch_list = [3, 4]
+        listings = SafeListConstruct(
+            len(patch_list),
+            PatchListingConstruct(lambda this: patch_list[this._index])
+        ).parse_stream(stream)
+
+        self.assertEqual(len(listings), 2)
+        patch = listings[0]
+        self.assertEqual(patch.index, 3)
+        self.assertEqual(patch.directory.name, "Piano")
+        self.assertEqual(patch.partial_list, [5, 7])
+
+        partial_names = [x.directory.name for x in patch.partial_listings]
+        self.assertEqual(partial_names, ["Partial 5", "Partial 7"])
+
+        sample_indices = [
+            [x.index for x in partial.sample_listings]
+            for partial in patch.partial_listings
+        ]
+        self.assertEqual(sample_indices, [[1, 2], [2, 1]])
+        sample_names = [
+            x.directory.name for x in patch.partial_listings[0].sample_listings
+        ]
+        self.assertEqual(sample_names, ["Sample 1", "Sample 2"])
+
+        empty_patch = listings[1]
+        self.assertEqual(empty_patch.partial_list, [])
+        self.assertEqual(empty_patch.partial_listings, [])
+
+
+class EntryCache_Test(unittest.TestCase):
+
+
+    def test_entries_are_parsed_once_per_image(self):
+        stream = make_listing_image()
+        sample_list = [1, 2, 1, 2, 1]
+        entries = SafeListConstruct(
+            len(sample_list),
+            SampleEntryConstruct(lambda this: sample_list[this._index])
+        ).parse_stream(stream)
+
+        self.assertEqual([x.index for x in entries], sample_list)
+        self.assertEqual(entries[0].directory.name, "Sample 1")
+        self.assertEqual(entries[1].directory.name, "Sample 2")
+        self.assertIs(entries[0], entries[2])
+        self.assertIs(entries[0], entries[4])
+        self.assertIs(entries[1], entries[3])
+        self.assertIsNot(entries[0], entries[1])
+
+        other_entries = SafeListConstruct(
+            1,
+            SampleEntryConstruct(1)
+        ).parse_stream(make_listing_image())
+        self.assertIsNot(other_entries[0], entries[0])
+
+
+if __name__ == "__main__":
+    try:
+        unittest.main()
+    except SystemExit as e:
+        pass
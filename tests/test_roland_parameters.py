@@ -0,0 +1,198 @@
+from construct.core import ConstructError
+import numpy as np
+import unittest
+
+from smpl_extract.roland.s7xx.data_types import PARTIAL_PARAMETER_AREA_OFFSET
+from smpl_extract.roland.s7xx.data_types import PARTIAL_PARAMETER_ENTRY_SIZE
+from smpl_extract.roland.s7xx.data_types import SAMPLE_PARAMETER_AREA_OFFSET
+from smpl_extract.roland.s7xx.data_types import SAMPLE_PARAMETER_ENTRY_SIZE
+from smpl_extract.roland.s7xx.data_types import TOTAL_PARAMETER_AREA_OFFSET
+from smpl_extract.roland.s7xx.data_types import TOTAL_PARAMETER_AREA_SIZE
+from smpl_extract.roland.s7xx.parameter_area import ParameterArea
+from smpl_extract.roland.s7xx.parameter_area import ParameterTable
+from smpl_extract.roland.s7xx.partial_entry import PartialParamEntryStruct
+from smpl_extract.roland.s7xx.partial_entry import PartialParamTable
+from smpl_extract.roland.s7xx.sample_entry import SampleParamEntryStruct
+from smpl_extract.roland.s7xx.sample_entry import SampleParamTable
+
+
+NUM_CHECKED_ENTRIES = 0x100
+
+
+def make_parameter_area(area_offset, entry_size, seed=0):
+    rng = np.random.default_rng(seed)
+    data = bytearray(
+        rng.integers(0, 0x100, TOTAL_PARAMETER_AREA_SIZE, dtype=np.uint8)
+    )
+    for index in range(NUM_CHECKED_ENTRIES):
+        address = area_offset - TOTAL_PARAMETER_AREA_OFFSET + entry_size*index
+        if index % 7 != 0:
+            name = rng.integers(0x20, 0x7f, 16, dtype=np.uint8)
+            data[address:address + 16] = bytes(name)
+        if index % 5 == 0:
+            data[address + 10:address + 16] = bytes(6)
+    return bytes(data)
+
+
+def parse_reference(parser, data, area_offset, entry_size, index):
+    address = area_offset - TOTAL_PARAMETER_AREA_OFFSET + entry_size*index
+    try:
+        result = parser.parse(
+            data[address:address + entry_size],
+            _index=index
+        )
+    except (ConstructError, UnicodeDecodeError):
+        result = None
+    return result
+
+
+class SampleParamTable_Test(unittest.TestCase):
+
+
+    def test_entries_match_parser(self):
+        data = make_parameter_area(
+            SAMPLE_PARAMETER_AREA_OFFSET, 
+            SAMPLE_PARAMETER_ENTRY_SIZE
+        )
+        table = ParameterArea(data).get_table(SampleParamTable)
+        num_valid = 0
+        for index in range(NUM_CHECKED_ENTRIES):
+            reference = parse_reference(
+                SampleParamEntryStruct,
+                data,
+                SAMPLE_PARAMETER_AREA_OFFSET,
+                SAMPLE_PARAMETER_ENTRY_SIZE,
+                index
+            )
+            if reference is None:
+                with self.assertRaises(ConstructError):
+                    table.get_entry(index)
+                continue
+
+            num_valid += 1
+            entry = table.get_entry(index)
+            self.assertEqual(entry.name, reference.name)
+            self.assertEqual(entry.index, index)
+            for key in (
+                "start_sample",
+                "sustain_loop_start",
+                "sustain_loop_end",
+                "release_loop_start",
+                "release_loop_end"
+            ):
+                self.assertEqual(
+                    getattr(entry, key).address, 
+                    reference[key].address
+                )
+                self.assertEqual(
+                    getattr(entry, key).fine, 
+                    reference[key].fine
+                )
+            for key in (
+                "loop_mode",
+                "sustain_loop_enable",
+                "sustain_loop_tune",
+                "release_loop_tune",
+                "cluster_top",
+                "num_clusters",
+                "original_key"
+            ):
+                self.assertEqual(getattr(entry, key), reference[key])
+            self.assertEqual(
+                entry.sample_options.sample_mode, 
+                reference.sample_options.sample_mode
+            )
+            self.assertEqual(
+                entry.sample_options.sampling_frequency, 
+                reference.sample_options.sampling_frequency
+            )
+        self.assertGreater(num_valid, 0)
+
+
+    def test_table_is_cached(self):
+        parameter_area = ParameterArea(bytes(TOTAL_PARAMETER_AREA_SIZE))
+        table = parameter_area.get_table(SampleParamTable)
+        self.assertIs(parameter_area.get_table(SampleParamTable), table)
+
+
+    def test_out_of_range(self):
+        parameter_area = ParameterArea(bytes(TOTAL_PARAMETER_AREA_SIZE))
+        table = parameter_area.get_table(SampleParamTable)
+        with self.assertRaises(ConstructError):
+            table.get_entry(-1)
+        with self.assertRaises(ConstructError):
+            table.get_entry(table.num_entries)
+
+
+    def test_table_requires_decoder(self):
+
+        class IncompleteTable(ParameterTable):
+            area_offset = SampleParamTable.area_offset
+            entry_dtype = SampleParamTable.entry_dtype
+            num_entries = SampleParamTable.num_entries
+
+        parameter_area = ParameterArea(bytes(TOTAL_PARAMETER_AREA_SIZE))
+        with self.assertRaises(TypeError):
+            parameter_area.get_table(IncompleteTable)
+
+
+class PartialParamTable_Test(unittest.TestCase):
+
+
+    def test_entries_match_parser(self):
+        data = make_parameter_area(
+            PARTIAL_PARAMETER_AREA_OFFSET, 
+            PARTIAL_PARAMETER_ENTRY_SIZE
+        )
+        table = ParameterArea(data).get_table(PartialParamTable)
+        num_valid = 0
+        for index in range(NUM_CHECKED_ENTRIES):
+            reference = parse_reference(
+                PartialParamEntryStruct,
+                data,
+                PARTIAL_PARAMETER_AREA_OFFSET,
+                PARTIAL_PARAMETER_ENTRY_SIZE,
+                index
+            )
+            if reference is None:
+                with self.assertRaises(ConstructError):
+                    table.get_entry(index)
+                continue
+
+            num_valid += 1
+            entry = table.get_entry(index)
+            self.assertEqual(entry.name, reference.name)
+            self.assertEqual(entry.index, index)
+            for key in (
+                "output_assign_8",
+                "stereo_mix_level",
+                "partial_level",
+                "output_assign_6",
+                "pan",
+                "course_tune",
+                "fine_tune",
+                "breath_cntrl"
+            ):
+                self.assertEqual(getattr(entry, key), reference[key])
+            for key in (
+                "sample_1",
+                "sample_2",
+                "sample_3",
+                "sample_4",
+                "tvf",
+                "tva",
+                "lfo_generator"
+            ):
+                section = getattr(entry, key)
+                for field_name, value in reference[key].items():
+                    if field_name.startswith("_"):
+                        continue
+                    self.assertEqual(getattr(section, field_name), value)
+        self.assertGreater(num_valid, 0)
+
+
+if __name__ == "__main__":
+    try:
+        unittest.main()
+    except SystemExit as e:
+        pass
@@ -0,0 +1,122 @@
+from construct.core import Bytes
+import numpy as np
+import unittest
+
+from smpl_extract.akai.data_types import AKAI_SAT_ENTRY_CNT
+from smpl_extract.akai.data_types import AKAI_SAT_EOF_FLAG
+from smpl_extract.akai.data_types import AKAI_SAT_FREE_FLAG
+from smpl_extract.akai.data_types import AKAI_SAT_RESERVED_FLAG_STD
+from smpl_extract.akai.data_types import AKAI_SAT_RESERVED_FLAG_V2
+from smpl_extract.akai.sat import decode_sat_links
+from smpl_extract.akai.sat import SAT_ENTRY_DTYPE
+from smpl_extract.akai.sat import SegmentAllocationTableAdapter
+from smpl_extract.util.fat import add_to_sector_links
+from smpl_extract.util.fat import make_sector_links
+
+
+def decode_sat_links_reference(block):
+    size = len(block)
+    sector_links = make_sector_links(size)
+    dirty_flags = [False] * size
+    previous_sector_was_directory = True
+    for i in range(size):
+        if dirty_flags[i]:
+            continue
+        links = []
+        subpath_index = i
+        while True:
+            if subpath_index >= size:
+                break
+            value_current = block[subpath_index]
+            current_sector_is_directory = value_current in (
+                AKAI_SAT_RESERVED_FLAG_STD, 
+                AKAI_SAT_RESERVED_FLAG_V2
+            )
+            if not current_sector_is_directory and \
+                    previous_sector_was_directory and len(links) > 0:
+                add_to_sector_links(links, sector_links)
+                previous_sector_was_directory = False
+                break
+            elif value_current == AKAI_SAT_FREE_FLAG or \
+                    (value_current < size and dirty_flags[value_current]):
+                dirty_flags[subpath_index] = True
+                previous_sector_was_directory = False
+                break 
+            elif value_current == AKAI_SAT_EOF_FLAG:
+                links.append(subpath_index)
+                add_to_sector_links(links, sector_links)
+                dirty_flags[subpath_index] = True
+                previous_sector_was_directory = current_sector_is_directory
+                break
+            dirty_flags[subpath_index] = True
+            links.append(subpath_index)
+            if not current_sector_is_directory:
+                subpath_index = value_current
+            else:
+                subpath_index += 1
+            previous_sector_was_directory = current_sector_is_directory
+    return sector_links
+
+
+def generate_sat(seed: int, contiguous: float):
+    rng = np.random.default_rng(seed)
+    size = AKAI_SAT_ENTRY_CNT
+    block = np.full(size, AKAI_SAT_FREE_FLAG, dtype=SAT_ENTRY_DTYPE)
+    block[0:0x20] = AKAI_SAT_RESERVED_FLAG_STD
+    index = 0x20
+    while index < size - 0x100:
+        kind = rng.integers(0, 10)
+        length = int(rng.integers(1, 0x80))
+        if kind == 0:
+            block[index:index + length] = rng.choice(
+                (AKAI_SAT_RESERVED_FLAG_STD, AKAI_SAT_RESERVED_FLAG_V2)
+            )
+        elif kind == 1:
+            pass  # free
+        else:
+            chain = np.arange(index, index + length)
+            if rng.random() > contiguous:
+                chain = rng.permutation(chain)
+            block[chain[:-1]] = chain[1:]
+            block[chain[-1]] = AKAI_SAT_EOF_FLAG
+        index += length
+
+    # sprinkle damage: stray pointers, self loops, out of range values
+    damaged = rng.choice(size, 0x40, replace=False)
+    block[damaged[:0x20]] = rng.integers(1, size, 0x20)
+    block[damaged[0x20:0x30]] = damaged[0x20:0x30]
+    block[damaged[0x30:]] = rng.integers(size, 0x4000, 0x10)
+    return block
+
+
+class SegmentAllocationTable_Test(unittest.TestCase):
+
+
+    def test_matches_reference(self):
+        for seed in range(8):
+            for contiguous in (1.0, 0.5, 0.0):
+                block = generate_sat(seed, contiguous)
+                result = decode_sat_links(block)
+                expected = decode_sat_links_reference(block.tolist())
+                np.testing.assert_array_equal(result, expected)
+
+
+    def test_adapter_reads_bytes(self):
+        block = generate_sat(0, 1.0)
+        adapter = SegmentAllocationTableAdapter(
+            None, 
+            Bytes(AKAI_SAT_ENTRY_CNT * SAT_ENTRY_DTYPE.itemsize)
+        )
+        sat = adapter.parse(block.tobytes())
+        self.assertEqual(sat.size, AKAI_SAT_ENTRY_CNT)
+        np.testing.assert_array_equal(
+            sat.sector_links, 
+            decode_sat_links_reference(block.tolist())
+        )
+
+
+if __name__ == "__main__":
+    try:
+        unittest.main()
+    except SystemExit as e:
+        pass
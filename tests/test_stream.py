@@ -0,0 +1,207 @@
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from io import SEEK_END
+from io import SEEK_SET
+import numpy as np
+import os
+import tempfile
+import threading
+import unittest
+
+from smpl_extract.util.sector import SectorStream
+from smpl_extract.util.sector import SpanStream
+from smpl_extract.util.stream import MappedStream
+from smpl_extract.util.stream import StreamOffset
+
+
+def generate_consecutive_bytes(size: int, offset: int = 0):
+    result = bytes((offset + i) % 0x100 for i in range(size))
+    return result
+
+
+class SectorStream_Test(unittest.TestCase):
+
+
+    def test_readinto_spanning_sectors(self):
+        data = generate_consecutive_bytes(0x40)
+        sector_stream = SectorStream(BytesIO(data), len(data), 0x10)
+        buffer = bytearray(0x30)
+        sector_stream.seek(0x8, SEEK_SET)
+        result = sector_stream.readinto(buffer)
+        self.assertEqual(result, 0x30)
+        self.assertEqual(bytes(buffer), data[0x8:0x38])
+
+
+    def test_readall(self):
+        data = generate_consecutive_bytes(0x4000)
+        sector_stream = SectorStream(
+            BytesIO(data), 
+            len(data), 
+            0x10, 
+            buffer_length=0x100
+        )
+        self.assertEqual(sector_stream.read(-1), data)
+
+
+    def test_span_stream_requires_spans(self):
+
+        class IncompleteStream(SpanStream):
+            pass
+
+        with self.assertRaises(TypeError):
+            IncompleteStream(BytesIO(b""), 0)
+
+
+class MappedStream_Test(unittest.TestCase):
+
+
+    def setUp(self):
+        self.data = generate_consecutive_bytes(0x3000)
+        handle, self.file_path = tempfile.mkstemp()
+        with os.fdopen(handle, "wb") as file:
+            file.write(self.data)
+        self.file = open(self.file_path, "rb")
+        self.stream = MappedStream(self.file)
+
+
+    def tearDown(self):
+        self.stream.close()
+        self.file.close()
+        os.remove(self.file_path)
+
+
+    def test_read(self):
+        self.stream.seek(0x10, SEEK_SET)
+        result = self.stream.read(0x20)
+        self.assertIsInstance(result, bytes)
+        self.assertEqual(result, self.data[0x10:0x30])
+        self.assertEqual(self.stream.tell(), 0x30)
+
+
+    def test_read_view(self):
+        self.stream.seek(0x2ff0, SEEK_SET)
+        result = self.stream.read_view(0x20)
+        self.assertIsInstance(result, memoryview)
+        self.assertEqual(result.tobytes(), self.data[0x2ff0:])
+        self.assertEqual(len(self.stream.read_view(0x20)), 0)
+        del result
+
+
+    def test_readall(self):
+        self.stream.seek(0x100, SEEK_SET)
+        result = self.stream.read(-1)
+        self.assertEqual(result, self.data[0x100:])
+
+
+    def test_offset_view(self):
+        stream_offset = StreamOffset(self.stream, 0x100, 0x1000)
+        stream_offset.seek(0x80, SEEK_SET)
+        result = stream_offset.read_view(0x100)
+        self.assertEqual(result.tobytes(), self.data[0x1080:0x1100])
+        del result
+
+
+    def test_sector_stream(self):
+        sector_stream = SectorStream(self.stream, len(self.data), 0x800)
+        sector_stream.seek(0x7f0, SEEK_SET)
+        result = sector_stream.read(0x1020)
+        self.assertEqual(result, self.data[0x7f0:0x1810])
+
+        sector_stream.seek(0x10, SEEK_SET)
+        result_view = sector_stream.read_view(0x10)
+        self.assertEqual(result_view.tobytes(), self.data[0x10:0x20])
+        del result_view
+
+        sector_stream.seek(0, SEEK_END)
+        self.assertEqual(sector_stream.read(0x10), b"")
+
+
+    def test_readinto(self):
+        buffer = bytearray(0x20)
+        self.stream.seek(0x2ff0, SEEK_SET)
+        result = self.stream.readinto(buffer)
+        self.assertEqual(result, 0x10)
+        self.assertEqual(buffer[:result], self.data[0x2ff0:])
+
+
+    def test_sector_stream_readinto(self):
+        sector_stream = SectorStream(self.stream, len(self.data), 0x800)
+        buffer = np.zeros(0x810, dtype=np.int16)
+        sector_stream.seek(0x7f0, SEEK_SET)
+        result = sector_stream.readinto(buffer)
+        self.assertEqual(result, 0x1020)
+        self.assertEqual(buffer.tobytes(), self.data[0x7f0:0x1810])
+        self.assertEqual(sector_stream.tell(), 0x1810)
+
+
+class PositionalRead_Test(unittest.TestCase):
+
+
+    def setUp(self):
+        self.data = generate_consecutive_bytes(0x10000)
+        handle, self.file_path = tempfile.mkstemp()
+        with os.fdopen(handle, "wb") as file:
+            file.write(self.data)
+        self.file = open(self.file_path, "rb")
+
+
+    def tearDown(self):
+        self.file.close()
+        os.remove(self.file_path)
+
+
+    def test_root_cursor_untouched(self):
+        self.file.seek(0x123, SEEK_SET)
+        stream = SectorStream(
+            StreamOffset(self.file, 0x8000, 0x4000), 
+            0x8000, 
+            0x200
+        )
+        stream.seek(0x300, SEEK_SET)
+        self.assertEqual(stream.read(0x500), self.data[0x4300:0x4800])
+        self.assertEqual(self.file.tell(), 0x123)
+
+
+    def test_interleaved_readers(self):
+        first = StreamOffset(self.file, 0x8000, 0x0)
+        second = StreamOffset(self.file, 0x8000, 0x8000)
+        first_reads = []
+        second_reads = []
+        for _ in range(0x10):
+            first_reads.append(first.read(0x800))
+            second_reads.append(second.read(0x800))
+        self.assertEqual(b"".join(first_reads), self.data[:0x8000])
+        self.assertEqual(b"".join(second_reads), self.data[0x8000:])
+
+
+    def test_concurrent_readers(self):
+        barrier = threading.Barrier(4)
+
+        def read_stream(offset: int):
+            stream = SectorStream(
+                StreamOffset(self.file, 0x4000, offset), 
+                0x4000, 
+                0x100
+            )
+            barrier.wait()
+            reads = []
+            while True:
+                data = stream.read(0x180)
+                if len(data) < 1:
+                    break
+                reads.append(data)
+            result = b"".join(reads)
+            return result
+
+        offsets = [0x0, 0x4000, 0x8000, 0xC000]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(read_stream, offsets))
+        for offset, result in zip(offsets, results):
+            self.assertEqual(result, self.data[offset:offset + 0x4000])
+
+
+if __name__ == "__main__":
+    try:
+        unittest.main()
+    except SystemExit as e:
+        pass
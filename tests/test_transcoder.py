@@ -1,6 +1,10 @@
 from io import BytesIO
+from io import SEEK_SET
+import os
+import tempfile
 from typing import Iterable
 from typing import Union
+import numpy as np
 import unittest
 from unittest.mock import patch
 
@@ -8,9 +12,16 @@ from smpl_extract.data_streams import DataStream
 from smpl_extract.data_streams import Endianess
 from smpl_extract.data_streams import StreamEncoding
 from smpl_extract.transcoder import decode_frame
+from smpl_extract.transcoder import encode_frame
+from smpl_extract.transcoder import encode_frame_into
+from smpl_extract.transcoder import make_buffers
+from smpl_extract.transcoder import make_output_buffer
 from smpl_extract.transcoder import make_transcoder
 from smpl_extract.transcoder import PipelineTranscoder
 from smpl_extract.transcoder import PassthroughTranscoder
+from smpl_extract.util.cache import CachedStream
+from smpl_extract.util.extent import ExtentStream
+from smpl_extract.util.stream import StreamReversed
 
 
 class TranscoderTest(unittest.TestCase):
@@ -217,6 +228,21 @@ class TranscoderTest(unittest.TestCase):
         self.assertTrue(all(x == 2 for x in list(result[2])))
 
 
+    def test_decode_into_reused_buffers(self):
+        byte_buffer = b"".join(int.to_bytes(x, 2, "little") for x in range(8))
+        stream = DataStream(
+            BytesIO(byte_buffer),
+            StreamEncoding(sample_width=2)
+        )
+        buffers = make_buffers([0x8])
+        result_1 = decode_frame([stream], [0x8], buffers=buffers)
+        self.assertEqual(list(result_1[0]), [0, 1, 2, 3])
+        result_2 = decode_frame([stream], [0x8], buffers=buffers)
+        self.assertEqual(list(result_2[0]), [4, 5, 6, 7])
+        result_3 = decode_frame([stream], [0x8], buffers=buffers)
+        self.assertEqual(len(result_3[0]), 0)
+
+
     # Bad args for make_transcoder
     def test_no_datastream_raises_error(self):
         from smpl_extract.data_streams import NoDataStream  # type: ignore
@@ -509,6 +535,153 @@ class TranscoderTest(unittest.TestCase):
         self.assertTrue(result)
 
 
+class EncodeFrame_Test(unittest.TestCase):
+
+
+    def _compare_with_encode_frame(self, channels, dest_dtype):
+        expected = encode_frame(channels, dest_dtype)
+        output = make_output_buffer(0x100, len(channels), dest_dtype)
+        result = encode_frame_into(channels, output)
+        self.assertEqual(bytes(result), expected)
+
+
+    def test_stereo(self):
+        channels = [
+            np.arange(0x80, dtype=np.int16),
+            -np.arange(0x80, dtype=np.int16)
+        ]
+        self._compare_with_encode_frame(channels, np.dtype("int16"))
+
+
+    def test_unequal_lengths_are_padded(self):
+        channels = [
+            np.arange(0x80, dtype=np.int16) + 0x100,
+            np.arange(0x20, dtype=np.int16) + 0x200,
+            np.arange(0x7F, dtype=np.int16)
+        ]
+        self._compare_with_encode_frame(channels, np.dtype("int16"))
+
+
+    def test_conversion(self):
+        channels = [
+            np.arange(-0x40, 0x40, dtype=np.int8),
+            np.arange(0x40, -0x40, -1, dtype=np.int8)
+        ]
+        self._compare_with_encode_frame(channels, np.dtype("int16"))
+        self._compare_with_encode_frame(channels, np.dtype("uint8"))
+
+
+    def _make_pipeline(self):
+        streams = list(
+            DataStream(
+                BytesIO(bytes(range(0x100))*0x40 + bytes(i + 1)), 
+                StreamEncoding()
+            )
+            for i in range(2)
+        )
+        result = make_transcoder(
+            streams, 
+            StreamEncoding(num_interleaved_channels=2)
+        )
+        return result
+
+
+    def test_pipeline_blocks_match_encode_frame(self):
+        blocks = list(self._make_pipeline())
+        self.assertGreater(len(blocks), 1)
+        self.assertTrue(all(isinstance(x, bytes) for x in blocks))
+
+        channels = [
+            np.frombuffer(bytes(range(0x100))*0x40 + bytes(i + 1), np.uint8)
+            for i in range(2)
+        ]
+        expected = encode_frame(channels, np.dtype("uint8"))
+        self.assertEqual(b"".join(blocks), expected)
+
+
+    def test_pipeline_write_to(self):
+        expected = b"".join(self._make_pipeline())
+        export_stream = BytesIO()
+        result = self._make_pipeline().write_to(export_stream)
+        self.assertEqual(result, len(expected))
+        self.assertEqual(export_stream.getvalue(), expected)
+
+
+class PassthroughCopy_Test(unittest.TestCase):
+
+
+    def setUp(self):
+        self.data = bytes(i % 0xFB for i in range(0x3001))
+        handle, self.file_path = tempfile.mkstemp()
+        with os.fdopen(handle, "wb") as file:
+            file.write(self.data)
+        self.file = open(self.file_path, "rb")
+        self.export_file = tempfile.TemporaryFile()
+
+
+    def tearDown(self):
+        self.export_file.close()
+        self.file.close()
+        os.remove(self.file_path)
+
+
+    def _copy(self, stream, sample_width=2):
+        transcoder = PassthroughTranscoder(DataStream(
+            stream,
+            StreamEncoding(sample_width=sample_width)
+        ))
+        self.export_file.write(b"head")
+        result = transcoder.copy_to(self.export_file)
+        if result is not None:
+            self.assertEqual(self.export_file.tell(), 4 + result)
+            self.export_file.seek(4, SEEK_SET)
+            self.assertEqual(self.export_file.read(), self.data_copied(stream))
+        return result
+
+
+    def data_copied(self, stream):
+        stream.seek(0, SEEK_SET)
+        result = b"".join(PassthroughTranscoder(DataStream(
+            stream,
+            StreamEncoding(sample_width=2)
+        )))
+        return result
+
+
+    def test_copy_extents(self):
+        extents = [(0x1000, 0x800), (0x100, 0x401), (0x2000, 0x10)]
+        stream = ExtentStream(CachedStream(self.file), extents)
+        result = self._copy(stream)
+        self.assertEqual(result, 0xC10)
+
+
+    def test_truncated_file_is_not_copied(self):
+        stream = ExtentStream(self.file, [(0x2F00, 0x1000)])
+        self.assertIsNone(self._copy(stream))
+
+
+    def test_copy_without_kernel_support(self):
+        stream = ExtentStream(self.file, [(0x10, 0x2000)])
+        with patch("os.copy_file_range", side_effect=OSError, create=True):
+            with patch("os.sendfile", side_effect=OSError, create=True):
+                result = self._copy(stream)
+        self.assertEqual(result, 0x2000)
+
+
+    def test_reversed_stream_is_not_copied(self):
+        stream = StreamReversed(
+            ExtentStream(self.file, [(0x0, 0x1000)]), 
+            0x1000, 
+            sample_width=2
+        )
+        self.assertIsNone(self._copy(stream))
+
+
+    def test_memory_stream_is_not_copied(self):
+        stream = ExtentStream(BytesIO(self.data), [(0x0, 0x1000)])
+        self.assertIsNone(self._copy(stream))
+
+
 if __name__ == "__main__":
     try:
         unittest.main()
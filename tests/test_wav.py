@@ -1,8 +1,59 @@
+from io import BytesIO
+from io import RawIOBase
+import os
+import tempfile
+import tracemalloc
 import unittest
+from unittest.mock import patch
 
+from smpl_extract.data_streams import DataStream
+from smpl_extract.data_streams import StreamEncoding
+from construct.core import Int32ul
 from smpl_extract.formats.wav import WavDataChunkStruct
+from smpl_extract.formats.wav import WavDs64ChunkStruct
 from smpl_extract.formats.wav import WavFormatChunkContainer 
 from smpl_extract.formats.wav import WavFormatChunkStruct
+from smpl_extract.formats.wav import WavRiffChunkStruct
+from smpl_extract.generalized.sample import LoopRegion
+from smpl_extract.generalized.sample import LoopType
+from smpl_extract.generalized.sample import Sample
+from smpl_extract.generalized.wav import export_wav
+from smpl_extract.generalized.wav import get_dest_encoding
+from smpl_extract.generalized.wav import get_header_chunks
+from smpl_extract.generalized.wav import pack_header_chunks
+from smpl_extract.generalized.wav import WavSampleBuilder
+from smpl_extract.generalized.wav import WavSizeOverflow
+from smpl_extract.generalized.wav import write_wav
+from smpl_extract.midi import MidiNote
+
+
+class ZeroStream(RawIOBase):
+
+
+    def __init__(self, size):
+        self.remaining = size
+
+
+    def readable(self):
+        return True
+
+
+    def readinto(self, buffer):
+        size = min(len(buffer), self.remaining)
+        buffer[:size] = bytes(size)
+        self.remaining -= size
+        return size
+
+
+def make_sample(streams, sample_width=2, **kwargs):
+    encoding = StreamEncoding(sample_width=sample_width)
+    result = Sample(
+        sample_rate=44100,
+        num_channels=len(streams),
+        data_streams=[DataStream(x, encoding) for x in streams],
+        **kwargs
+    )
+    return result
 
 
 class WaveTest(unittest.TestCase):
@@ -50,6 +101,260 @@ class WaveTest(unittest.TestCase):
         return self.assertEqual(result.block_align, 2*2)
 
 
+class WavWriter_Test(unittest.TestCase):
+
+
+    def _compare_with_builder(self, f_make_sample):
+        expected = WavSampleBuilder.build(f_make_sample())
+        export_stream = BytesIO()
+        write_wav(f_make_sample(), export_stream)
+        self.assertEqual(export_stream.getvalue(), expected)
+
+
+    def test_matches_builder(self):
+        data = bytes(range(0x100)) * 0x41 + b"\x01"
+        self._compare_with_builder(lambda: make_sample([BytesIO(data)]))
+        self._compare_with_builder(lambda: make_sample(
+            [BytesIO(data[:0x800]), BytesIO(data[0x800:0x1000])],
+            midi_note=MidiNote.from_string("A3"),
+            pitch_offset_cents=12,
+            loop_regions=[LoopRegion(start_sample=4, end_sample=100)]
+        ))
+        self._compare_with_builder(lambda: make_sample(
+            [BytesIO(data[:0x1001])],
+            sample_width=1
+        ))
+
+
+    def test_empty_data(self):
+        self._compare_with_builder(lambda: make_sample([BytesIO(b"")]))
+
+
+    def test_smpl_chunk_matches_builder(self):
+        data = bytes(range(0x100)) * 0x20
+        self._compare_with_builder(lambda: make_sample(
+            [BytesIO(data)],
+            pitch_offset_semi=-3,
+            pitch_offset_cents=-41
+        ))
+        self._compare_with_builder(lambda: make_sample(
+            [BytesIO(data), BytesIO(data[::-1])],
+            midi_note=MidiNote.from_string("C2"),
+            loop_regions=[
+                LoopRegion(
+                    start_sample=0x20, 
+                    end_sample=0x120,
+                    loop_type=LoopType.ALTERNATING,
+                    play_cnt=7
+                ),
+                LoopRegion(
+                    start_sample=0x40, 
+                    end_sample=0x800,
+                    loop_type=LoopType.REVERSE,
+                    repeat_forever=False,
+                    duration=3.0
+                )
+            ]
+        ))
+
+
+    def test_export_file_matches_builder(self):
+        data = bytes(i % 0xFB for i in range(0x3001))
+        with tempfile.TemporaryDirectory() as directory:
+            source_path = os.path.join(directory, "source.raw")
+            export_path = os.path.join(directory, "export.wav")
+            with open(source_path, "wb") as source_file:
+                source_file.write(data)
+
+            for sample_width in (1, 2):
+                with open(source_path, "rb") as source_file:
+                    expected = WavSampleBuilder.build(make_sample(
+                        [source_file], 
+                        sample_width=sample_width,
+                        midi_note=MidiNote.from_string("E4")
+                    ))
+                with open(source_path, "rb") as source_file:
+                    export_wav(
+                        make_sample(
+                            [source_file], 
+                            sample_width=sample_width,
+                            midi_note=MidiNote.from_string("E4")
+                        ), 
+                        export_path
+                    )
+                with open(export_path, "rb") as export_file:
+                    self.assertEqual(export_file.read(), expected)
+
+
+    def test_memory_is_bounded(self):
+        data_size = 0x4000000
+        sample = make_sample(
+            [ZeroStream(data_size)], 
+            num_audio_samples=data_size // 2
+        )
+        with tempfile.TemporaryFile() as export_stream:
+            tracemalloc.start()
+            try:
+                write_wav(sample, export_stream)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            export_size = export_stream.tell()
+
+        self.assertEqual(export_size, data_size + 0x2c)
+        self.assertLess(peak, data_size // 16)
+
+
+class WavHeaderLayout_Test(unittest.TestCase):
+
+
+    def _compare_with_construct(self, sample):
+        dest_encoding = get_dest_encoding(sample)
+        expected = b"".join(
+            WavRiffChunkStruct.build(x)
+            for x in get_header_chunks(sample, dest_encoding)
+        )
+        result = pack_header_chunks(sample, dest_encoding)
+        self.assertEqual(result, expected)
+
+
+    def test_fmt_only(self):
+        for sample_width in (1, 2, 3):
+            for num_streams in (1, 2):
+                sample = make_sample(
+                    [BytesIO(b"")]*num_streams, 
+                    sample_width=sample_width
+                )
+                sample.sample_rate = 32000
+                self._compare_with_construct(sample)
+
+
+    def test_smpl_chunk(self):
+        self._compare_with_construct(make_sample(
+            [BytesIO(b"")],
+            midi_note=MidiNote.from_string("G#5")
+        ))
+        self._compare_with_construct(make_sample(
+            [BytesIO(b"")],
+            pitch_offset_semi=-3,
+            pitch_offset_cents=-41
+        ))
+        self._compare_with_construct(make_sample(
+            [BytesIO(b""), BytesIO(b"")],
+            midi_note=MidiNote.from_string("C2"),
+            loop_regions=[
+                LoopRegion(start_sample=0, end_sample=0x1000),
+                LoopRegion(
+                    start_sample=0x20, 
+                    end_sample=0x120,
+                    loop_type=LoopType.ALTERNATING,
+                    play_cnt=7
+                ),
+                LoopRegion(
+                    start_sample=0x40, 
+                    end_sample=0x8040,
+                    loop_type=LoopType.REVERSE,
+                    repeat_forever=False,
+                    duration=3.0
+                )
+            ]
+        ))
+
+
+class WavRf64_Test(unittest.TestCase):
+
+
+    def _parse_rf64(self, export_data):
+        self.assertEqual(export_data[:4], b"RF64")
+        self.assertEqual(Int32ul.parse(export_data[4:8]), 0xFFFFFFFF)
+        self.assertEqual(export_data[8:16], b"WAVE" + b"ds64")
+        ds64 = WavDs64ChunkStruct.parse(export_data[20:])
+        self.assertEqual(ds64.riff_size, len(export_data) - 8)
+        data_offset = export_data.index(b"data")
+        self.assertEqual(
+            Int32ul.parse(export_data[data_offset + 4:]), 
+            0xFFFFFFFF
+        )
+        self.assertEqual(ds64.data_size, len(export_data) - data_offset - 8)
+        return ds64
+
+
+    def test_unknown_size_reserves_junk(self):
+        sample = make_sample([ZeroStream(0x1000)])
+        export_stream = BytesIO()
+        write_wav(sample, export_stream)
+
+        export_data = export_stream.getvalue()
+        self.assertEqual(export_data[:4], b"RIFF")
+        self.assertEqual(Int32ul.parse(export_data[4:8]), 0x1000 + 0x48)
+        self.assertEqual(export_data[12:16], b"JUNK")
+        self.assertEqual(Int32ul.parse(export_data[16:20]), 28)
+        self.assertEqual(export_data[48:52], b"fmt ")
+        self.assertEqual(export_data[72:76], b"data")
+        self.assertEqual(Int32ul.parse(export_data[76:80]), 0x1000)
+
+
+    def test_known_size_has_no_junk(self):
+        sample = make_sample(
+            [ZeroStream(0x1000)], 
+            num_audio_samples=0x800
+        )
+        export_stream = BytesIO()
+        write_wav(sample, export_stream)
+
+        export_data = export_stream.getvalue()
+        self.assertEqual(export_data[:4], b"RIFF")
+        self.assertEqual(export_data[12:16], b"fmt ")
+        self.assertEqual(len(export_data), 0x1000 + 0x2c)
+
+
+    def test_large_size_switches_to_rf64(self):
+        data = bytes(range(0x100)) * 0x10
+        sample = make_sample([BytesIO(data)])
+        export_stream = BytesIO()
+        with patch("smpl_extract.generalized.wav.RIFF_SIZE_LIMIT", 0x800):
+            write_wav(sample, export_stream)
+
+        export_data = export_stream.getvalue()
+        ds64 = self._parse_rf64(export_data)
+        self.assertEqual(ds64.data_size, len(data))
+        self.assertEqual(ds64.sample_cnt, len(data) // 2)
+        self.assertTrue(export_data.endswith(data))
+
+
+    def test_num_audio_samples_switches_to_rf64(self):
+        sample = make_sample(
+            [ZeroStream(0x1000)], 
+            num_audio_samples=0x800
+        )
+        export_stream = BytesIO()
+        with patch("smpl_extract.generalized.wav.RIFF_SIZE_LIMIT", 0x800):
+            write_wav(sample, export_stream)
+
+        ds64 = self._parse_rf64(export_stream.getvalue())
+        self.assertEqual(ds64.data_size, 0x1000)
+
+
+    def test_unknown_size_upgrades_junk_to_ds64(self):
+        sample = make_sample([ZeroStream(0x1000)])
+        export_stream = BytesIO()
+        with patch("smpl_extract.generalized.wav.RIFF_SIZE_LIMIT", 0x800):
+            write_wav(sample, export_stream)
+
+        ds64 = self._parse_rf64(export_stream.getvalue())
+        self.assertEqual(ds64.data_size, 0x1000)
+
+
+    def test_underestimated_size_raises(self):
+        sample = make_sample(
+            [ZeroStream(0x1000)], 
+            num_audio_samples=0x10
+        )
+        with patch("smpl_extract.generalized.wav.RIFF_SIZE_LIMIT", 0x800):
+            with self.assertRaises(WavSizeOverflow):
+                write_wav(sample, BytesIO())
+
+
 if __name__ == "__main__":
     try:
         unittest.main()